@@ -0,0 +1,121 @@
+"""Compara los backends de dibujo de la escena de juego.
+
+Ejecuta la misma partida guionizada (el jugador recorre el mapa, hay
+``--enemies`` enemigos adicionales y lanza ataques pesados periódicos) con cada
+backend en un proceso propio, y mide por frame ``InGameController.render``
+más ``Display.present``:
+
+    python -m benchmarks.render_backends [--frames 600] [--enemies 200] [--renderer auto] [--map-size 256]
+
+Con ``--map-size`` el mapa es de N×N tiles en lugar del de config.yaml; en un
+mapa mayor que el área de juego la cámara se desplaza casi todos los frames y se
+mide también el coste de recomponer el mapa visible.
+
+Sin pantalla se puede usar ``SDL_VIDEODRIVER=dummy``; el backend texture usa
+entonces el renderer por software de SDL.
+"""
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+
+BACKENDS = ("surface", "texture")
+WARMUP_FRAMES = 30  # Frames iniciales descartados (horneado, subida de texturas, primer dibujo completo)
+MOVE_KEYS = ("w", "a", "s", "d")
+
+
+def run_backend(backend: str, frames: int, enemies: int, renderer: str, map_size: int = None) -> dict:
+    """Juega ``frames`` frames con ``backend`` y retorna los tiempos de dibujo en ms."""
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    import pygame
+    from services.config import CONFIG
+    CONFIG['render']['backend'] = backend
+    CONFIG['render']['renderer'] = renderer
+    if map_size:
+        CONFIG['map']['width'] = CONFIG['map']['height'] = map_size
+    pygame.init()
+    pygame.mixer.init()
+
+    from services.display import Display
+    from controllers.ingame_controller import InGameController
+    from models.enemies import Enemy
+
+    screen = Display.create()
+    controller = InGameController(screen)
+    controller.match.countdown_active = False
+    controller.match.player.hp = 10**9  # La partida no debe terminar durante la medición
+    rng = random.Random(1)
+    for _ in range(enemies):
+        controller.match.enemies.append(Enemy(rng.uniform(1, controller.match.map.width - 2),
+                                        rng.uniform(1, controller.match.map.height - 2), 1, controller.match.clock))
+
+    times = []
+    for frame in range(WARMUP_FRAMES + frames):
+        if frame % 30 == 0:
+            for key in MOVE_KEYS:
+                controller.handle_event(pygame.event.Event(pygame.KEYUP, key=pygame.key.key_code(key)))
+            key = pygame.key.key_code(rng.choice(MOVE_KEYS))
+            controller.handle_event(pygame.event.Event(pygame.KEYDOWN, key=key))
+        if frame % 90 == 0:
+            controller.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_l))
+        pygame.event.pump()
+        controller.update(1 / 60)
+
+        start = time.perf_counter()
+        Display.present(controller.render())
+        if frame >= WARMUP_FRAMES:
+            times.append((time.perf_counter() - start) * 1000)
+
+    times.sort()
+    result = {
+        "backend": backend,
+        "frames": frames,
+        "mean_ms": sum(times) / len(times),
+        "p95_ms": times[int(0.95 * (len(times) - 1))],
+        "max_ms": times[-1],
+    }
+    if Display.backend is not None:
+        result.update(Display.backend.stats())
+    pygame.quit()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compara los backends de dibujo")
+    parser.add_argument("--backend", choices=BACKENDS, help="mide sólo este backend e imprime el resultado en JSON")
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--enemies", type=int, default=200)
+    parser.add_argument("--renderer", default="auto", help="renderer del backend texture: auto, software o gpu")
+    parser.add_argument("--map-size", type=int, help="lado del mapa en tiles (por defecto, el de config.yaml)")
+    args = parser.parse_args()
+
+    if args.backend:
+        print(json.dumps(run_backend(args.backend, args.frames, args.enemies, args.renderer, args.map_size)))
+        return
+
+    # Cada backend en su propio proceso: la ventana y el estado de SDL no se comparten
+    map_size = args.map_size or "config.yaml"
+    print(f"{args.frames} frames, {args.enemies} enemigos adicionales, renderer {args.renderer}, mapa {map_size}")
+    print(f"{'backend':<10}{'media ms':>10}{'p95 ms':>10}{'máx ms':>10}")
+    means = {}
+    for backend in BACKENDS:
+        completed = subprocess.run(
+            [sys.executable, "-m", "benchmarks.render_backends", "--backend", backend,
+             "--frames", str(args.frames), "--enemies", str(args.enemies), "--renderer", args.renderer]
+            + (["--map-size", str(args.map_size)] if args.map_size else []),
+            capture_output=True, text=True)
+        if completed.returncode != 0:
+            print(f"{backend:<10}falló: {completed.stderr.strip().splitlines()[-1]}")
+            continue
+        result = json.loads(completed.stdout.strip().splitlines()[-1])
+        means[backend] = result['mean_ms']
+        print(f"{backend:<10}{result['mean_ms']:>10.2f}{result['p95_ms']:>10.2f}{result['max_ms']:>10.2f}")
+    if len(means) == len(BACKENDS):
+        print(f"texture / surface: {means['texture'] / means['surface']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,266 @@
+"""Escenarios de rendimiento para la actualización y el dibujo.
+
+Cada escenario guionizado se ejecuta en un proceso propio con el driver de vídeo
+``dummy`` de SDL y mide por frame, por separado, la fase de actualización
+(``InGameController.update`` o ``AppController.update``) y la de dibujo (``render``
+más ``Display.present``):
+
+    python -m benchmarks.scenarios [--frames 300] [--runs 3] [--only chase_100 ...]
+                                   [--output resultados.json] [--baseline benchmarks/baseline.json]
+                                   [--update-baseline] [--tolerance 0.25]
+
+Cada escenario se ejecuta ``--runs`` veces y de cada métrica se toma la mediana
+de las ejecuciones, tanto al medir como al generar la referencia. Los resultados
+se escriben en JSON y se comparan con el archivo de referencia: un escenario cuya
+media o p95 empeora más que ``--tolerance`` se marca como regresión y el proceso
+termina con código 1. El p95 sólo se compara en fases de al menos
+``TAIL_FLOOR_MS``; por debajo, un solo frame interrumpido por el sistema lo mueve
+más que cualquier cambio de código. La referencia depende de la
+máquina; hay que regenerarla con ``--update-baseline`` al cambiar de equipo.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+
+SCENARIOS = {
+    "idle_arena": "arena sin enemigos, el jugador quieto",
+    "chase_10": "10 enemigos persiguiendo al jugador",
+    "chase_100": "100 enemigos persiguiendo al jugador",
+    "chase_1000": "1000 enemigos persiguiendo al jugador",
+    "heavy_spam": "ataques pesados y básicos continuos con knockback sobre 100 enemigos",
+    "debug_hitbox": "100 enemigos persiguiendo con las hitboxes de depuración visibles",
+    "menu_idle": "menú principal sin entrada, redibujado en cada frame",
+}
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+WARMUP_FRAMES = 30  # Frames iniciales descartados (cachés, primer dibujo completo)
+FRAME_DT = 1 / 60
+MOVE_KEYS = ("w", "a", "s", "d")
+PHASES = ("update", "render")
+COMPARED_METRICS = ("mean_ms", "p95_ms")  # p99 es demasiado ruidoso para fijar una tolerancia
+NOISE_FLOOR_MS = 0.1  # Diferencias menores no se consideran regresiones, sea cual sea su proporción
+TAIL_FLOOR_MS = 1.0  # El p95 de fases más rápidas que esto no se compara
+
+
+def _summary(times: list) -> dict:
+    """Media, p95 y p99 de una lista de tiempos en ms."""
+    times = sorted(times)
+    return {
+        "mean_ms": sum(times) / len(times),
+        "p95_ms": times[int(0.95 * (len(times) - 1))],
+        "p99_ms": times[int(0.99 * (len(times) - 1))],
+    }
+
+
+def _median_result(runs: list) -> dict:
+    """Combina varias ejecuciones de un escenario tomando la mediana de cada métrica."""
+    result = dict(runs[0])
+    for phase in PHASES:
+        result[phase] = {metric: statistics.median(run[phase][metric] for run in runs)
+                         for metric in runs[0][phase]}
+    return result
+
+
+def _add_enemies(match, count: int, rng: random.Random, radius: float = None):
+    """Reemplaza los enemigos de la ronda por ``count`` enemigos de nivel 1 que no mueren."""
+    from models.enemies import Enemy
+
+    match.enemies.clear()
+    player = match.player
+    for _ in range(count):
+        if radius is None:
+            x = rng.uniform(1, match.map.width - 2)
+            y = rng.uniform(1, match.map.height - 2)
+        else:
+            x = min(max(player.x + rng.uniform(-radius, radius), 1), match.map.width - 2)
+            y = min(max(player.y + rng.uniform(-radius, radius), 1), match.map.height - 2)
+        enemy = Enemy(x, y, 1, match.clock)
+        enemy.hp = 10**9  # Los enemigos golpeados reciben knockback pero la ronda no termina
+        match.enemies.append(enemy)
+
+
+def run_scenario(name: str, frames: int) -> dict:
+    """Ejecuta el escenario ``name`` durante ``frames`` frames medidos y retorna sus tiempos."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    import time
+    import pygame
+    from services.config import CONFIG
+    if name == "debug_hitbox":
+        CONFIG['debug']['hitbox'] = True  # Se lee al importar la vista
+    pygame.init()
+    pygame.mixer.init()
+
+    from services.display import Display
+    screen = Display.create()
+    random.seed(1)
+    rng = random.Random(1)
+
+    if name == "menu_idle":
+        from controllers.app_controller import AppController
+        app = AppController(screen)
+        # Terminar la precarga antes de medir: sus hilos decodifican recursos y
+        # compiten por el GIL con el dibujo del menú
+        app.preloader.wait()
+        update = app.update
+        script = None
+
+        def render():
+            # Un menú sin cambios no se vuelve a dibujar y mediría 0 ms: se fuerza el
+            # redibujo que provoca cualquier evento, como mover el ratón
+            app.needs_redraw = True
+            app.render()
+    else:
+        from controllers.ingame_controller import InGameController
+        controller = InGameController(screen)
+        match = controller.match
+        match.countdown_active = False
+        match.player.hp = 10**9  # La partida no debe terminar durante la medición
+        match.player.mp = 10**9
+        match.player.x = match.player.y = match.map.width / 2
+        if name == "idle_arena":
+            _add_enemies(match, 0, rng)
+        elif name.startswith("chase_"):
+            _add_enemies(match, int(name.split("_")[1]), rng)
+        elif name == "heavy_spam":
+            _add_enemies(match, 100, rng, radius=6)
+        elif name == "debug_hitbox":
+            _add_enemies(match, 100, rng)
+        update = controller.update
+
+        def render():
+            Display.present(controller.render())
+
+        def script(frame: int):
+            if name == "idle_arena":
+                return
+            if name == "heavy_spam":
+                # El jugador queda quieto en el centro y ataca en cuanto sale del enfriamiento
+                controller.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_l))
+                controller.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_k))
+                return
+            if frame % 30 == 0:
+                for key in MOVE_KEYS:
+                    controller.handle_event(pygame.event.Event(pygame.KEYUP, key=pygame.key.key_code(key)))
+                key = pygame.key.key_code(rng.choice(MOVE_KEYS))
+                controller.handle_event(pygame.event.Event(pygame.KEYDOWN, key=key))
+
+    update_times = []
+    render_times = []
+    for frame in range(WARMUP_FRAMES + frames):
+        if script is not None:
+            script(frame)
+        pygame.event.pump()
+
+        start = time.perf_counter()
+        update(FRAME_DT)
+        middle = time.perf_counter()
+        render()
+        end = time.perf_counter()
+        if frame >= WARMUP_FRAMES:
+            update_times.append((middle - start) * 1000)
+            render_times.append((end - middle) * 1000)
+
+    result = {"frames": frames, "update": _summary(update_times), "render": _summary(render_times)}
+    if name == "menu_idle":
+        app.shutdown()
+    else:
+        result["enemies"] = len(controller.match.enemies)
+    pygame.quit()
+    return result
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """Retorna las regresiones ``(escenario, fase, métrica, actual, referencia)`` frente a ``baseline``."""
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        for phase in PHASES:
+            for metric in COMPARED_METRICS:
+                current = result[phase][metric]
+                expected = reference[phase][metric]
+                if metric != "mean_ms" and expected < TAIL_FLOOR_MS:
+                    continue
+                if current > expected * (1 + tolerance) and current - expected > NOISE_FLOOR_MS:
+                    regressions.append((name, phase, metric, current, expected))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Escenarios de rendimiento de actualización y dibujo")
+    parser.add_argument("--scenario", choices=SCENARIOS, help="ejecuta sólo este escenario e imprime el resultado en JSON")
+    parser.add_argument("--only", nargs="+", choices=SCENARIOS, help="escenarios a ejecutar (por defecto, todos)")
+    parser.add_argument("--frames", type=int, default=300, help="frames medidos por escenario")
+    parser.add_argument("--runs", type=int, default=3, help="ejecuciones por escenario; se toma la mediana de cada métrica")
+    parser.add_argument("--output", help="archivo JSON donde escribir los resultados")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="archivo JSON de referencia")
+    parser.add_argument("--update-baseline", action="store_true", help="guarda los resultados como nueva referencia")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="empeoramiento relativo admitido (0.25 = 25%%)")
+    args = parser.parse_args()
+
+    if args.scenario:
+        print(json.dumps(run_scenario(args.scenario, args.frames)))
+        return
+
+    # Cada escenario en su propio proceso: la ventana, el estado de SDL y la configuración no se comparten
+    results = {}
+    print(f"{args.frames} frames por escenario, mediana de {args.runs} ejecución(es)")
+    print(f"{'escenario':<14}{'fase':<8}{'media ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for name in args.only or SCENARIOS:
+        runs = []
+        for _ in range(args.runs):
+            completed = subprocess.run(
+                [sys.executable, "-m", "benchmarks.scenarios", "--scenario", name, "--frames", str(args.frames)],
+                capture_output=True, text=True)
+            if completed.returncode != 0:
+                print(f"{name:<14}falló: {completed.stderr.strip().splitlines()[-1]}")
+                break
+            runs.append(json.loads(completed.stdout.strip().splitlines()[-1]))
+        if len(runs) < args.runs:
+            continue
+        result = _median_result(runs)
+        results[name] = result
+        for phase in PHASES:
+            summary = result[phase]
+            print(f"{name:<14}{phase:<8}{summary['mean_ms']:>10.3f}{summary['p95_ms']:>10.3f}{summary['p99_ms']:>10.3f}")
+
+    report = {
+        "frames": args.frames,
+        "runs": args.runs,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "scenarios": results,
+    }
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"Resultados escritos en {args.output}")
+
+    if args.update_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"Referencia actualizada en {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print(f"Advertencia: No existe la referencia '{args.baseline}'; se crea con --update-baseline.")
+        return
+    with open(args.baseline, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)["scenarios"]
+    regressions = compare(results, baseline, args.tolerance)
+    if not regressions:
+        print(f"Sin regresiones frente a {args.baseline} (tolerancia {args.tolerance:.0%})")
+        return
+    for name, phase, metric, current, expected in regressions:
+        print(f"Regresión: {name} {phase} {metric} {current:.3f} ms (referencia {expected:.3f} ms)")
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
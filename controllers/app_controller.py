@@ -8,31 +8,62 @@ from models.credits import CreditsModel
 from views.menu_view import MenuView
 from views.scores_view import ScoresView
 from views.credits_view import CreditsView
+from views.loading_view import LoadingView
+from views.sprites import EnemySprites, PlayerSprites
+from services.config import CONFIG
 from services.records import RecordsService
 from services.audio_manager import AudioManager
+from services.preloader import Preloader
+from services.startup_report import StartupReport
+from services.display import Display
+
+# Recursos que cada escena necesita antes de mostrarse
+AUDIO_ASSETS = ("sound:attack_sound",)
+GAME_ASSETS = ("frames:enemy", "frames:player")
+
+# Escenas estáticas: sólo se redibujan cuando llega un evento
+IDLE_SCENES = ("menu", "scores", "credits")
+IDLE_RENDERING = CONFIG['render']['idle']
+IDLE_TIMEOUT_MS = CONFIG['render']['idle_timeout_ms']
+FADE_POLL_MS = 20  # Espera máxima en reposo mientras hay un fundido de música pendiente
 
 class AppController:
     def __init__(self, screen: pygame.Surface):
         self.screen = screen
         # Crear una única instancia de RecordsService para toda la app
         self.records_service = RecordsService()
-        
+
         # Inicializar el AudioManager
         self.audio_manager = AudioManager()
-        
+
+        # Precargar sonidos y frames en segundo plano
+        self.preloader = Preloader(CONFIG['assets']['preload_workers'])
+        for name in AUDIO_ASSETS:
+            self.preloader.submit(name, self.audio_manager.load_sound, name.split(":", 1)[1])
+        self.preloader.submit("frames:enemy", EnemySprites.frames)
+        self.preloader.submit("frames:player", PlayerSprites.frames)
+        self.preload_reported = False
+
         # Crear componentes del menú
         self.menu_model = MenuModel()
         self.menu_view = MenuView(screen, self.menu_model)
         self.menu_controller = MenuController(self.menu_model)
-        
+
         # Crear componentes de puntajes usando el mismo RecordsService
         self.scores_model = ScoresModel(self.records_service)
         self.scores_view = ScoresView(screen, self.scores_model)
-        
+
         # Crear componentes de créditos
         self.credits_model = CreditsModel()
         self.credits_view = CreditsView(screen, self.credits_model)
-        
+
+        # Escena de carga
+        self.loading_view = LoadingView(screen)
+        self.first_frame_reported = False
+        self.rendered_scene = None  # Escena presentada en el último frame
+        self.rendered_idle = False  # Si el último frame presentado era de una escena en reposo
+        self.needs_redraw = True
+
         # Iniciar con el menú
         self.current_scene = "menu"
         self.ingame_controller = None
@@ -41,13 +72,15 @@ class AppController:
         self.audio_manager.play_menu_music()
 
     def handle_event(self, event: pygame.event.Event):
+        # Cualquier entrada puede cambiar la escena (hover, scroll, clicks)
+        self.needs_redraw = True
         if self.current_scene == "menu":
-            action = self.menu_controller.handle_event(event, self.menu_view.get_button_rects())
+            action = self.menu_controller.handle_event(event, self.menu_view.ui)
             if action == "Jugar":
-                self.current_scene = "game"
-                self.ingame_controller = InGameController(self.screen)
-                self.audio_manager.play_coliseo_music()
+                # Esperar en la escena de carga si los frames aún no están listos
+                self.current_scene = "loading"
             elif action == "Puntajes":
+                self.scores_view.refresh()
                 self.current_scene = "scores"
             elif action == "Créditos":
                 self.current_scene = "credits"
@@ -60,7 +93,7 @@ class AppController:
                 self.audio_manager.play_menu_music()
         elif self.current_scene == "scores":
             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                if self.scores_view.back_button_rect.collidepoint(event.pos):
+                if self.scores_view.ui.hit_test(event.pos) is self.scores_view.back_button:
                     self.current_scene = "menu"
         elif self.current_scene == "credits":
             # Manejar todos los eventos de la vista de créditos
@@ -69,16 +102,71 @@ class AppController:
         return True
 
     def update(self, dt: float):
-        if self.current_scene == "game":
+        if not self.preload_reported and self.preloader.is_ready():
+            self.preload_reported = True
+            StartupReport.mark("precarga completa")
+
+        # Completar los fundidos de música pendientes
+        self.audio_manager.update()
+
+        if self.current_scene == "loading" and self.preloader.is_ready(GAME_ASSETS):
+            self._start_game()
+        elif self.current_scene == "game":
             self.ingame_controller.update(dt)
 
+    def _start_game(self):
+        """Crea la partida una vez cargados sus recursos."""
+        self.current_scene = "game"
+        self.ingame_controller = InGameController(self.screen)
+        self.audio_manager.play_coliseo_music()
+
+    def is_idle(self) -> bool:
+        """True si la escena actual es estática y el bucle principal puede esperar eventos."""
+        if not IDLE_RENDERING:
+            return False
+        if self.current_scene in IDLE_SCENES:
+            return True
+        return self.current_scene == "game" and self.ingame_controller.is_idle()
+
+    def idle_timeout(self) -> int:
+        """Milisegundos que el bucle principal puede bloquearse esperando un evento."""
+        # Arrancar a tiempo la pista pendiente de un fundido
+        return FADE_POLL_MS if self.audio_manager.has_pending_music() else IDLE_TIMEOUT_MS
+
     def render(self):
+        idle = self.is_idle()
+        if idle and self.rendered_idle and not self.needs_redraw and self.rendered_scene == self.current_scene:
+            # Nada cambió desde el último frame presentado
+            return
+        self.needs_redraw = False
+        self.rendered_idle = idle
+
+        dirty_rects = None
         if self.current_scene == "menu":
             self.menu_view.draw()
+        elif self.current_scene == "loading":
+            self.loading_view.draw(self.preloader.progress(GAME_ASSETS))
         elif self.current_scene == "game":
-            self.ingame_controller.render()
+            dirty_rects = self.ingame_controller.render()
         elif self.current_scene == "scores":
             self.scores_view.draw()
         elif self.current_scene == "credits":
             self.credits_view.draw()
-        pygame.display.flip()
+
+        # Al cambiar de escena se presenta siempre la pantalla completa
+        if dirty_rects is None or self.rendered_scene != self.current_scene:
+            Display.present()
+        else:
+            # Con un backend diferido hay que presentar aunque no cambie ningún rectángulo
+            Display.present(dirty_rects)
+        self.rendered_scene = self.current_scene
+
+        if not self.first_frame_reported and self.current_scene != "loading":
+            self.first_frame_reported = True
+            StartupReport.mark("primer frame interactivo")
+
+    def shutdown(self):
+        """Libera los hilos de precarga y cierra la partida en curso."""
+        self.preloader.shutdown()
+        if self.ingame_controller is not None:
+            self.ingame_controller.shutdown()
@@ -1,23 +1,31 @@
 """Controlador de la escena de juego en curso.
 
-Maneja entrada WASD y actualiza los modelos Player, Map y Enemies.
-
+Traduce la entrada de pygame a la partida (models.match), que contiene las
+reglas, y conecta su estado con la vista, el audio y el menú de pausa.
 """
-import pygame
+import os
 import time
-from math import floor, log
-from models.player import AnimatedPlayer
-from models.map_grid import MapGrid
+import pygame
+from models.match import Match
+from models.clock import Clock
+from models.replay import InputLog
 from models.pause_menu import PauseMenuModel
-from models.enemies import Enemy
 from views.ingame_view import InGameView
 from views.pause_menu_view import PauseMenuView
-from services.config import CONFIG
 from services.records import RecordsService
 from services.audio_manager import AudioManager
+from services.config import CONFIG, ROOT_DIR
+
+RECORD_REPLAYS = CONFIG['simulation']['record_replays']
+REPLAY_DIR = os.path.join(ROOT_DIR, 'replays')
 
-TILE_SIZE = CONFIG['map']['tile_size']
-VICTORY_ROUND = 4
+# Teclas de movimiento y la dirección que activan
+MOVEMENT_KEYS = {
+    pygame.K_w: "up", pygame.K_UP: "up",
+    pygame.K_s: "down", pygame.K_DOWN: "down",
+    pygame.K_a: "left", pygame.K_LEFT: "left",
+    pygame.K_d: "right", pygame.K_RIGHT: "right",
+}
 
 class InGameController:
     def __init__(self, screen: pygame.Surface):
@@ -26,124 +34,60 @@ class InGameController:
         self.audio_manager = AudioManager()
         self.pause_menu_model = PauseMenuModel()
         self.pause_menu_view = PauseMenuView(screen, self.pause_menu_model)
+        self.pause_snapshot = None  # Último frame de juego, compuesto bajo el menú de pausa
+        self.match = None
         self._initialize_game()
 
     def _initialize_game(self):
-        """Inicializa el juego y sus componentes principales."""
-        self.map = MapGrid(CONFIG['map']['width'], CONFIG['map']['height'])
-        self.player = AnimatedPlayer(x=1, y=1)
-        self.enemies = []
-        self.view = InGameView(self.screen, self.map, self.player, self.enemies)
-        
-        # Estado del juego
-        self.is_paused = False
-        self.game_time = 0.0
-        self.last_update_time = time.time()
-        self.current_round = 1
-        self.enemies_remaining = 0
-        self.is_dead = False
-        self.has_won = False
-        self.points = 0
-        
-        # Estado del contador inicial
-        self.countdown_active = True
-        self.countdown_time = 3.0  # 3 segundos de cuenta regresiva
-        self.countdown_start_time = time.time()
-        
-        # Estado de generación de enemigos
-        self.enemy_generation_queue = []
-        self.is_generating_enemies = False
-        
-        self._spawn_enemies()
-            
-
-    def _calculate_enemy_count(self, level: int) -> int:
-        """Calcula la cantidad de enemigos para un nivel específico en la ronda actual."""
-        n = max(1, int(2 * log(self.current_round + 1))) # Progresión logarítmica: 1-2-3-4-4-5
-        return floor(n / level)
-
-    def _spawn_enemies(self):
-        """Genera los enemigos para la ronda actual."""
-        self.enemies.clear()
-        
-        # Define los niveles de enemigos disponibles
-        enemy_levels = range(1, 6)  # Niveles del 1 al 5
-        
-        # Genera enemigos de cada nivel
-        for level in enemy_levels:
-            count = self._calculate_enemy_count(level)
-            self._spawn_enemies_of_level(level, count)
-                
-        self.enemies_remaining = len(self.enemies)
-        
-        # Configurar callback de muerte para cada enemigo
-        for enemy in self.enemies:
-            enemy._death_complete_callback = self._on_enemy_death_complete
-
-    def _spawn_enemies_of_level(self, level: int, count: int):
-        """Genera una cantidad específica de enemigos de un nivel dado."""
-        for _ in range(count):
-            x, y = self.map.get_random_floor_position()
-            enemy = Enemy(x, y, level)  # Asumiendo que existe una clase base Enemy
-            self.enemies.append(enemy)
-
-    def _on_enemy_death_complete(self, enemy):
-        """Callback que se ejecuta cuando un enemigo completa su animación de muerte."""
-        if enemy in self.enemies:
-            self.enemies.remove(enemy)
-            self.enemies_remaining = len([e for e in self.enemies if e.is_alive])
-            
-            # Verificar si se completó la ronda
-            if self.enemies_remaining == 0:
-                self._start_next_round()
-
-    def _start_next_round(self):
-        """Inicia la siguiente ronda de enemigos."""
-        self.current_round += 1
-        if self.current_round <= VICTORY_ROUND:
-            self._spawn_enemies()
-        else:
-            self.has_won = True
-            self.records_service.add_record(self.points)
+        """Inicializa la partida y su vista."""
+        self._save_replay()
+        self.match = Match(clock=Clock(CONFIG['simulation']['clock'], CONFIG['simulation']['time_scale']))
+        self.match.victory_callback = self.records_service.add_record
+        if RECORD_REPLAYS:
+            self.match.input_log = InputLog(self.match.seed)
+        self.view = InGameView(self.screen, self.match.map, self.match.player, self.match.enemies)
 
     def handle_event(self, event: pygame.event.Event):
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_ESCAPE:
-                self.is_paused = not self.is_paused
-                if self.is_paused:
-                    self.last_update_time = time.time()
-                    self.audio_manager.pause_all()
-                else:
+                if self.match.is_paused:
+                    self.match.resume()
                     self.audio_manager.unpause_all()
+                else:
+                    self.match.pause()
+                    self.audio_manager.pause_all()
                 return
-            elif event.key == pygame.K_r and (self.is_dead or self.has_won):
+            elif event.key == pygame.K_r and self.match.is_over:
                 self._reset_game()
                 return
 
         # Manejar clicks en el menú de pausa
-        if self.is_paused and event.type == pygame.MOUSEBUTTONDOWN:
+        if self.match.is_paused and event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1:  # Click izquierdo
-                for i, rect in enumerate(self.pause_menu_view.get_button_rects()):
-                    if rect.collidepoint(event.pos):
-                        option = self.pause_menu_model.get_button_labels()[i]
-                        if option == "Continuar":
-                            self.is_paused = False
-                            self.last_update_time = time.time()
-                            self.audio_manager.unpause_all()
-                        elif option == "Salir al Menú":
-                            return "menu"  # Señal para volver al menú principal
+                button = self.pause_menu_view.ui.hit_test(event.pos)
+                if button is not None:
+                    option = button.action
+                    if option == "Continuar":
+                        self.match.resume()
+                        self.audio_manager.unpause_all()
+                    elif option == "Salir al Menú":
+                        self._save_replay()
+                        return "menu"  # Señal para volver al menú principal
                 return
         
         # Manejar clicks en pantallas de muerte/victoria
-        if (self.is_dead or self.has_won) and event.type == pygame.MOUSEBUTTONDOWN:
+        if self.match.is_over and event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1:  # Click izquierdo
-                if hasattr(self.view, 'restart_button_rect') and self.view.restart_button_rect.collidepoint(event.pos):
+                ui = self.view.victory_screen if self.match.has_won else self.view.death_screen
+                button = ui.hit_test(event.pos)
+                if button is not None and button.action == "restart":
                     self._initialize_game()
-                elif hasattr(self.view, 'menu_button_rect') and self.view.menu_button_rect.collidepoint(event.pos):
+                elif button is not None and button.action == "menu":
+                    self._save_replay()
                     return "menu"
             return
 
-        if not self.is_paused and not self.is_dead and not self.has_won:
+        if self.match.is_running:
             if event.type == pygame.KEYDOWN or event.type == pygame.KEYUP:
                 self._handle_movement(event)
             if event.type == pygame.KEYDOWN:
@@ -151,81 +95,86 @@ class InGameController:
 
     def _handle_movement(self, event: pygame.event.Event):
         """Maneja el movimiento del jugador."""
-        is_key_down = event.type == pygame.KEYDOWN
-        
-        if event.key == pygame.K_w or event.key == pygame.K_UP:
-            self.player.move_up = is_key_down
-        elif event.key == pygame.K_s or event.key == pygame.K_DOWN:
-            self.player.move_down = is_key_down
-        elif event.key == pygame.K_a or event.key == pygame.K_LEFT:
-            self.player.move_left = is_key_down
-        elif event.key == pygame.K_d or event.key == pygame.K_RIGHT:
-            self.player.move_right = is_key_down
+        direction = MOVEMENT_KEYS.get(event.key)
+        if direction is not None:
+            self.match.set_movement(direction, event.type == pygame.KEYDOWN)
 
     def _handle_attack(self, key):
         """Maneja los ataques del jugador."""
+        # El sonido sólo suena si el ataque no estaba en enfriamiento
         if key == pygame.K_x or key == pygame.K_k:  # Ataque básico
-            self.player.cast_basic_attack()
-            self.audio_manager.play_attack_sound()
+            if self.match.cast_basic_attack():
+                self.audio_manager.play_attack_sound()
         elif key == pygame.K_c or key == pygame.K_l:  # Ataque pesado
-            self.player.cast_heavy_attack()
-            self.audio_manager.play_attack_sound()
+            if self.match.cast_heavy_attack():
+                self.audio_manager.play_attack_sound()
 
     def update(self, dt: float):
-        """Actualiza el estado del juego."""
-        if not self.is_paused and not self.is_dead and not self.has_won:
-            # Actualizar tiempo de juego
-            current_time = time.time()
-            
-            # Actualizar contador inicial
-            if self.countdown_active:
-                elapsed = current_time - self.countdown_start_time
-                if elapsed >= self.countdown_time:
-                    self.countdown_active = False
-                return  # No actualizar el juego mientras el contador está activo
-            
-            self.game_time += current_time - self.last_update_time
-            self.last_update_time = current_time
-            
-            # Actualizar puntos por tiempo (1 punto por segundo)
-            self.points = int(self.game_time)
-            
-            # Verificar si el jugador está muerto
-            if self.player.hp <= 0 and not self.is_dead:
-                self.is_dead = True
-                return
-            
-            # Actualizar jugador
-            self.player.update(dt, self.map)
-            
-            # Actualizar ataques del jugador
-            self.player._basic_attack.update(dt)
-            self.player._heavy_attack.update(dt)
-            
-            # Actualizar enemigos y verificar colisiones con ataques
-            for enemy in self.enemies:
-                if not enemy.is_alive:
-                    continue                    
-                enemy.update(dt, self.player, self.map)
-                enemy.check_attack_hit(self.player._basic_attack)
-                enemy.check_attack_hit(self.player._heavy_attack)
-                
+        """Avanza la partida ``dt`` segundos de tiempo real.
+
+        La simulación avanza en pasos fijos y la vista interpola entre los dos últimos.
+        """
+        self.match.update(dt)
+        self.view.interpolation = self.match.interpolation
+        if self.match.is_over:
+            self._save_replay()
+
+    def _save_replay(self):
+        """Guarda en replays/ la entrada grabada de la partida actual, si se está grabando."""
+        if self.match is None or self.match.input_log is None:
+            return
+        log = self.match.input_log
+        self.match.input_log = None  # Lo que siga de la partida ya no se graba
+        if not len(log):
+            return
+        log.finish(self.match)
+        os.makedirs(REPLAY_DIR, exist_ok=True)
+        path = os.path.join(REPLAY_DIR, f"{time.strftime('%Y%m%d-%H%M%S')}-{log.seed:016x}.axr")
+        try:
+            log.save(path)
+            print(f"Partida grabada en {path} ({len(log)} pasos)")
+        except OSError as e:
+            print(f"Advertencia: No se pudo guardar la grabación '{path}': {e}")
+
+    def shutdown(self):
+        """Guarda la grabación pendiente al cerrar el juego."""
+        self._save_replay()
+
+    def is_idle(self) -> bool:
+        """True si la partida está detenida (pausa, muerte o victoria) y sólo cambia con la entrada."""
+        return not self.match.is_running
+
     def render(self):
-        # Primero renderizar el juego
-        self.view.draw(
+        """Dibuja la partida. Retorna los rectángulos a presentar, o None para la pantalla completa."""
+        if self.match.is_paused:
+            # El juego no avanza en pausa: congelar el último frame y componer el menú encima
+            if self.pause_snapshot is None:
+                self._draw_game(to_surface=True)
+                self.pause_snapshot = self.screen.copy()
+            else:
+                self.screen.blit(self.pause_snapshot, (0, 0))
+            self.pause_menu_view.draw()
+            # Al reanudar hay que redibujar la pantalla completa bajo la capa de pausa
+            self.view.needs_full_redraw = True
+            return None
+
+        self.pause_snapshot = None
+        return self._draw_game()
+
+    def _draw_game(self, to_surface: bool = False):
+        """Dibuja la escena de juego sin el menú de pausa."""
+        match = self.match
+        return self.view.draw(
             False,  # No mostrar mensaje de pausa, ahora usamos el menú
-            self.points,
-            self.current_round,
-            self.enemies_remaining,
-            self.countdown_active,
-            self.countdown_time - (time.time() - self.countdown_start_time) if self.countdown_active else 0,
-            self.is_dead,
-            self.has_won
+            match.points,
+            match.current_round,
+            match.enemies_remaining,
+            match.countdown_active,
+            match.countdown_remaining(),
+            match.is_dead,
+            match.has_won,
+            to_surface
         )
-        
-        # Si está pausado, renderizar el menú de pausa encima
-        if self.is_paused:
-            self.pause_menu_view.draw()
 
     def _reset_game(self):
         """Reinicia el juego después de la muerte o victoria."""
@@ -7,21 +7,18 @@ class MenuController:
         self.model = model
         self.running = True
 
-    def handle_event(self, event, button_rects):
+    def handle_event(self, event, ui):
         if event.type == pygame.QUIT:
             self.running = False
             return "Salir" # Devolver la acción para que main.py la maneje
 
         if event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1: # Click izquierdo
-                mouse_pos = event.pos
-                button_labels = self.model.get_button_labels()
-                
-                for i, rect in enumerate(button_rects):
-                    if rect.collidepoint(mouse_pos):
-                        selected_label = button_labels[i]
-                        self.model.set_selected_option(selected_label)
-                        return self.perform_action(selected_label)
+                button = ui.hit_test(event.pos)
+                if button is not None:
+                    selected_label = button.action
+                    self.model.set_selected_option(selected_label)
+                    return self.perform_action(selected_label)
         return None
 
     def perform_action(self, action_label):
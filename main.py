@@ -1,24 +1,48 @@
 """Punto de entrada del juego."""
-import pygame
-from controllers.app_controller import AppController
+from services.startup_report import StartupReport
+import argparse
+import sys
+import time
 from services.config import CONFIG
-from services.audio_manager import AudioManager
 
 def run():
+    import pygame
+    from controllers.app_controller import AppController
+    from services.audio_manager import AudioManager
+    from services.asset_manager import AssetManager
+    from services.text_cache import TextCache
+    from services.display import Display
+
     pygame.init()
     pygame.mixer.init()  # Inicializar el sistema de audio
-    screen = pygame.display.set_mode((CONFIG["window"]['width'], CONFIG["window"]['height']))
+    screen = Display.create()  # Superficie lógica de dibujo
     pygame.display.set_caption(CONFIG["window"]['title'])
     clock = pygame.time.Clock()
+    StartupReport.mark("ventana creada")
 
     app = AppController(screen)
     running = True
+    session_start = time.perf_counter()
+    cpu_start = time.process_time()
 
     while running:
-        dt = clock.tick(CONFIG["window"]['fps']) / 1000
+        if app.is_idle():
+            # Escena estática: dormir hasta que llegue un evento o venza la espera
+            events = [pygame.event.wait(app.idle_timeout())]
+            events.extend(pygame.event.get())
+            # El tiempo bloqueado no es tiempo de juego: si el evento reanuda la
+            # partida, este frame no debe simular la espera en pasos de recuperación
+            clock.tick()
+            dt = 0
+        else:
+            dt = clock.tick(CONFIG["window"]['fps']) / 1000
+            events = pygame.event.get()
 
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+        for event in events:
+            if event.type == pygame.NOEVENT:
+                continue  # Venció la espera sin eventos
+            event = Display.map_event(event)
+            if event.type in (pygame.QUIT, pygame.WINDOWCLOSE):
                 running = False
             # El controlador ahora retorna False si debe terminar
             if not app.handle_event(event):
@@ -28,7 +52,120 @@ def run():
             app.update(dt)
             app.render()
 
+    if CONFIG['debug']['cpu_stats']:
+        wall_time = time.perf_counter() - session_start
+        print(f"CPU: {(time.process_time() - cpu_start) / wall_time:.1%} de un núcleo en promedio durante {wall_time:.1f} s")
+
+    if CONFIG['debug']['asset_stats']:
+        stats = AssetManager.stats()
+        print(f"AssetManager: {stats['hits']} aciertos, {stats['misses']} fallos, "
+              f"{stats['entries']} superficies ({stats['bytes'] / 1024 / 1024:.1f} MB)")
+
+    if CONFIG['debug']['audio_stats']:
+        stats = AudioManager().voices.stats()
+        print(f"Voces de efectos: {stats['played']} reproducidas, {stats['dropped']} descartadas, "
+              f"{stats['stolen']} robadas")
+
+    if CONFIG['debug']['text_stats']:
+        stats = TextCache.stats()
+        print(f"TextCache: {stats['hit_rate']:.1%} aciertos ({stats['hits']}/{stats['hits'] + stats['misses']}), "
+              f"{stats['evictions']} desalojos, {stats['entries']} textos ({stats['bytes'] / 1024:.1f} KB)")
+
+    app.shutdown()
     pygame.quit()
 
+def _bot_input(match):
+    """Jugador automático simple: persigue al enemigo vivo más cercano y ataca al tenerlo a tiro."""
+    player = match.player
+    targets = [enemy for enemy in match.enemies if enemy.is_alive]
+    if not targets:
+        return
+    target = min(targets, key=lambda enemy: (enemy.x - player.x) ** 2 + (enemy.y - player.y) ** 2)
+    dx = target.x - player.x
+    dy = target.y - player.y
+    match.set_movement("right", dx > 0.5)
+    match.set_movement("left", dx < -0.5)
+    match.set_movement("down", dy > 0.5)
+    match.set_movement("up", dy < -0.5)
+    distance = (dx * dx + dy * dy) ** 0.5
+    if distance <= player._heavy_attack.range:
+        match.cast_heavy_attack()
+    if distance <= player._basic_attack.range:
+        match.cast_basic_attack()
+
+def headless(matches: int, ticks: int, seed: int):
+    """Juega ``matches`` partidas sin pantalla, tan rápido como se pueda, con el jugador automático."""
+    from models.match import Match, SIM_STEP
+    from models.clock import Clock
+
+    total_ticks = 0
+    total_time = 0.0
+    for number in range(1, matches + 1):
+        match = Match(countdown=False, clock=Clock("manual"), seed=seed + number - 1)
+        start = time.perf_counter()
+        while match.ticks < ticks and not match.is_over:
+            _bot_input(match)
+            match.step(SIM_STEP)
+        elapsed = time.perf_counter() - start
+        total_ticks += match.ticks
+        total_time += elapsed
+
+        result = "victoria" if match.has_won else "muerte" if match.is_dead else "sin terminar"
+        print(f"Partida {number}: {result}, ronda {match.current_round}, {match.points} puntos, "
+              f"{match.ticks} pasos en {elapsed:.2f} s ({match.ticks / elapsed:.0f} pasos/s, "
+              f"{match.game_time / elapsed:.0f}x tiempo real)")
+    print(f"Total: {total_ticks} pasos en {total_time:.2f} s ({total_ticks / total_time:.0f} pasos/s)")
+
+def replay(path: str, seek_tick: int = None) -> bool:
+    """Reproduce sin pantalla una partida grabada y verifica que termine en el mismo estado.
+
+    Con ``seek_tick`` sólo salta a ese paso desde el keyframe más cercano y muestra el estado.
+    """
+    from models.replay import InputLog, play, seek, state_digest
+
+    log = InputLog.load(path)
+    if seek_tick is not None:
+        start = time.perf_counter()
+        match = seek(log, seek_tick)
+        elapsed = time.perf_counter() - start
+        player = match.player
+        print(f"{path}: paso {match.ticks} en {elapsed * 1000:.1f} ms ({len(log.keyframes)} keyframes), "
+              f"ronda {match.current_round}, {match.points} puntos, HP {player.hp:.1f}, "
+              f"{len(match.enemies)} enemigos")
+        return True
+    start = time.perf_counter()
+    match = play(log)
+    elapsed = time.perf_counter() - start
+    matches = state_digest(match) == log.digest
+    print(f"{path}: {match.ticks} pasos en {elapsed:.2f} s ({match.ticks / elapsed:.0f} pasos/s), "
+          f"ronda {match.current_round}, {match.points} puntos")
+    print("Estado final idéntico al grabado" if matches else "El estado final NO coincide con el grabado")
+    return matches
+
+def bake():
+    """Hornea el caché de frames de enemigos y jugador."""
+    from views.sprites import EnemySprites, PlayerSprites
+    from services.frame_cache import FrameCache
+
+    for group, specs in (("enemy", EnemySprites.frame_specs()), ("player", PlayerSprites.frame_specs())):
+        path = FrameCache.bake(group, specs)
+        print(f"{len(specs)} frames -> {path}")
+
 if __name__ == "__main__":
-    run()
+    parser = argparse.ArgumentParser(description=CONFIG["window"]['title'])
+    parser.add_argument("--bake", action="store_true", help="hornea el caché de frames y sale")
+    parser.add_argument("--headless", action="store_true", help="simula partidas sin pantalla con un jugador automático")
+    parser.add_argument("--matches", type=int, default=1, help="partidas a simular con --headless")
+    parser.add_argument("--ticks", type=int, default=36000, help="pasos máximos por partida con --headless")
+    parser.add_argument("--seed", type=int, default=0, help="semilla de la primera partida con --headless")
+    parser.add_argument("--replay", metavar="ARCHIVO", help="reproduce sin pantalla una partida grabada en replays/")
+    parser.add_argument("--seek", type=int, metavar="PASO", help="con --replay, salta a ese paso en lugar de jugarla entera")
+    args = parser.parse_args()
+    if args.bake:
+        bake()
+    elif args.headless:
+        headless(args.matches, args.ticks, args.seed)
+    elif args.replay:
+        sys.exit(0 if replay(args.replay, args.seek) else 1)
+    else:
+        run()
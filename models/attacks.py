@@ -5,8 +5,8 @@ Contiene la clase base Attack y sus implementaciones concretas.
 from dataclasses import dataclass
 from services.config import CONFIG
 import random
-import time
 from math import sqrt
+from models.clock import Clock
 
 @dataclass
 class Attack:
@@ -24,6 +24,8 @@ class Attack:
     _direction: tuple[float, float] = (0, 0)
     _source_x: float = 0
     _source_y: float = 0
+    clock: Clock = None  # Reloj de la partida; lo asigna el jugador dueño del ataque
+    rng: random.Random = None  # Generador aleatorio de la partida; también lo asigna el jugador
     
     def execute(self, source_x: float, source_y: float, direction: tuple[float, float] = None):
         """Ejecuta el ataque desde una posición fuente."""
@@ -32,7 +34,7 @@ class Attack:
         self._source_y = source_y
         self._direction = direction or (0, 0)
         self._is_executing = True
-        self._start_time = time.time()
+        self._start_time = self.clock.now
         
     def is_in_range(self, target_x: float, target_y: float) -> bool:
         """Verifica si un punto está dentro del rango del ataque."""
@@ -44,7 +46,7 @@ class Attack:
     def calculate_damage(self) -> float:
         """Calcula el daño del ataque, incluyendo probabilidad de crítico."""
         damage = self.damage
-        if random.random() < CONFIG['player']['critical_chance']:
+        if self.rng.random() < CONFIG['player']['critical_chance']:
             damage *= self.critical_multiplier
         return damage
         
@@ -62,7 +64,7 @@ class Attack:
     def update(self, dt: float):
         """Actualiza el estado del ataque."""
         if self._is_executing:
-            if time.time() - self._start_time >= self.cast_time:
+            if self.clock.since(self._start_time) >= self.cast_time:
                 self._is_executing = False
                 
     @property
@@ -0,0 +1,42 @@
+"""Reloj de la simulación.
+
+Todos los temporizadores de la partida (ventanas de los ataques, knockback,
+regeneración, cuenta regresiva) se miden con el reloj de su partida en lugar
+del reloj de pared. El reloj sólo avanza cuando la partida da un paso, así que
+la pausa no consume tiempo y una partida sin pantalla puede adelantarse tanto
+como se quiera.
+"""
+
+class Clock:
+    """Tiempo simulado de una partida, en segundos.
+
+    Modos:
+        realtime: cada segundo real de ``Match.update`` es un segundo simulado.
+        scaled: el tiempo real se multiplica por ``scale`` (cámara lenta o rápida).
+        manual: ``Match.update`` no avanza nada; sólo ``Match.step`` (pruebas y
+            partidas sin pantalla).
+    """
+    MODES = ("realtime", "scaled", "manual")
+
+    def __init__(self, mode: str = "realtime", scale: float = 1.0):
+        if mode not in self.MODES:
+            raise ValueError(f"Modo de reloj desconocido: {mode}")
+        self.mode = mode
+        self.scale = scale
+        self.now = 0.0  # Tiempo simulado transcurrido
+
+    def frame_time(self, dt: float) -> float:
+        """Tiempo simulado que corresponde a ``dt`` segundos reales."""
+        if self.mode == "manual":
+            return 0.0
+        if self.mode == "scaled":
+            return dt * self.scale
+        return dt
+
+    def advance(self, dt: float):
+        """Avanza el reloj ``dt`` segundos simulados."""
+        self.now += dt
+
+    def since(self, start: float) -> float:
+        """Segundos simulados transcurridos desde ``start``."""
+        return self.now - start
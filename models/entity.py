@@ -1,7 +1,8 @@
 """Entidad base: sólo lógica, sin dependencias gráficas.
 """
 from models.hitbox import Hitbox
-from dataclasses import dataclass
+from models.clock import Clock
+from dataclasses import dataclass, field
 from math import atan2, cos, sin
 
 @dataclass
@@ -12,11 +13,33 @@ class Entity:
     height: float = 1
     hp: float = 100
     is_alive: bool = True
+    # Posición al inicio del último paso de simulación (None hasta el primer paso)
+    prev_x: float = field(default=None, init=False, repr=False)
+    prev_y: float = field(default=None, init=False, repr=False)
+    # Reloj de la partida con el que se miden sus temporizadores
+    clock: Clock = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self):
+        if self.clock is None:
+            # Entidad suelta, fuera de una partida: reloj propio que sólo avanza a mano
+            self.clock = Clock("manual")
     
     def get_position(self) -> tuple[float, float]:
         """Devuelve la posición de la entidad."""
         return self.x, self.y
 
+    def save_previous_position(self):
+        """Guarda la posición actual antes de un paso de simulación."""
+        self.prev_x = self.x
+        self.prev_y = self.y
+
+    def interpolated_position(self, alpha: float) -> tuple[float, float]:
+        """Posición entre el paso anterior (``alpha`` = 0) y el actual (``alpha`` = 1)."""
+        if self.prev_x is None:
+            return self.x, self.y
+        return (self.prev_x + (self.x - self.prev_x) * alpha,
+                self.prev_y + (self.y - self.prev_y) * alpha)
+
     @property
     def hitbox(self) -> Hitbox:
         """Devuelve la hitbox de la entidad."""
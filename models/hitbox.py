@@ -1,4 +1,8 @@
-import pygame
+"""Cajas de colisión en unidades lógicas del mapa (tiles), sin pygame.
+
+Las colisiones se calculan como lo hacía ``pygame.Rect``: posición y tamaño se
+truncan a enteros y una caja vacía no colisiona con nada.
+"""
 
 class Hitbox:
     def __init__(self, x: float, y:float, width: float, height: float):
@@ -6,21 +10,25 @@ class Hitbox:
         self.y = y
         self.width = width
         self.height = height
-    
+
     @property
-    def rect(self) -> pygame.Rect:
-        """Devuelve el rectángulo de la hitbox en coordenadas lógicas."""
-        return pygame.Rect(self.x, self.y, self.width, self.height)
-    
+    def rect(self) -> tuple[int, int, int, int]:
+        """Devuelve el rectángulo ``(x, y, ancho, alto)`` de la hitbox en coordenadas lógicas enteras."""
+        return int(self.x), int(self.y), int(self.width), int(self.height)
+
     def collides_with(self, other: 'Hitbox') -> bool:
         """Comprueba si esta hitbox colisiona con otra."""
-        return self.rect.colliderect(other.rect)
+        x, y, width, height = self.rect
+        other_x, other_y, other_width, other_height = other.rect
+        return (width > 0 and height > 0 and other_width > 0 and other_height > 0
+                and x < other_x + other_width and other_x < x + width
+                and y < other_y + other_height and other_y < y + height)
 
-    def get_scaled_rect(self, scale: int) -> pygame.Rect:
-        """Devuelve el rectángulo de la hitbox escalado a píxeles."""
-        return pygame.Rect(
+    def get_scaled_rect(self, scale: int) -> tuple[int, int, int, int]:
+        """Devuelve el rectángulo ``(x, y, ancho, alto)`` de la hitbox escalado a píxeles."""
+        return (
             int(self.x * scale),
             int(self.y * scale),
             int(self.width * scale),
             int(self.height * scale)
-        )
\ No newline at end of file
+        )
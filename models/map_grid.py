@@ -13,6 +13,7 @@ class MapGrid:
     width: int = CONFIG['map']['width']
     height: int = CONFIG['map']['height']
     grid: list[list[bool]] = None  # True = pared, False = suelo
+    version: int = 0  # Aumenta con cada cambio de la cuadrícula
     
     def __post_init__(self):
         """Inicializa la cuadrícula del mapa."""
@@ -34,6 +35,14 @@ class MapGrid:
         for y in range(self.height):
             self.grid[y][0] = True  # Pared izquierda
             self.grid[y][self.width-1] = True  # Pared derecha
+        self.version += 1
+
+    def set_wall(self, x: int, y: int, is_wall: bool):
+        """Cambia una celda a pared o suelo. Cualquier cambio debe pasar por aquí
+        para que las vistas que cachean el mapa sepan que deben redibujarlo."""
+        if self.grid[y][x] != is_wall:
+            self.grid[y][x] = is_wall
+            self.version += 1
             
     def is_walkable(self, x: int, y: int) -> bool:
         """Verifica si una posición es transitable."""
@@ -49,10 +58,10 @@ class MapGrid:
             return None
         return Hitbox(x, y, 1, 1)
         
-    def get_random_floor_position(self) -> tuple[int, int]:
-        """Obtiene una posición aleatoria de suelo."""
+    def get_random_floor_position(self, rng: random.Random = random) -> tuple[int, int]:
+        """Obtiene una posición aleatoria de suelo usando ``rng`` (por defecto, el módulo random)."""
         while True:
-            x = random.randint(1, self.width-2)
-            y = random.randint(1, self.height-2)
+            x = rng.randint(1, self.width-2)
+            y = rng.randint(1, self.height-2)
             if self.is_walkable(x, y):
                 return (x, y)
\ No newline at end of file
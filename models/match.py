@@ -0,0 +1,256 @@
+"""Reglas de una partida: mapa, jugador, enemigos y rondas, sin pygame.
+
+La partida avanza en pasos fijos de SIM_STEP. El controlador le pasa la
+entrada ya traducida (movimiento y ataques) y la vista dibuja su estado; sin
+ninguno de los dos puede simularse sin pantalla (``main.py --headless``).
+"""
+import random
+from math import floor, log
+from models.clock import Clock
+from models.player import AnimatedPlayer
+from models.map_grid import MapGrid
+from models.enemies import Enemy
+from services.config import CONFIG
+
+VICTORY_ROUND = 4
+TICK_RATE = CONFIG['simulation']['tick_rate']
+SIM_STEP = 1 / TICK_RATE  # Duración fija de cada paso de simulación
+MAX_SIM_STEPS = CONFIG['simulation']['max_steps']
+
+# Bits de la entrada de un paso: movimiento vigente y ataques lanzados desde el paso anterior
+INPUT_UP = 1
+INPUT_DOWN = 2
+INPUT_LEFT = 4
+INPUT_RIGHT = 8
+INPUT_BASIC = 16
+INPUT_HEAVY = 32
+INPUT_HEAVY_FIRST = 64  # El pesado se lanzó antes que el básico
+
+class Match:
+    def __init__(self, countdown: bool = True, clock: Clock = None, seed: int = None):
+        """Crea una partida en la primera ronda.
+
+        Args:
+            countdown (bool): Si la partida empieza con la cuenta regresiva de 3 segundos
+            clock (Clock): Reloj de la partida; por defecto, en tiempo real
+            seed (int): Semilla de la partida; por defecto, una al azar
+        """
+        self.clock = clock or Clock()
+        # Todo lo aleatorio de la partida (posiciones de aparición, críticos) sale
+        # de este generador, así la misma semilla y la misma entrada dan la misma partida
+        self.seed = random.getrandbits(64) if seed is None else seed
+        self.rng = random.Random(self.seed)
+        self.map = MapGrid(CONFIG['map']['width'], CONFIG['map']['height'])
+        self.player = AnimatedPlayer(x=1, y=1, clock=self.clock, rng=self.rng)
+        self.enemies = []
+
+        # Estado del juego
+        self.is_paused = False
+        self.sim_accumulator = 0.0  # Tiempo real aún no simulado, menor que SIM_STEP
+        self.ticks = 0  # Pasos de simulación ejecutados
+        self.current_round = 1
+        self.enemies_remaining = 0
+        self.is_dead = False
+        self.has_won = False
+        self.points = 0
+        self.victory_callback = None  # Se llama con los puntos finales al ganar
+        self.input_log = None  # Si no es None, registro (models.replay.InputLog) de la entrada de cada paso
+        self._casts = 0  # Ataques lanzados desde el último paso, en bits INPUT_*
+
+        # Estado del contador inicial
+        self.countdown_active = countdown
+        self.countdown_time = 3.0  # 3 segundos de cuenta regresiva
+        self.countdown_elapsed = 0.0
+
+        self._spawn_enemies()
+
+    @property
+    def is_over(self) -> bool:
+        """True si el jugador murió o ganó."""
+        return self.is_dead or self.has_won
+
+    @property
+    def is_running(self) -> bool:
+        """True si la partida acepta entrada y avanza con ``update``."""
+        return not self.is_paused and not self.is_over
+
+    @property
+    def game_time(self) -> float:
+        """Tiempo simulado de juego, en segundos."""
+        return self.clock.now
+
+    @property
+    def interpolation(self) -> float:
+        """Fracción del siguiente paso ya transcurrida, para interpolar el dibujo."""
+        return 1.0 if self.is_over else self.sim_accumulator / SIM_STEP
+
+    def countdown_remaining(self) -> float:
+        """Segundos que le quedan a la cuenta regresiva, o 0 si ya terminó."""
+        if not self.countdown_active:
+            return 0
+        return self.countdown_time - self.countdown_elapsed
+
+    def _calculate_enemy_count(self, level: int) -> int:
+        """Calcula la cantidad de enemigos para un nivel específico en la ronda actual."""
+        n = max(1, int(2 * log(self.current_round + 1))) # Progresión logarítmica: 1-2-3-4-4-5
+        return floor(n / level)
+
+    def _spawn_enemies(self):
+        """Genera los enemigos para la ronda actual."""
+        self.enemies.clear()
+
+        # Define los niveles de enemigos disponibles
+        enemy_levels = range(1, 6)  # Niveles del 1 al 5
+
+        # Genera enemigos de cada nivel
+        for level in enemy_levels:
+            count = self._calculate_enemy_count(level)
+            self._spawn_enemies_of_level(level, count)
+
+        self.enemies_remaining = len(self.enemies)
+
+        # Configurar callback de muerte para cada enemigo
+        for enemy in self.enemies:
+            enemy._death_complete_callback = self._on_enemy_death_complete
+
+    def _spawn_enemies_of_level(self, level: int, count: int):
+        """Genera una cantidad específica de enemigos de un nivel dado."""
+        for _ in range(count):
+            x, y = self.map.get_random_floor_position(self.rng)
+            enemy = Enemy(x, y, level, self.clock)
+            self.enemies.append(enemy)
+
+    def _on_enemy_death_complete(self, enemy):
+        """Callback que se ejecuta cuando un enemigo completa su animación de muerte."""
+        if enemy in self.enemies:
+            self.enemies.remove(enemy)
+            self.enemies_remaining = len([e for e in self.enemies if e.is_alive])
+
+            # Verificar si se completó la ronda
+            if self.enemies_remaining == 0:
+                self._start_next_round()
+
+    def _start_next_round(self):
+        """Inicia la siguiente ronda de enemigos."""
+        self.current_round += 1
+        if self.current_round <= VICTORY_ROUND:
+            self._spawn_enemies()
+        else:
+            self.has_won = True
+            if self.victory_callback:
+                self.victory_callback(self.points)
+
+    def pause(self):
+        """Detiene la partida hasta ``resume``."""
+        self.is_paused = True
+
+    def resume(self):
+        """Reanuda la partida pausada."""
+        self.is_paused = False
+
+    def set_movement(self, direction: str, pressed: bool):
+        """Activa o desactiva el movimiento del jugador en ``direction`` (up, down, left o right)."""
+        if self.is_running:
+            setattr(self.player, f"move_{direction}", pressed)
+
+    def cast_basic_attack(self) -> bool:
+        """Lanza el ataque básico. Retorna True si se ejecutó (no estaba en enfriamiento)."""
+        if not (self.is_running and self.player.cast_basic_attack()):
+            return False
+        self._casts |= INPUT_BASIC
+        return True
+
+    def cast_heavy_attack(self) -> bool:
+        """Lanza el ataque pesado. Retorna True si se ejecutó (sin enfriamiento y con MP suficiente)."""
+        if not (self.is_running and self.player.cast_heavy_attack()):
+            return False
+        self._casts |= INPUT_HEAVY if self._casts & INPUT_BASIC else INPUT_HEAVY | INPUT_HEAVY_FIRST
+        return True
+
+    def input_state(self) -> int:
+        """Entrada del paso siguiente en bits INPUT_*: movimiento vigente y ataques lanzados."""
+        player = self.player
+        return (INPUT_UP * player.move_up | INPUT_DOWN * player.move_down
+                | INPUT_LEFT * player.move_left | INPUT_RIGHT * player.move_right | self._casts)
+
+    def apply_input(self, state: int):
+        """Reproduce la entrada de un paso registrada con ``input_state``."""
+        self.set_movement("up", bool(state & INPUT_UP))
+        self.set_movement("down", bool(state & INPUT_DOWN))
+        self.set_movement("left", bool(state & INPUT_LEFT))
+        self.set_movement("right", bool(state & INPUT_RIGHT))
+        # Los ataques se relanzan en el mismo orden en que se lanzaron
+        if state & INPUT_HEAVY_FIRST and state & INPUT_HEAVY:
+            self.cast_heavy_attack()
+        if state & INPUT_BASIC:
+            self.cast_basic_attack()
+        if state & INPUT_HEAVY and not state & INPUT_HEAVY_FIRST:
+            self.cast_heavy_attack()
+
+    def update(self, dt: float):
+        """Avanza la partida ``dt`` segundos de tiempo real.
+
+        El reloj convierte ``dt`` en tiempo simulado según su modo. La simulación
+        avanza en pasos fijos de SIM_STEP; lo que sobra queda en el acumulador
+        para el siguiente frame y para ``interpolation``.
+        """
+        if not self.is_running:
+            return
+        dt = self.clock.frame_time(dt)
+
+        # Actualizar contador inicial
+        if self.countdown_active:
+            self.countdown_elapsed += dt
+            if self.countdown_elapsed >= self.countdown_time:
+                self.countdown_active = False
+            return  # No actualizar el juego mientras el contador está activo
+
+        self.sim_accumulator += dt
+        steps = 0
+        while self.sim_accumulator >= SIM_STEP and not self.is_over:
+            if steps == MAX_SIM_STEPS:
+                # Sin tiempo para ponerse al día: descartar el atraso en lugar de acumularlo
+                self.sim_accumulator %= SIM_STEP
+                break
+            self.step(SIM_STEP)
+            self.sim_accumulator -= SIM_STEP
+            steps += 1
+
+    def step(self, dt: float):
+        """Avanza la simulación un paso fijo de ``dt`` segundos."""
+        if self.input_log is not None:
+            self.input_log.append(self.input_state())
+        self._casts = 0
+
+        # Verificar si el jugador está muerto
+        if self.player.hp <= 0 and not self.is_dead:
+            self.is_dead = True
+            return
+
+        self.ticks += 1
+        self.clock.advance(dt)
+        # Actualizar puntos por tiempo (1 punto por segundo)
+        self.points = int(self.game_time)
+
+        # Posiciones de partida para interpolar el dibujo
+        self.player.save_previous_position()
+        for enemy in self.enemies:
+            enemy.save_previous_position()
+
+        # Actualizar jugador
+        self.player.update(dt, self.map)
+
+        # Actualizar ataques del jugador
+        self.player._basic_attack.update(dt)
+        self.player._heavy_attack.update(dt)
+
+        # Actualizar enemigos y verificar colisiones con ataques
+        for enemy in self.enemies:
+            if not enemy.is_alive:
+                continue
+            enemy.update(dt, self.player, self.map)
+            enemy.check_attack_hit(self.player._basic_attack)
+            enemy.check_attack_hit(self.player._heavy_attack)
+
+        if self.input_log is not None:
+            self.input_log.end_step(self)
@@ -1,14 +1,17 @@
 """Modelo del jugador con movimiento y ataques básicos.
+
+Sólo lógica: la imagen de cada frame la elige la vista (views.sprites).
 """
 from models.entity import Entity
 from models.hitbox import Hitbox
 from models.attacks import basicAttack, heavyAttack
+from models.clock import Clock
 from services.config import CONFIG
+from services.atlas_manifest import AtlasManifest
 from dataclasses import dataclass, field
 from math import floor, ceil
-import time
-import pygame
-from typing import Dict, Tuple
+from typing import Dict
+import random
 
 @dataclass
 class Player(Entity):
@@ -20,7 +23,9 @@ class Player(Entity):
     _heavy_attack_cooldown: float = field(default=0.0, init=False, repr=False)
     _basic_attack: basicAttack = field(default_factory=basicAttack, init=False, repr=False)
     _heavy_attack: heavyAttack = field(default_factory=heavyAttack, init=False, repr=False)
-    _last_regen_time: float = field(default_factory=time.time, init=False, repr=False)
+    _last_regen_time: float = field(default=0.0, init=False, repr=False)
+    # Generador aleatorio de la partida (críticos de los ataques)
+    rng: random.Random = field(default=None, repr=False, compare=False)
 
     # Input flags
     move_up: bool = field(default=False, repr=False)
@@ -28,6 +33,19 @@ class Player(Entity):
     move_left: bool = field(default=False, repr=False)
     move_right: bool = field(default=False, repr=False)
 
+    render_order = 1  # Misma capa que los enemigos: el solapamiento lo decide la y
+
+    def __post_init__(self):
+        super().__post_init__()
+        if self.rng is None:
+            self.rng = random.Random()
+        # Los ataques miden su ventana de lanzamiento con el reloj del jugador y
+        # tiran los críticos con su generador
+        for attack in (self._basic_attack, self._heavy_attack):
+            attack.clock = self.clock
+            attack.rng = self.rng
+        self._last_regen_time = self.clock.now
+
     def update(self, dt: float, map_obj):
         # Movimiento propuesto
         dx = (self.move_right - self.move_left) * CONFIG['player']['speed'] * dt
@@ -52,8 +70,7 @@ class Player(Entity):
             self._heavy_attack_cooldown -= dt
 
         # Regeneración de HP y MP
-        current_time = time.time()
-        if current_time - self._last_regen_time >= CONFIG['player']['time_to_regen']:
+        if self.clock.since(self._last_regen_time) >= CONFIG['player']['time_to_regen']:
             # Regenerar HP
             if self.hp < CONFIG['player']['hp']:
                 # Convertir el porcentaje a decimal (0.1% = 0.001)
@@ -68,7 +85,7 @@ class Player(Entity):
                 mp_regen = CONFIG['player']['mp'] * mp_regen_percent
                 self.mp = min(self.mp + mp_regen, CONFIG['player']['mp'])
             
-            self._last_regen_time = current_time
+            self._last_regen_time = self.clock.now
             
     def _can_move_to(self, new_x: float, new_y: float, map_obj) -> bool:
         """Verifica si la entidad puede moverse a la nueva posición."""
@@ -87,8 +104,8 @@ class Player(Entity):
             return False
         return True
         
-    def cast_basic_attack(self, direction: tuple[float, float] = None):
-        """Ejecuta el ataque básico y actualiza la animación."""
+    def cast_basic_attack(self, direction: tuple[float, float] = None) -> bool:
+        """Ejecuta el ataque básico y actualiza la animación. Retorna True si se ejecutó."""
         if self._basic_attack_cooldown <= 0:
             # Calcular el centro del jugador
             center_x = self.x + (self.width / 2)
@@ -101,9 +118,11 @@ class Player(Entity):
             self.is_attacking = True
             self.attack_frame = 0
             self.attack_complete = False
+            return True
+        return False
             
-    def cast_heavy_attack(self, direction: tuple[float, float] = None):
-        """Ejecuta el ataque pesado y actualiza la animación."""
+    def cast_heavy_attack(self, direction: tuple[float, float] = None) -> bool:
+        """Ejecuta el ataque pesado y actualiza la animación. Retorna True si se ejecutó."""
         if self._heavy_attack_cooldown <= 0 and self.mp >= self._heavy_attack.mp_cost:
             # Calcular el centro del jugador
             center_x = self.x + (self.width / 2)
@@ -117,6 +136,8 @@ class Player(Entity):
             self.is_attacking = True
             self.attack_frame = 0
             self.attack_complete = False
+            return True
+        return False
             
 class AnimatedPlayer(Player):
     """
@@ -132,25 +153,24 @@ class AnimatedPlayer(Player):
         state (str): Estado actual del personaje ('idle', 'run', 'attack1', 'attack2')
         direction (str): Dirección actual del personaje ('up', 'down', 'left', 'right')
         speed (int): Velocidad de movimiento del personaje
+        frame_key (tuple): Frame a dibujar, ``(estado, dirección, índice)``
     """
     
     # Constantes de la clase
-    SPRITE_SIZE = (52, 62)
     ANIMATION_DELAY = 100
     MOVEMENT_SPEED = 5
     
-    def __init__(self, x: int, y: int):
+    def __init__(self, x: int, y: int, clock: Clock = None, rng: random.Random = None):
         """
         Inicializa el personaje jugable.
         
         Args:
             x (int): Posición inicial X del personaje
             y (int): Posición inicial Y del personaje
+            clock (Clock): Reloj de la partida
+            rng (random.Random): Generador aleatorio de la partida
         """
-        super().__init__(x=x, y=y)
-        
-        # Cargar y escalar sprites
-        self._load_sprites()
+        super().__init__(x=x, y=y, clock=clock, rng=rng)
         
         # Estados y animaciones
         self.state = "idle"
@@ -159,8 +179,8 @@ class AnimatedPlayer(Player):
         self.animation_timer = 0
         self.animation_delay = self.ANIMATION_DELAY
         
-        # Imagen inicial
-        self.image = self._get_initial_image()
+        # Frame inicial
+        self.frame_key = ("initial", "down", 0)
         
         # Estados de animación con rectángulos corregidos
         self.states = self._initialize_animation_states()
@@ -170,85 +190,16 @@ class AnimatedPlayer(Player):
         self.is_attacking = False
         self.attack_complete = False
 
-    def _load_sprites(self) -> None:
-        """Carga y escala todos los sprites necesarios para las animaciones."""
-        # Cargar sprites
-        self.sheet_idle_down = pygame.image.load("assets/PJ/Sprites/IDLE/idle_down.png")
-        self.sheet_idle_up = pygame.image.load("assets/PJ/Sprites/IDLE/idle_up.png")
-        self.sheet_idle_left = pygame.image.load("assets/PJ/Sprites/IDLE/idle_left.png")
-        self.sheet_idle_right = pygame.image.load("assets/PJ/Sprites/IDLE/idle_right.png")
-        
-        self.sheet_run_down = pygame.image.load("assets/PJ/Sprites/RUN/run_down.png")
-        self.sheet_run_up = pygame.image.load("assets/PJ/Sprites/RUN/run_up.png")
-        self.sheet_run_left = pygame.image.load("assets/PJ/Sprites/RUN/run_left.png")
-        self.sheet_run_right = pygame.image.load("assets/PJ/Sprites/RUN/run_right.png")
-        
-        self.sheet_attack1_down = pygame.image.load("assets/PJ/Sprites/ATTACK 1/attack1_down.png")
-        self.sheet_attack1_up = pygame.image.load("assets/PJ/Sprites/ATTACK 1/attack1_up.png")
-        self.sheet_attack1_left = pygame.image.load("assets/PJ/Sprites/ATTACK 1/attack1_left.png")
-        self.sheet_attack1_right = pygame.image.load("assets/PJ/Sprites/ATTACK 1/attack1_right.png")
-        
-        self.sheet_attack2_down = pygame.image.load("assets/PJ/Sprites/ATTACK 2/attack2_down.png")
-        self.sheet_attack2_up = pygame.image.load("assets/PJ/Sprites/ATTACK 2/attack2_up.png")
-        self.sheet_attack2_left = pygame.image.load("assets/PJ/Sprites/ATTACK 2/attack2_left.png")
-        self.sheet_attack2_right = pygame.image.load("assets/PJ/Sprites/ATTACK 2/attack2_right.png")
-        
-        # Escalar sprites
-        for sheet in [self.sheet_idle_down, self.sheet_idle_up, self.sheet_idle_left, self.sheet_idle_right,
-                     self.sheet_run_down, self.sheet_run_up, self.sheet_run_left, self.sheet_run_right,
-                     self.sheet_attack1_down, self.sheet_attack1_up, self.sheet_attack1_left, self.sheet_attack1_right,
-                     self.sheet_attack2_down, self.sheet_attack2_up, self.sheet_attack2_left, self.sheet_attack2_right]:
-            sheet = pygame.transform.scale(sheet, self.SPRITE_SIZE)
-
-    def _get_initial_image(self) -> pygame.Surface:
-        """Retorna la imagen inicial del personaje."""
-        image = self.sheet_idle_down.subsurface(pygame.Rect(35, 22, 20, 30))
-        return pygame.transform.scale(image, self.SPRITE_SIZE)
-
     def _initialize_animation_states(self) -> Dict:
-        """Inicializa y retorna los estados de animación con sus respectivos frames."""
-        return {
-            "idle": {
-                "down": [(35, 22, 20, 35), (133, 22, 20, 35), (229, 22, 20, 35), (325, 22, 20, 35)],
-                "up": [(35, 22, 20, 35), (133, 22, 20, 35), (229, 22, 20, 35), (325, 22, 20, 35)],
-                "left": [(35, 22, 20, 35), (133, 22, 20, 35), (229, 22, 20, 35), (325, 22, 20, 35)],
-                "right": [(35, 22, 20, 35), (133, 22, 20, 35), (229, 22, 20, 35), (325, 22, 20, 35)]
-            },
-            "run": {
-                "down": [(133, 27, 20, 35), (229, 27, 20, 35), (325, 27, 20, 35), (421, 27, 20, 35)],
-                "up": [(133, 27, 20, 35), (229, 27, 20, 35), (325, 27, 20, 35), (421, 27, 20, 35)],
-                "left": [(133, 27, 20, 35), (229, 27, 20, 35), (325, 27, 20, 35), (421, 27, 20, 35)],
-                "right": [(133, 27, 20, 35), (229, 27, 20, 35), (325, 27, 20, 35), (421, 27, 20, 35)]
-            },
-            "attack1": {
-                "down": [(113, 27, 45, 35), (229, 27, 45, 35), (325, 27, 45, 35), (421, 27, 45, 35)],
-                "up": [(113, 14, 45, 35), (207, 14, 45, 35), (304, 27, 45, 35), (414, 27, 45, 35)],
-                "left": [(102, 27, 45, 35), (202, 27, 45, 35), (314, 27, 45, 35), (414, 27, 45, 35)],
-                "right": [(137, 27, 45, 35), (229, 27, 45, 35), (325, 27, 45, 35), (421, 27, 45, 35)]
-            },
-            "attack2": {
-                "down": [(113, 27, 45, 35), (207, 27, 45, 35), (304, 27, 45, 35), (402, 27, 45, 35)],
-                "up": [(116, 16, 45, 35), (230, 16, 45, 35), (326, 24, 45, 35), (422, 24, 45, 35)],
-                "left": [(100, 24, 45, 35), (196, 27, 45, 35), (314, 27, 45, 35), (408, 27, 45, 35)],
-                "right": [(137, 27, 45, 35), (224, 27, 45, 35), (321, 27, 45, 35), (418, 27, 45, 35)]
-            }
-        }
-
-    def get_current_sheet(self) -> pygame.Surface:
-        """
-        Retorna la hoja de sprites actual según el estado y dirección del personaje.
-        
-        Returns:
-            pygame.Surface: La hoja de sprites correspondiente al estado actual
-        """
-        return getattr(self, f"sheet_{self.state}_{self.direction}")
+        """Retorna las tablas de frames de cada estado leídas del manifiesto del atlas."""
+        return AtlasManifest.animations("player")
 
     def update(self, dt: float, map_obj):
         """Actualiza el estado del personaje, incluyendo animaciones y movimiento."""
         # Actualizar animación
-        current_time = pygame.time.get_ticks()
-        if current_time - self.animation_timer > self.animation_delay:
-            self.animation_timer = current_time
+        self.animation_timer += dt * 1000  # Convertir a milisegundos
+        if self.animation_timer > self.animation_delay:
+            self.animation_timer = 0
             self._update_animation()
         
         # Actualizar movimiento y lógica del juego
@@ -287,20 +238,17 @@ class AnimatedPlayer(Player):
         else:
             self.frame = (self.frame + 1) % len(self.states[self.state][self.direction])
         
-        # Obtener y actualizar el frame actual
-        current_frame = self._get_current_frame()
-        current_sheet = self.get_current_sheet()
-        self.image = current_sheet.subsurface(pygame.Rect(current_frame))
-        self.image = pygame.transform.scale(self.image, self.SPRITE_SIZE)
+        # Frame actual, que la vista traduce a su imagen
+        self.frame_key = (self.state, self.direction, self._get_current_frame())
 
-    def _get_current_frame(self) -> Tuple[int, int, int, int]:
-        """Retorna las coordenadas del frame actual de la animación."""
+    def _get_current_frame(self) -> int:
+        """Retorna el índice del frame actual de la animación."""
         if self.state in ["attack1", "attack2"] and self.is_attacking:
-            return self.states[self.state][self.direction][self.attack_frame]
-        return self.states[self.state][self.direction][self.frame]
+            return self.attack_frame
+        return self.frame
 
-    def cast_basic_attack(self, direction: tuple[float, float] = None):
-        """Ejecuta el ataque básico y actualiza la animación."""
+    def cast_basic_attack(self, direction: tuple[float, float] = None) -> bool:
+        """Ejecuta el ataque básico y actualiza la animación. Retorna True si se ejecutó."""
         if self._basic_attack_cooldown <= 0:
             # Calcular el centro del jugador
             center_x = self.x + (self.width / 2)
@@ -313,9 +261,11 @@ class AnimatedPlayer(Player):
             self.is_attacking = True
             self.attack_frame = 0
             self.attack_complete = False
+            return True
+        return False
             
-    def cast_heavy_attack(self, direction: tuple[float, float] = None):
-        """Ejecuta el ataque pesado y actualiza la animación."""
+    def cast_heavy_attack(self, direction: tuple[float, float] = None) -> bool:
+        """Ejecuta el ataque pesado y actualiza la animación. Retorna True si se ejecutó."""
         if self._heavy_attack_cooldown <= 0 and self.mp >= self._heavy_attack.mp_cost:
             # Calcular el centro del jugador
             center_x = self.x + (self.width / 2)
@@ -329,4 +279,6 @@ class AnimatedPlayer(Player):
             self.is_attacking = True
             self.attack_frame = 0
             self.attack_complete = False
+            return True
+        return False
             
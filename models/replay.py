@@ -0,0 +1,161 @@
+"""Registro de la entrada de una partida y su reproducción sin pantalla.
+
+La partida es determinista dada su semilla y la entrada de cada paso, así que
+basta con guardar un byte por paso (bits INPUT_* de models.match) para volver a
+jugarla a máxima velocidad y llegar exactamente al mismo estado final. Cada
+KEYFRAME_INTERVAL pasos se guarda además una instantánea (models.snapshot), así
+que saltar a cualquier paso cuesta una restauración y menos de un intervalo de
+simulación.
+
+Formato del archivo (little-endian):
+    cabecera: firma ``AXRL``, versión (u8), pasos por segundo (u16), semilla
+    (u64), número de pasos (u32), número de keyframes (u32) y huella del estado
+    final (8 bytes).
+    entrada: tramos ``(entrada u8, repeticiones u16)``; la entrada de una
+    partida cambia pocas veces, así que ocupa mucho menos que un byte por paso.
+    keyframes: ``(paso u32, tamaño u32)`` seguido de la instantánea.
+"""
+import hashlib
+import struct
+from bisect import bisect_right
+from models.clock import Clock
+from models.match import Match, SIM_STEP, TICK_RATE
+from models.snapshot import snapshot, restore
+from services.config import CONFIG
+
+MAGIC = b"AXRL"
+VERSION = 2
+KEYFRAME_INTERVAL = CONFIG['simulation']['keyframe_interval']
+_HEADER = struct.Struct("<4sBHQII8s")
+_RUN = struct.Struct("<BH")
+_KEYFRAME = struct.Struct("<II")
+_MAX_RUN = 0xFFFF
+
+
+def state_digest(match: Match) -> bytes:
+    """Huella de 8 bytes del estado de la partida: pasos, ronda, jugador y enemigos."""
+    player = match.player
+    # Los valores numéricos como float: una partida restaurada de una instantánea
+    # tiene 100.0 donde la original aún tenía el entero 100
+    state = (
+        match.ticks, match.current_round, match.points, match.is_dead, match.has_won,
+        float(player.x), float(player.y), float(player.hp), float(player.mp),
+        [(enemy.level, float(enemy.x), float(enemy.y), float(enemy.hp), enemy.is_alive)
+         for enemy in match.enemies],
+    )
+    return hashlib.blake2b(repr(state).encode(), digest_size=8).digest()
+
+
+class InputLog:
+    def __init__(self, seed: int, tick_rate: int = TICK_RATE):
+        self.seed = seed
+        self.tick_rate = tick_rate
+        self.inputs = bytearray()  # Entrada de cada paso
+        self.keyframes = []  # (paso, instantánea al terminar ese paso), en orden
+        self.digest = bytes(8)  # Huella del estado final; se fija con ``finish``
+
+    def __len__(self) -> int:
+        return len(self.inputs)
+
+    def append(self, state: int):
+        """Registra la entrada de un paso."""
+        self.inputs.append(state)
+
+    def end_step(self, match: Match):
+        """Guarda una instantánea de ``match`` si el paso que acaba de terminar toca keyframe."""
+        if match.ticks % KEYFRAME_INTERVAL == 0:
+            self.keyframes.append((match.ticks, snapshot(match)))
+
+    def finish(self, match: Match):
+        """Guarda la huella del estado final de ``match`` para verificar la reproducción."""
+        self.digest = state_digest(match)
+
+    def to_bytes(self) -> bytes:
+        """Serializa el registro."""
+        chunks = [_HEADER.pack(MAGIC, VERSION, self.tick_rate, self.seed, len(self.inputs),
+                               len(self.keyframes), self.digest)]
+        inputs = self.inputs
+        i = 0
+        while i < len(inputs):
+            state = inputs[i]
+            run = 1
+            while i + run < len(inputs) and inputs[i + run] == state and run < _MAX_RUN:
+                run += 1
+            chunks.append(_RUN.pack(state, run))
+            i += run
+        for tick, data in self.keyframes:
+            chunks.append(_KEYFRAME.pack(tick, len(data)))
+            chunks.append(data)
+        return b"".join(chunks)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'InputLog':
+        """Reconstruye un registro serializado con ``to_bytes``."""
+        magic, version, tick_rate, seed, ticks, keyframe_count, digest = _HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError("No es un registro de partida")
+        if version != VERSION:
+            raise ValueError(f"Versión de registro no soportada: {version}")
+        log = cls(seed, tick_rate)
+        log.digest = digest
+        offset = _HEADER.size
+        while len(log.inputs) < ticks:
+            state, run = _RUN.unpack_from(data, offset)
+            offset += _RUN.size
+            log.inputs.extend(bytes((state,)) * run)
+        if len(log.inputs) != ticks:
+            raise ValueError(f"Registro corrupto: {len(log.inputs)} pasos en lugar de {ticks}")
+        for _ in range(keyframe_count):
+            tick, size = _KEYFRAME.unpack_from(data, offset)
+            offset += _KEYFRAME.size
+            log.keyframes.append((tick, data[offset:offset + size]))
+            offset += size
+        return log
+
+    def save(self, path: str):
+        with open(path, 'wb') as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str) -> 'InputLog':
+        with open(path, 'rb') as f:
+            return cls.from_bytes(f.read())
+
+
+def _check_tick_rate(log: InputLog):
+    if log.tick_rate != TICK_RATE:
+        raise ValueError(f"El registro se grabó a {log.tick_rate} pasos/s y la simulación va a {TICK_RATE}")
+
+
+def _simulate(match: Match, inputs) -> Match:
+    """Aplica la entrada de cada paso y avanza la partida hasta agotarla o que termine."""
+    for state in inputs:
+        if match.is_over:
+            break
+        match.apply_input(state)
+        match.step(SIM_STEP)
+    return match
+
+
+def play(log: InputLog) -> Match:
+    """Juega la partida registrada desde el principio, sin pantalla y tan rápido como se pueda."""
+    _check_tick_rate(log)
+    return _simulate(Match(countdown=False, clock=Clock("manual"), seed=log.seed), log.inputs)
+
+
+def seek(log: InputLog, tick: int, clock: Clock = None) -> Match:
+    """Retorna la partida registrada tal como estaba al terminar el paso ``tick``.
+
+    Restaura el último keyframe anterior o igual a ``tick`` y simula sólo los
+    pasos que faltan desde él.
+    """
+    _check_tick_rate(log)
+    tick = max(0, min(tick, len(log.inputs)))
+    index = bisect_right([keyframe_tick for keyframe_tick, _ in log.keyframes], tick)
+    if index:
+        start, data = log.keyframes[index - 1]
+        match = restore(data, clock or Clock("manual"))
+    else:
+        start = 0
+        match = Match(countdown=False, clock=clock or Clock("manual"), seed=log.seed)
+    return _simulate(match, log.inputs[start:tick])
@@ -0,0 +1,227 @@
+"""Instantáneas binarias del estado completo de una partida.
+
+Una instantánea guarda todo lo que necesita la simulación para continuar
+exactamente igual: reloj, ronda y puntos, el jugador (estadísticas, enfriamientos,
+ataques en curso y animación), cada enemigo (posición, knockback, enfriamiento y
+animación), el estado del generador aleatorio y el mapa.
+
+Formato (little-endian): cabecera ``AXSN``, versión (u8) y número de enemigos
+(u16); después registros de tamaño fijo para la partida, el jugador, sus dos
+ataques y cada enemigo; el estado del generador (625 u32 y un double); y el
+mapa, una celda por byte comprimido con zlib.
+"""
+import struct
+import zlib
+from models.clock import Clock
+from models.enemies import Enemy
+from models.match import Match
+
+MAGIC = b"AXSN"
+VERSION = 1
+
+# Estados y direcciones de animación, guardados por su índice. Añadir un nombre
+# aquí cambia el formato: hay que subir VERSION.
+NAMES = ("idle", "run", "attack1", "attack2", "initial", "attack", "death",
+         "down", "up", "left", "right", "N", "S", "E", "W", "NE", "NW", "SE", "SW", "default")
+_NAME_INDEX = {name: i for i, name in enumerate(NAMES)}
+_NO_FRAME = 0xFF  # frame_key None
+_NAN = float("nan")  # prev_x/prev_y None y gauss_next None
+
+_HEADER = struct.Struct("<4sBH")
+# ticks, reloj, ronda, enemigos restantes, muerto, ganó, puntos, cuenta regresiva activa,
+# cuenta transcurrida, acumulador, semilla, ataques pendientes, pausa, ancho, alto, versión del mapa
+_MATCH = struct.Struct("<IdHH??I?ddQB?HHI")
+# x, y, prev_x, prev_y, hp, mp, vivo, 4 flags de movimiento, enfriamientos básico/pesado,
+# última regeneración, estado, dirección, frame, timer, retardo, frame de ataque,
+# atacando, ataque completo, frame_key (estado, dirección, índice)
+_PLAYER = struct.Struct("<dddddd?????dddBBHddH??BBH")
+# en ejecución, inicio, dirección (x, y), fuente (x, y)
+_ATTACK = struct.Struct("<?ddddd")
+# nivel, x, y, prev_x, prev_y, hp, vivo, enfriamiento, knockback activo, inicio,
+# dirección (x, y), fuerza, velocidad (x, y), estado, dirección, frame, timer,
+# retardo, frame de ataque, atacando, muriendo, frame de muerte, muerto, frame_key
+_ENEMY = struct.Struct("<Bddddd?d?ddddddBBHddH??H?BBH")
+_RNG = struct.Struct("<625Id")
+
+# Celdas comprimidas del último mapa serializado: el mapa sólo cambia a través de
+# MapGrid.set_wall, que aumenta su versión, así que no hace falta recomprimirlo
+_grid_cache = (None, -1, b"")  # (mapa, versión, celdas)
+
+
+def _pack_frame_key(frame_key) -> tuple:
+    if frame_key is None:
+        return _NO_FRAME, _NO_FRAME, 0
+    state, direction, index = frame_key
+    return _NAME_INDEX[state], _NAME_INDEX[direction], index
+
+
+def _unpack_frame_key(state: int, direction: int, index: int):
+    if state == _NO_FRAME:
+        return None
+    return NAMES[state], NAMES[direction], index
+
+
+def _optional(value: float) -> float:
+    return _NAN if value is None else value
+
+
+def _from_optional(value: float):
+    return None if value != value else value
+
+
+def _pack_attack(attack) -> bytes:
+    return _ATTACK.pack(attack._is_executing, attack._start_time, *attack._direction,
+                        attack._source_x, attack._source_y)
+
+
+def _unpack_attack(attack, values: tuple):
+    attack._is_executing, attack._start_time, dx, dy, attack._source_x, attack._source_y = values
+    attack._direction = (dx, dy)
+
+
+def _pack_grid(game_map) -> bytes:
+    global _grid_cache
+    cached_map, version, cells = _grid_cache
+    if cached_map is not game_map or version != game_map.version:
+        cells = zlib.compress(b"".join(bytes(row) for row in game_map.grid), 1)
+        _grid_cache = (game_map, game_map.version, cells)
+    return cells
+
+
+def _pack_enemy(enemy: Enemy) -> bytes:
+    return _ENEMY.pack(
+        enemy.level, enemy.x, enemy.y, _optional(enemy.prev_x), _optional(enemy.prev_y), enemy.hp,
+        enemy.is_alive, enemy._current_cooldown, enemy._knockback_active, enemy._knockback_start_time,
+        *enemy._knockback_direction, enemy._knockback_force, *enemy._knockback_velocity,
+        _NAME_INDEX[enemy.state], _NAME_INDEX[enemy.direction], enemy.frame, enemy.animation_timer,
+        enemy.animation_delay, enemy.attack_frame, enemy.is_attacking, enemy.is_dying,
+        enemy.death_frame, enemy.is_dead, *_pack_frame_key(enemy.frame_key))
+
+
+def _unpack_enemy(values: tuple, clock: Clock) -> Enemy:
+    (level, x, y, prev_x, prev_y, hp, is_alive, cooldown, knockback_active, knockback_start,
+     knockback_dx, knockback_dy, knockback_force, velocity_x, velocity_y, state, direction,
+     frame, animation_timer, animation_delay, attack_frame, is_attacking, is_dying,
+     death_frame, is_dead, *frame_key) = values
+    enemy = Enemy(x, y, level, clock)
+    enemy.prev_x = _from_optional(prev_x)
+    enemy.prev_y = _from_optional(prev_y)
+    enemy.hp = hp
+    enemy.is_alive = is_alive
+    enemy._current_cooldown = cooldown
+    enemy._knockback_active = knockback_active
+    enemy._knockback_start_time = knockback_start
+    enemy._knockback_direction = (knockback_dx, knockback_dy)
+    enemy._knockback_force = knockback_force
+    enemy._knockback_velocity = (velocity_x, velocity_y)
+    enemy.state = NAMES[state]
+    enemy.direction = NAMES[direction]
+    enemy.frame = frame
+    enemy.animation_timer = animation_timer
+    enemy.animation_delay = animation_delay
+    enemy.attack_frame = attack_frame
+    enemy.is_attacking = is_attacking
+    enemy.is_dying = is_dying
+    enemy.death_frame = death_frame
+    enemy.is_dead = is_dead
+    enemy.frame_key = _unpack_frame_key(*frame_key)
+    return enemy
+
+
+def snapshot(match: Match) -> bytes:
+    """Serializa el estado completo de ``match``."""
+    player = match.player
+    game_map = match.map
+    _, rng_state, gauss_next = match.rng.getstate()
+    chunks = [
+        _HEADER.pack(MAGIC, VERSION, len(match.enemies)),
+        _MATCH.pack(
+            match.ticks, match.clock.now, match.current_round, match.enemies_remaining,
+            match.is_dead, match.has_won, match.points, match.countdown_active,
+            match.countdown_elapsed, match.sim_accumulator, match.seed, match._casts,
+            match.is_paused, game_map.width, game_map.height, game_map.version),
+        _PLAYER.pack(
+            player.x, player.y, _optional(player.prev_x), _optional(player.prev_y), player.hp, player.mp,
+            player.is_alive, player.move_up, player.move_down, player.move_left, player.move_right,
+            player._basic_attack_cooldown, player._heavy_attack_cooldown, player._last_regen_time,
+            _NAME_INDEX[player.state], _NAME_INDEX[player.direction], player.frame,
+            player.animation_timer, player.animation_delay, player.attack_frame,
+            player.is_attacking, player.attack_complete, *_pack_frame_key(player.frame_key)),
+        _pack_attack(player._basic_attack),
+        _pack_attack(player._heavy_attack),
+    ]
+    chunks.extend(_pack_enemy(enemy) for enemy in match.enemies)
+    chunks.append(_RNG.pack(*rng_state, _optional(gauss_next)))
+    chunks.append(_pack_grid(game_map))
+    return b"".join(chunks)
+
+
+def restore(data: bytes, clock: Clock = None) -> Match:
+    """Reconstruye una partida desde una instantánea.
+
+    Args:
+        data (bytes): Instantánea creada con ``snapshot``
+        clock (Clock): Reloj de la partida restaurada (se pone en el tiempo guardado); por defecto, en tiempo real
+    """
+    magic, version, enemy_count = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("No es una instantánea de partida")
+    if version != VERSION:
+        raise ValueError(f"Versión de instantánea no soportada: {version}")
+    offset = _HEADER.size
+    (ticks, now, current_round, enemies_remaining, is_dead, has_won, points, countdown_active,
+     countdown_elapsed, sim_accumulator, seed, casts, is_paused, width, height,
+     map_version) = _MATCH.unpack_from(data, offset)
+    offset += _MATCH.size
+
+    clock = clock or Clock()
+    match = Match(countdown=countdown_active, clock=clock, seed=seed)
+    clock.now = now
+    match.ticks = ticks
+    match.current_round = current_round
+    match.enemies_remaining = enemies_remaining
+    match.is_dead = is_dead
+    match.has_won = has_won
+    match.points = points
+    match.countdown_elapsed = countdown_elapsed
+    match.sim_accumulator = sim_accumulator
+    match._casts = casts
+    match.is_paused = is_paused
+
+    player = match.player
+    (player.x, player.y, prev_x, prev_y, player.hp, player.mp, player.is_alive,
+     player.move_up, player.move_down, player.move_left, player.move_right,
+     player._basic_attack_cooldown, player._heavy_attack_cooldown, player._last_regen_time,
+     state, direction, player.frame, player.animation_timer, player.animation_delay,
+     player.attack_frame, player.is_attacking, player.attack_complete,
+     *frame_key) = _PLAYER.unpack_from(data, offset)
+    offset += _PLAYER.size
+    player.prev_x = _from_optional(prev_x)
+    player.prev_y = _from_optional(prev_y)
+    player.state = NAMES[state]
+    player.direction = NAMES[direction]
+    player.frame_key = _unpack_frame_key(*frame_key)
+    for attack in (player._basic_attack, player._heavy_attack):
+        _unpack_attack(attack, _ATTACK.unpack_from(data, offset))
+        offset += _ATTACK.size
+
+    # Los enemigos se reemplazan en la misma lista, que comparten la vista y la partida
+    enemies = []
+    for _ in range(enemy_count):
+        enemy = _unpack_enemy(_ENEMY.unpack_from(data, offset), clock)
+        enemy._death_complete_callback = match._on_enemy_death_complete
+        enemies.append(enemy)
+        offset += _ENEMY.size
+    match.enemies[:] = enemies
+
+    *rng_state, gauss_next = _RNG.unpack_from(data, offset)
+    offset += _RNG.size
+    match.rng.setstate((3, tuple(rng_state), _from_optional(gauss_next)))
+
+    cells = zlib.decompress(data[offset:])
+    game_map = match.map
+    if (game_map.width, game_map.height) != (width, height):
+        raise ValueError(f"La instantánea es de un mapa de {width}x{height}")
+    game_map.grid = [[bool(cell) for cell in cells[y * width:(y + 1) * width]] for y in range(height)]
+    game_map.version = map_version
+    return match
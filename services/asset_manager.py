@@ -1,14 +1,64 @@
-
 """Carga y cacheo de recursos.
 
-Placeholder para Hito 1: sin sprites todavía.
+Mantiene una única copia de cada superficie por proceso, indexada por ruta y
+modo de conversión. Las superficies devueltas se comparten entre todas las
+entidades, por lo que deben tratarse como inmutables: sólo se leen o se
+recortan con ``subsurface``, nunca se dibuja sobre ellas. La carga es segura
+entre hilos, de modo que el Preloader puede decodificar en segundo plano.
 """
+import threading
+import pygame
+
+
 class AssetManager:
     _cache = {}
+    _hits = 0
+    _misses = 0
+    _lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: str, alpha: bool = True) -> pygame.Surface:
+        """Retorna la superficie de ``path``, decodificándola sólo la primera vez."""
+        key = (path, alpha)
+        surface = cls._cache.get(key)
+        if surface is not None:
+            cls._hits += 1
+            return surface
+
+        with cls._lock:
+            # Otro hilo pudo haberla cargado mientras se esperaba el lock
+            surface = cls._cache.get(key)
+            if surface is not None:
+                cls._hits += 1
+                return surface
+            cls._misses += 1
+            surface = pygame.image.load(path)
+            # convert/convert_alpha requieren una ventana creada
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert_alpha() if alpha else surface.convert()
+            cls._cache[key] = surface
+        return surface
+
+    @classmethod
+    def stats(cls) -> dict:
+        """Retorna aciertos, fallos, entradas y bytes ocupados por la caché."""
+        return {
+            "hits": cls._hits,
+            "misses": cls._misses,
+            "entries": len(cls._cache),
+            "bytes": sum(s.get_width() * s.get_height() * s.get_bytesize() for s in cls._cache.values()),
+        }
+
+    @classmethod
+    def forget(cls, path: str):
+        """Descarta las superficies de ``path`` para que la próxima carga lea el disco."""
+        with cls._lock:
+            for alpha in (True, False):
+                cls._cache.pop((path, alpha), None)
 
     @classmethod
-    def load(cls, path: str):
-        if path not in cls._cache:
-            # Aquí se cargaría con pygame.image.load(path)
-            cls._cache[path] = None
-        return cls._cache[path]
+    def clear(cls):
+        """Vacía la caché y reinicia los contadores."""
+        cls._cache.clear()
+        cls._hits = 0
+        cls._misses = 0
@@ -0,0 +1,227 @@
+"""Atlas de texturas de los personajes.
+
+Empaqueta todos los frames definidos en ``assets/sprites.yaml`` en una o pocas
+páginas de atlas y escribe un manifiesto JSON con el nombre y el rectángulo de
+cada frame. En tiempo de ejecución cada página se decodifica una sola vez y las
+animaciones de jugador y enemigos leen sus tablas de frames del manifiesto.
+
+El manifiesto guarda un hash de ``sprites.yaml`` y de las hojas que lista;
+``Atlas.refresh`` lo compara con el de los archivos actuales y regenera el atlas
+si alguno cambió. Para no leer ni analizar las fuentes en cada arranque, su
+fecha de modificación y tamaño se guardan en ``cache/`` junto con el hash, que
+sólo se recalcula cuando alguno cambia. También puede regenerarse a mano:
+
+    python -m services.atlas
+"""
+import hashlib
+import json
+import os
+import threading
+import pygame
+import yaml
+from services.config import ROOT_DIR
+from services.asset_manager import AssetManager
+from services.atlas_manifest import AtlasManifest, ATLAS_DIR, ATLAS_NAME, MANIFEST_PATH, MANIFEST_VERSION
+
+SPEC_PATH = os.path.join(ROOT_DIR, 'assets', 'sprites.yaml')
+SOURCES_PATH = os.path.join(ROOT_DIR, 'cache', 'atlas_sources.json')  # Hash de las fuentes y sus stat
+PAGE_SIZE = 4096  # Tamaño máximo (ancho y alto) de cada página
+PADDING = 1  # Separación entre frames para evitar sangrado al escalar
+
+
+def frame_name(character: str, state: str, direction: str, index: int) -> str:
+    """Nombre de un frame dentro del manifiesto."""
+    return f"{character}/{state}/{direction}/{index}"
+
+
+def _pack(sizes: list) -> tuple[list, list]:
+    """Ubica rectángulos en estanterías ordenadas por altura.
+
+    Retorna la posición ``(página, x, y)`` de cada tamaño y el tamaño usado de
+    cada página.
+    """
+    order = sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0]))
+    placements = [None] * len(sizes)
+    page_sizes = []
+    page = x = y = shelf_height = used_width = 0
+
+    for i in order:
+        width = sizes[i][0] + PADDING
+        height = sizes[i][1] + PADDING
+        # Nueva estantería si no cabe a lo ancho
+        if x + width > PAGE_SIZE:
+            y += shelf_height
+            x = shelf_height = 0
+        # Nueva página si no cabe a lo alto
+        if y + height > PAGE_SIZE:
+            page_sizes.append((used_width, y))
+            page += 1
+            x = y = shelf_height = used_width = 0
+        placements[i] = (page, x, y)
+        x += width
+        shelf_height = max(shelf_height, height)
+        used_width = max(used_width, x)
+
+    page_sizes.append((used_width, y + shelf_height))
+    return placements, page_sizes
+
+
+def _source_files(spec_path: str, spec_bytes: bytes) -> list:
+    """``spec_path`` y las hojas de sprites que lista, como rutas absolutas."""
+    spec = yaml.safe_load(spec_bytes)
+    sheet_paths = {entry['sheet'] for states in spec.values()
+                   for directions in states.values() for entry in directions.values()}
+    return [spec_path] + [os.path.join(ROOT_DIR, sheet_path) for sheet_path in sorted(sheet_paths)]
+
+
+def _stats(paths) -> dict:
+    """``ruta -> [mtime en ns, tamaño]`` de cada archivo."""
+    stats = {}
+    for path in paths:
+        stat = os.stat(path)
+        stats[path] = [stat.st_mtime_ns, stat.st_size]
+    return stats
+
+
+def _hash_sources(files: list, spec_bytes: bytes) -> str:
+    """Hash del contenido de ``files`` (la especificación, ya leída, y sus hojas)."""
+    digest = hashlib.sha256()
+    digest.update(spec_bytes)
+    for path in files[1:]:
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def source_hash(spec_path: str = SPEC_PATH) -> str:
+    """Hash de ``spec_path`` y de todas las hojas de sprites que lista."""
+    with open(spec_path, 'rb') as f:
+        spec_bytes = f.read()
+    return _hash_sources(_source_files(spec_path, spec_bytes), spec_bytes)
+
+
+def cached_source_hash(spec_path: str = SPEC_PATH) -> str:
+    """``source_hash`` sin leer las fuentes si su fecha y tamaño no cambiaron.
+
+    Analizar ``sprites.yaml`` y leer todas las hojas cuesta decenas de ms; con
+    las fuentes intactas basta un ``stat`` de cada una.
+    """
+    try:
+        with open(SOURCES_PATH, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached["spec"] == spec_path and _stats(cached["stats"]) == cached["stats"]:
+            return cached["hash"]
+    except (OSError, ValueError, KeyError):
+        pass  # Sin registro, corrupto o con alguna fuente borrada: recalcular
+
+    with open(spec_path, 'rb') as f:
+        spec_bytes = f.read()
+    # Los stat se toman antes del hash: si una fuente cambia mientras tanto, el próximo arranque lo recalcula
+    files = _source_files(spec_path, spec_bytes)
+    stats = _stats(files)
+    digest = _hash_sources(files, spec_bytes)
+    os.makedirs(os.path.dirname(SOURCES_PATH), exist_ok=True)
+    with open(SOURCES_PATH, 'w', encoding='utf-8') as f:
+        json.dump({"spec": spec_path, "stats": stats, "hash": digest}, f)
+    return digest
+
+
+def build_atlas(spec_path: str = SPEC_PATH, out_dir: str = ATLAS_DIR, name: str = ATLAS_NAME) -> dict:
+    """Empaqueta los frames de ``spec_path`` y escribe las páginas y el manifiesto."""
+    with open(spec_path, 'r', encoding='utf-8') as f:
+        spec = yaml.safe_load(f)
+
+    sheets = {}
+    crops = []  # (nombre, superficie recortada)
+    animations = {}
+    for character, states in spec.items():
+        animations[character] = {}
+        for state, directions in states.items():
+            animations[character][state] = {}
+            for direction, entry in directions.items():
+                sheet_path = entry['sheet']
+                if sheet_path not in sheets:
+                    sheets[sheet_path] = pygame.image.load(os.path.join(ROOT_DIR, sheet_path))
+                names = []
+                for i, rect in enumerate(entry['frames']):
+                    names.append(frame_name(character, state, direction, i))
+                    crops.append((names[-1], sheets[sheet_path].subsurface(pygame.Rect(rect))))
+                animations[character][state][direction] = names
+
+    placements, page_sizes = _pack([crop.get_size() for _, crop in crops])
+    pages = [pygame.Surface(size, pygame.SRCALPHA) for size in page_sizes]
+    frames = {}
+    for (name_, crop), (page, x, y) in zip(crops, placements):
+        pages[page].blit(crop, (x, y))
+        frames[name_] = [page, x, y, crop.get_width(), crop.get_height()]
+
+    os.makedirs(out_dir, exist_ok=True)
+    page_files = []
+    for i, page in enumerate(pages):
+        page_files.append(f"{name}_{i}.png")
+        pygame.image.save(page, os.path.join(out_dir, page_files[-1]))
+
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "source_hash": source_hash(spec_path),
+        "pages": page_files,
+        "frames": frames,
+        "animations": animations,
+    }
+    with open(os.path.join(out_dir, f"{name}.json"), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=1)
+    return manifest
+
+
+class Atlas:
+    """Acceso en tiempo de ejecución al atlas empaquetado."""
+    _refresh_lock = threading.Lock()  # Los frames de enemigos y jugador se precargan en hilos distintos
+    _refreshed = False  # Las fuentes ya se comprobaron en este proceso
+
+    @classmethod
+    def manifest(cls) -> dict:
+        """Retorna el manifiesto, leyéndolo del disco la primera vez."""
+        return AtlasManifest.load()
+
+    @classmethod
+    def animations(cls, character: str) -> dict:
+        """Tabla ``estado -> dirección -> [nombres de frame]`` de un personaje."""
+        return AtlasManifest.animations(character)
+
+    @classmethod
+    def refresh(cls) -> bool:
+        """Regenera el atlas si ``sprites.yaml`` o sus hojas cambiaron desde que se generó.
+
+        Sólo comprueba la primera vez en cada proceso.
+
+        Returns:
+            bool: True si hubo que regenerarlo
+        """
+        with cls._refresh_lock:
+            if cls._refreshed:
+                return False
+            stale = not (os.path.exists(MANIFEST_PATH)
+                         and cls.manifest().get("source_hash") == cached_source_hash())
+            if stale:
+                print("Regenerando atlas de personajes...")
+                old_pages = cls.manifest()["pages"] if os.path.exists(MANIFEST_PATH) else []
+                manifest = build_atlas()
+                # Descartar el manifiesto y las páginas ya cargados para leer los nuevos
+                AtlasManifest.clear()
+                for page in set(old_pages) | set(manifest["pages"]):
+                    AssetManager.forget(os.path.join(ATLAS_DIR, page))
+            cls._refreshed = True
+            return stale
+
+    @classmethod
+    def frame(cls, name: str) -> pygame.Surface:
+        """Retorna el frame ``name`` como subsuperficie de su página."""
+        manifest = cls.manifest()
+        page, x, y, width, height = manifest["frames"][name]
+        page_surface = AssetManager.load(os.path.join(ATLAS_DIR, manifest["pages"][page]))
+        return page_surface.subsurface(pygame.Rect(x, y, width, height))
+
+
+if __name__ == "__main__":
+    result = build_atlas()
+    print(f"Atlas generado: {len(result['frames'])} frames en {len(result['pages'])} página(s) -> {ATLAS_DIR}")
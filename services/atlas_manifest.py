@@ -0,0 +1,43 @@
+"""Manifiesto del atlas de personajes, sin pygame.
+
+La simulación sólo necesita las tablas de animación (cuántos frames tiene
+cada estado y dirección) para avanzar sus máquinas de estados; las lee del
+manifiesto JSON que escribe ``services.atlas`` sin cargar ninguna imagen.
+"""
+import json
+import os
+from services.config import ROOT_DIR
+
+ATLAS_DIR = os.path.join(ROOT_DIR, 'assets', 'atlas')
+ATLAS_NAME = "characters"
+MANIFEST_PATH = os.path.join(ATLAS_DIR, f"{ATLAS_NAME}.json")
+MANIFEST_VERSION = 1
+
+
+class AtlasManifest:
+    _manifest = None
+
+    @classmethod
+    def load(cls) -> dict:
+        """Retorna el manifiesto, leyéndolo del disco la primera vez."""
+        if cls._manifest is None:
+            try:
+                with open(MANIFEST_PATH, 'r', encoding='utf-8') as f:
+                    manifest = json.load(f)
+            except FileNotFoundError:
+                print(f"Error: No se encontró '{MANIFEST_PATH}'. Ejecuta 'python -m services.atlas'.")
+                raise
+            if manifest.get("version") != MANIFEST_VERSION:
+                raise ValueError(f"Versión de manifiesto no soportada: {manifest.get('version')}")
+            cls._manifest = manifest
+        return cls._manifest
+
+    @classmethod
+    def clear(cls):
+        """Descarta el manifiesto leído para que la próxima consulta lo lea de nuevo."""
+        cls._manifest = None
+
+    @classmethod
+    def animations(cls, character: str) -> dict:
+        """Tabla ``estado -> dirección -> [nombres de frame]`` de un personaje."""
+        return cls.load()["animations"][character]
@@ -1,49 +1,186 @@
-import pygame
-from services.config import CONFIG
-
-class AudioManager:
-    _instance = None
-
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(AudioManager, cls).__new__(cls)
-            cls._instance._initialize()
-        return cls._instance
-
-    def _initialize(self):
-        """Inicializa el sistema de audio."""
-        pygame.mixer.init()
-        self.menu_music = pygame.mixer.Sound("sound/menu.mp3")
-        self.coliseo_music = pygame.mixer.Sound("sound/coliseo.mp3")
-        self.attack_sound = pygame.mixer.Sound("sound/ataque.mp3")
-        
-        # Configurar volúmenes
-        self.menu_music.set_volume(0.7)  # 70% del volumen máximo
-        self.coliseo_music.set_volume(0.4)  # 40% del volumen máximo
-        self.attack_sound.set_volume(0.8)  # 80% del volumen máximo
-
-    def play_menu_music(self):
-        """Reproduce la música del menú."""
-        self.stop_all()
-        self.menu_music.play(-1)  # -1 para reproducir en loop
-
-    def play_coliseo_music(self):
-        """Reproduce la música del coliseo."""
-        self.stop_all()
-        self.coliseo_music.play(-1)  # -1 para reproducir en loop
-
-    def play_attack_sound(self):
-        """Reproduce el sonido de ataque."""
-        self.attack_sound.play()
-
-    def stop_all(self):
-        """Detiene todos los sonidos."""
-        pygame.mixer.stop()
-
-    def pause_all(self):
-        """Pausa todos los sonidos."""
-        pygame.mixer.pause()
-
-    def unpause_all(self):
-        """Reanuda todos los sonidos."""
-        pygame.mixer.unpause() 
\ No newline at end of file
+import time
+import pygame
+from services.config import CONFIG
+
+# Pistas de música, reproducidas en streaming con pygame.mixer.music: nombre -> (ruta, volumen)
+MUSIC = {
+    "menu": ("sound/menu.mp3", 0.7),  # 70% del volumen máximo
+    "coliseo": ("sound/coliseo.mp3", 0.4),  # 40% del volumen máximo
+}
+
+# Efectos cortos, decodificados completos en memoria: atributo -> (ruta, volumen)
+SOUNDS = {
+    "attack_sound": ("sound/ataque.mp3", 0.8),  # 80% del volumen máximo
+}
+
+# Límites de voz de cada efecto: atributo -> (voces simultáneas, segundos entre disparos, prioridad)
+VOICE_LIMITS = {
+    "attack_sound": (2, 0.1, 1),
+}
+
+CROSSFADE_MS = CONFIG['audio']['crossfade_ms']
+
+class VoiceManager:
+    """Reparte un conjunto de canales reservados entre los efectos de sonido.
+
+    Cada efecto tiene un máximo de voces simultáneas y un intervalo mínimo
+    entre disparos. Si no hay canal libre, se roba el de la voz más antigua
+    con prioridad menor o igual; si no existe, el disparo se descarta.
+    """
+    def __init__(self, channels: int):
+        if pygame.mixer.get_num_channels() < channels:
+            pygame.mixer.set_num_channels(channels)
+        pygame.mixer.set_reserved(channels)
+        self.channels = [pygame.mixer.Channel(i) for i in range(channels)]
+        self._voices = [None] * channels  # (efecto, prioridad, inicio) de cada canal
+        self._last_played = {}
+        self.played = 0
+        self.dropped = 0
+        self.stolen = 0
+
+    def play(self, name: str, sound: pygame.mixer.Sound, max_voices: int, min_interval: float, priority: int) -> bool:
+        """Reproduce ``sound`` respetando sus límites. Retorna False si se descartó."""
+        now = time.perf_counter()
+        if now - self._last_played.get(name, float("-inf")) < min_interval:
+            self.dropped += 1
+            return False
+
+        # Olvidar las voces que ya terminaron
+        for i, channel in enumerate(self.channels):
+            if self._voices[i] is not None and not channel.get_busy():
+                self._voices[i] = None
+
+        same_sound = [i for i, voice in enumerate(self._voices) if voice and voice[0] == name]
+        if len(same_sound) >= max_voices:
+            # Reutilizar la voz más antigua del mismo efecto
+            index = min(same_sound, key=lambda i: self._voices[i][2])
+        elif None in self._voices:
+            index = self._voices.index(None)
+        else:
+            candidates = [i for i, voice in enumerate(self._voices) if voice[1] <= priority]
+            if not candidates:
+                self.dropped += 1
+                return False
+            index = min(candidates, key=lambda i: (self._voices[i][1], self._voices[i][2]))
+
+        if self._voices[index] is not None:
+            self.channels[index].stop()
+            self.stolen += 1
+        self.channels[index].play(sound)
+        self._voices[index] = (name, priority, now)
+        self._last_played[name] = now
+        self.played += 1
+        return True
+
+    def stats(self) -> dict:
+        """Retorna voces reproducidas, descartadas y robadas."""
+        return {"played": self.played, "dropped": self.dropped, "stolen": self.stolen}
+
+class AudioManager:
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(AudioManager, cls).__new__(cls)
+            cls._instance._initialize()
+        return cls._instance
+
+    def _initialize(self):
+        """Inicializa el sistema de audio.
+
+        Los efectos se decodifican aparte con ``load_sound`` (normalmente desde
+        el Preloader); mientras no estén cargados, reproducirlos no hace nada.
+        La música no se decodifica: se lee del disco mientras suena.
+        """
+        pygame.mixer.init()
+        self.voices = VoiceManager(CONFIG['audio']['sfx_channels'])
+        self.attack_sound = None
+        self._current_music = None
+        self._pending_music = None
+        self._paused = False
+
+    def load_sound(self, name: str) -> pygame.mixer.Sound:
+        """Decodifica el efecto ``name`` de SOUNDS. Puede llamarse desde un hilo."""
+        path, volume = SOUNDS[name]
+        sound = pygame.mixer.Sound(path)
+        sound.set_volume(volume)
+        setattr(self, name, sound)
+        return sound
+
+    def play_music(self, name: str):
+        """Cambia a la pista ``name`` con un fundido entre la actual y la nueva.
+
+        pygame.mixer.music sólo tiene un stream, así que el fundido es en dos
+        mitades: la pista actual se desvanece y, cuando termina, ``update``
+        arranca la nueva con un fundido de entrada.
+        """
+        if name == self._current_music:
+            return
+        self._current_music = name
+        self._pending_music = name
+
+        if self._paused:
+            # Cambiar de pista desde la pausa: cortar sin fundido
+            pygame.mixer.music.stop()
+            pygame.mixer.unpause()
+            self._paused = False
+        elif pygame.mixer.music.get_busy():
+            pygame.mixer.music.fadeout(CROSSFADE_MS // 2)
+        self.update()
+
+    def update(self):
+        """Arranca la pista pendiente cuando termina el fundido de salida."""
+        if self._pending_music is None or pygame.mixer.music.get_busy():
+            return
+
+        path, volume = MUSIC[self._pending_music]
+        self._pending_music = None
+        try:
+            pygame.mixer.music.load(path)
+        except (pygame.error, FileNotFoundError) as e:
+            print(f"Advertencia: No se pudo cargar la música '{path}': {e}")
+            return
+        pygame.mixer.music.set_volume(volume)
+        pygame.mixer.music.play(-1, fade_ms=CROSSFADE_MS // 2)  # -1 para reproducir en loop
+
+    def has_pending_music(self) -> bool:
+        """True si hay una pista esperando a que termine el fundido de salida."""
+        return self._pending_music is not None
+
+    def play_menu_music(self):
+        """Reproduce la música del menú."""
+        self.play_music("menu")
+
+    def play_coliseo_music(self):
+        """Reproduce la música del coliseo."""
+        self.play_music("coliseo")
+
+    def play_sound(self, name: str) -> bool:
+        """Reproduce el efecto ``name`` a través del VoiceManager."""
+        sound = getattr(self, name)
+        if sound is None:
+            return False
+        return self.voices.play(name, sound, *VOICE_LIMITS[name])
+
+    def play_attack_sound(self):
+        """Reproduce el sonido de ataque."""
+        self.play_sound("attack_sound")
+
+    def stop_all(self):
+        """Detiene todos los sonidos."""
+        pygame.mixer.stop()
+        pygame.mixer.music.stop()
+        self._current_music = None
+        self._pending_music = None
+
+    def pause_all(self):
+        """Pausa todos los sonidos."""
+        pygame.mixer.pause()
+        pygame.mixer.music.pause()
+        self._paused = True
+
+    def unpause_all(self):
+        """Reanuda todos los sonidos."""
+        pygame.mixer.unpause()
+        pygame.mixer.music.unpause()
+        self._paused = False
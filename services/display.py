@@ -0,0 +1,116 @@
+"""Ventana y superficie lógica de dibujo.
+
+Todas las vistas dibujan sobre una superficie de resolución lógica fija
+(``window.width`` × ``window.height``). ``window.scaling`` decide cómo llega a
+la ventana:
+
+- ``none``: la superficie lógica es la propia ventana, del mismo tamaño.
+- ``sdl``: ventana ``pygame.SCALED``; SDL escala la superficie lógica en la
+  GPU y traduce solo las coordenadas del ratón.
+- ``software``: la escena se dibuja en un búfer fuera de pantalla que se
+  escala una vez por frame al tamaño actual de la ventana; las coordenadas del
+  ratón se traducen aquí.
+
+En los modos con escalado el costo de dibujar la escena no depende del tamaño
+de la ventana: sólo el paso de escalado lo hace.
+
+Con ``render.backend: texture`` la ventana la abre un ``TextureBackend`` que
+presenta con un ``Renderer`` de SDL y escala por sí mismo; ``window.scaling``
+no aplica.
+"""
+import pygame
+from services.config import CONFIG
+from services.render_backend import TextureBackend
+
+SCALING_MODES = ("none", "sdl", "software")
+
+
+class Display:
+    _mode = "none"
+    _window = None  # Superficie de la ventana
+    _surface = None  # Superficie lógica sobre la que dibujan las vistas
+    backend = None  # TextureBackend activo, o None si se presenta con pygame.display
+
+    @classmethod
+    def create(cls) -> pygame.Surface:
+        """Abre la ventana según ``window`` en config.yaml y retorna la superficie lógica."""
+        window = CONFIG['window']
+        logical_size = (window['width'], window['height'])
+        mode = window['scaling']
+        if mode not in SCALING_MODES:
+            print(f"Advertencia: modo de escalado '{mode}' desconocido, se usa 'none'")
+            mode = "none"
+        fullscreen = pygame.FULLSCREEN if window['fullscreen'] else 0
+
+        if CONFIG['render']['backend'] == "texture":
+            # Ventana oculta sólo para que convert() y convert_alpha() tengan un formato de píxel
+            cls._window = pygame.display.set_mode((1, 1), pygame.HIDDEN)
+            cls.backend = TextureBackend(window['title'], logical_size, tuple(window['window_size']),
+                                         window['fullscreen'], CONFIG['render']['renderer'])
+            cls._surface = pygame.Surface(logical_size).convert()
+            mode = "texture"
+        elif mode == "sdl":
+            cls._window = pygame.display.set_mode(logical_size, pygame.SCALED | pygame.RESIZABLE | fullscreen)
+            cls._surface = cls._window
+        elif mode == "software":
+            window_size = (0, 0) if fullscreen else tuple(window['window_size'])
+            cls._window = pygame.display.set_mode(window_size, pygame.RESIZABLE | fullscreen)
+            cls._surface = pygame.Surface(logical_size).convert(cls._window)
+        else:
+            cls._window = pygame.display.set_mode(logical_size, fullscreen)
+            cls._surface = cls._window
+        cls._mode = mode
+        return cls._surface
+
+    @classmethod
+    def _scaled(cls) -> bool:
+        """True si hay que escalar el búfer lógico a mano para presentarlo."""
+        return cls._mode == "software" and cls._window.get_size() != cls._surface.get_size()
+
+    @classmethod
+    def present(cls, rects: list = None):
+        """Presenta el frame: completo si ``rects`` es None, o sólo esos rectángulos lógicos."""
+        if cls.backend is not None:
+            cls.backend.present(cls._surface, rects)
+            return
+        if cls._mode == "software":
+            # La ventana puede haber cambiado de tamaño
+            cls._window = pygame.display.get_surface()
+            if cls._scaled():
+                # Un único paso de escalado del frame completo
+                pygame.transform.scale(cls._surface, cls._window.get_size(), cls._window)
+                pygame.display.flip()
+                return
+            if rects is None:
+                cls._window.blit(cls._surface, (0, 0))
+            else:
+                for rect in rects:
+                    cls._window.blit(cls._surface, rect, rect)
+        if rects is None:
+            pygame.display.flip()
+        elif rects:
+            pygame.display.update(rects)
+
+    @classmethod
+    def to_logical(cls, pos: tuple) -> tuple:
+        """Traduce una posición de la ventana a coordenadas de la superficie lógica."""
+        if not cls._scaled():
+            return pos
+        window_width, window_height = cls._window.get_size()
+        width, height = cls._surface.get_size()
+        return (pos[0] * width // window_width, pos[1] * height // window_height)
+
+    @classmethod
+    def mouse_pos(cls) -> tuple:
+        """Posición actual del ratón en coordenadas lógicas."""
+        if cls.backend is not None:
+            # pygame.mouse.get_pos no pasa por la escala del Renderer
+            return cls.backend.to_logical(pygame.mouse.get_pos())
+        return cls.to_logical(pygame.mouse.get_pos())
+
+    @classmethod
+    def map_event(cls, event: pygame.event.Event) -> pygame.event.Event:
+        """Lleva a coordenadas lógicas la posición de los eventos de ratón."""
+        if event.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION):
+            event.pos = cls.to_logical(event.pos)
+        return event
@@ -0,0 +1,166 @@
+"""Caché horneado de frames finales.
+
+Cada grupo de frames (enemigos, jugador) se describe como una lista de
+especificaciones ``(clave, frame del atlas, tamaño, tinte)``. El horneado
+recorta, escala y tiñe todos los frames en paralelo con un pool de procesos y
+los escribe como BGRA crudo en un único archivo ``cache/<grupo>.frames`` junto
+con un índice. En tiempo de ejecución el archivo se abre con ``mmap`` y cada
+frame es una superficie creada con ``pygame.image.frombuffer`` sobre el mapa,
+sin copiar píxeles. El orden BGRA coincide con las máscaras de la pantalla
+(rojo en 0xff0000), así que los blits no pasan por la conversión píxel a píxel
+de SDL.
+
+El índice guarda un hash del contenido de las especificaciones y del atlas
+(manifiesto y páginas PNG); si cualquiera cambia, el caché se vuelve a hornear
+automáticamente al cargarlo. Antes de comparar se llama a ``Atlas.refresh``, que
+regenera el atlas si cambiaron ``assets/sprites.yaml`` o las hojas que lista; el
+hash de esas fuentes queda en el manifiesto y, por tanto, también en el del caché.
+"""
+import hashlib
+import json
+import mmap
+import multiprocessing
+import os
+import struct
+from concurrent.futures import ProcessPoolExecutor
+import pygame
+from services.config import CONFIG, ROOT_DIR
+from services.atlas import Atlas, ATLAS_DIR, MANIFEST_PATH
+
+CACHE_DIR = os.path.join(ROOT_DIR, 'cache')
+CACHE_MAGIC = b"AXFC"
+CACHE_VERSION = 2
+_HEADER = struct.Struct("<4sII")  # magia, versión, longitud del índice
+_ALIGNMENT = 16
+PIXEL_FORMAT = "BGRA"  # Mismo orden que la superficie de la pantalla
+
+
+def tint_surface(surface: pygame.Surface, color: tuple) -> pygame.Surface:
+    """Retorna una copia de ``surface`` multiplicada por ``color`` (RGBA)."""
+    tint = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+    tint.fill(color)
+    result = surface.copy()
+    result.blit(tint, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+    return result
+
+
+def render_frame(name: str, size: tuple, tint: tuple = None) -> pygame.Surface:
+    """Recorta un frame del atlas, lo escala a ``size`` y le aplica el tinte."""
+    frame = pygame.transform.scale(Atlas.frame(name), size)
+    if tint is not None:
+        frame = tint_surface(frame, tint)
+    return frame
+
+
+def _render_chunk(specs: list) -> list:
+    """Trabajo de un proceso del pool: píxeles BGRA de cada especificación."""
+    return [pygame.image.tostring(render_frame(name, size, tint), PIXEL_FORMAT) for _, name, size, tint in specs]
+
+
+def _content_hash(specs: list) -> str:
+    """Hash de las especificaciones y de los archivos del atlas de los que salen.
+
+    El manifiesto incluye el hash de ``sprites.yaml`` y de las hojas de origen.
+    """
+    digest = hashlib.sha256()
+    digest.update(f"{CACHE_VERSION}".encode())
+    digest.update(json.dumps(specs).encode())
+    with open(MANIFEST_PATH, 'rb') as f:
+        manifest_bytes = f.read()
+    digest.update(manifest_bytes)
+    for page in json.loads(manifest_bytes)["pages"]:
+        with open(os.path.join(ATLAS_DIR, page), 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+class FrameCache:
+    """Acceso a los archivos de frames horneados, abiertos con mmap."""
+    _maps = {}  # grupo -> (mmap, índice)
+
+    @staticmethod
+    def path(group: str) -> str:
+        return os.path.join(CACHE_DIR, f"{group}.frames")
+
+    @classmethod
+    def bake(cls, group: str, specs: list, workers: int = None) -> str:
+        """Hornea los frames de ``specs`` en ``cache/<grupo>.frames``."""
+        Atlas.refresh()
+        specs = [(key, name, tuple(size), tuple(tint) if tint else None) for key, name, size, tint in specs]
+        workers = workers or CONFIG['assets']['bake_workers'] or os.cpu_count() or 1
+        chunk_size = max(1, -(-len(specs) // workers))
+        chunks = [specs[i:i + chunk_size] for i in range(0, len(specs), chunk_size)]
+        # spawn: el horneado se lanza desde hilos del Preloader con otros hilos (audio, precarga)
+        # en marcha, y hacer fork de un proceso con hilos puede bloquear a los hijos
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+            pixels = [data for chunk in pool.map(_render_chunk, chunks) for data in chunk]
+
+        frames = {}
+        offset = 0
+        for (key, _, size, _), data in zip(specs, pixels):
+            frames[key] = [offset, size[0], size[1]]
+            offset += len(data)
+        index = json.dumps({"hash": _content_hash(specs), "frames": frames}).encode('utf-8')
+        data_start = -(-(_HEADER.size + len(index)) // _ALIGNMENT) * _ALIGNMENT
+
+        # Liberar el mapa anterior antes de sobrescribir el archivo
+        cls._maps.pop(group, None)
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        path = cls.path(group)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(_HEADER.pack(CACHE_MAGIC, CACHE_VERSION, len(index)))
+            f.write(index)
+            f.write(b"\0" * (data_start - _HEADER.size - len(index)))
+            for data in pixels:
+                f.write(data)
+        os.replace(tmp_path, path)
+        return path
+
+    @classmethod
+    def _open(cls, group: str):
+        """Abre el archivo del grupo con mmap; retorna ``(mmap, índice)`` o None."""
+        try:
+            with open(cls.path(group), 'rb') as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (FileNotFoundError, ValueError):
+            return None
+        magic, version, index_length = _HEADER.unpack_from(mapped, 0)
+        if magic != CACHE_MAGIC or version != CACHE_VERSION:
+            mapped.close()
+            return None
+        index = json.loads(mapped[_HEADER.size:_HEADER.size + index_length])
+        index["data_start"] = -(-(_HEADER.size + index_length) // _ALIGNMENT) * _ALIGNMENT
+        return mapped, index
+
+    @classmethod
+    def load(cls, group: str, specs: list) -> dict:
+        """Retorna ``clave -> Surface`` para ``specs``, en el mismo orden.
+
+        Si el caché está desactivado en config.yaml los frames se generan en
+        el proceso. Si el archivo no existe o su hash no coincide (por ejemplo,
+        porque se regeneró el atlas), se hornea de nuevo antes de abrirlo.
+        """
+        Atlas.refresh()
+        if not CONFIG['assets']['frame_cache']:
+            return {key: render_frame(name, size, tint) for key, name, size, tint in specs}
+
+        if group not in cls._maps:
+            opened = cls._open(group)
+            if opened is None or opened[1]["hash"] != _content_hash(specs):
+                if opened is not None:
+                    opened[0].close()
+                print(f"Horneando caché de frames '{group}'...")
+                cls.bake(group, specs)
+                opened = cls._open(group)
+            cls._maps[group] = opened
+
+        mapped, index = cls._maps[group]
+        view = memoryview(mapped)
+        data_start = index["data_start"]
+        frames = {}
+        for key, _, _, _ in specs:
+            offset, width, height = index["frames"][key]
+            start = data_start + offset
+            frames[key] = pygame.image.frombuffer(view[start:start + width * height * 4], (width, height), PIXEL_FORMAT)
+        return frames
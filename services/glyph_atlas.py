@@ -0,0 +1,60 @@
+"""Atlas de glifos para los números del HUD.
+
+Los valores del panel (puntos, ronda, enemigos, HP, MP) cambian casi en cada
+frame y cachear la cadena completa sólo llenaría la caché de textos. En su
+lugar, cada combinación de fuente y color pre-renderiza una vez los dígitos,
+el signo, el punto decimal y algunos separadores en una única superficie, y
+un valor se compone con una sola llamada a ``Surface.blits`` sin pasar por
+``font.render``.
+"""
+import pygame
+
+GLYPHS = "0123456789-+.,/:% "
+
+
+class GlyphAtlas:
+    _atlases = {}  # (fuente, color) -> GlyphAtlas
+
+    def __init__(self, font: pygame.font.Font, color: tuple):
+        glyphs = [font.render(char, True, color) for char in GLYPHS]
+        self.height = max(glyph.get_height() for glyph in glyphs)
+        self.surface = pygame.Surface((sum(glyph.get_width() for glyph in glyphs), self.height), pygame.SRCALPHA)
+        self.rects = {}
+        x = 0
+        for char, glyph in zip(GLYPHS, glyphs):
+            # Copiar el glifo tal cual (sin mezclar con el fondo transparente)
+            self.surface.blit(glyph, (x, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            self.rects[char] = pygame.Rect(x, 0, glyph.get_width(), self.height)
+            x += glyph.get_width()
+        if pygame.display.get_surface() is not None:
+            self.surface = self.surface.convert_alpha()
+
+    @classmethod
+    def get(cls, font: pygame.font.Font, color) -> "GlyphAtlas":
+        """Retorna el atlas de ``font`` en ``color``, creándolo la primera vez."""
+        key = (font, tuple(color))
+        atlas = cls._atlases.get(key)
+        if atlas is None:
+            atlas = cls(font, key[1])
+            cls._atlases[key] = atlas
+        return atlas
+
+    @staticmethod
+    def format(value: float, decimals: int = 0) -> str:
+        """Formatea ``value`` con un número fijo de decimales."""
+        return f"{value:.{decimals}f}"
+
+    def width(self, text: str) -> int:
+        """Ancho en píxeles de ``text`` compuesto con este atlas."""
+        return sum(self.rects[char].width for char in text)
+
+    def draw(self, target: pygame.Surface, text: str, position: tuple) -> pygame.Rect:
+        """Dibuja ``text`` (sólo caracteres de GLYPHS) en ``position`` y retorna el área ocupada."""
+        x, y = position
+        sequence = []
+        for char in text:
+            area = self.rects[char]
+            sequence.append((self.surface, (x, y), area))
+            x += area.width
+        target.blits(sequence, doreturn=False)
+        return pygame.Rect(position[0], y, x - position[0], self.height)
@@ -0,0 +1,56 @@
+"""Precarga de recursos en hilos de trabajo.
+
+Cada recurso se registra con un nombre y una función de carga. Las escenas
+consultan sólo los nombres que necesitan para decidir si pueden mostrarse o
+si deben esperar en la escena de carga.
+"""
+from concurrent.futures import ThreadPoolExecutor, wait
+
+
+class Preloader:
+    def __init__(self, workers: int = 4):
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="preload")
+        self._futures = {}
+
+    def submit(self, name: str, loader, *args):
+        """Programa la carga de ``name`` ejecutando ``loader(*args)`` en un hilo."""
+        future = self._executor.submit(loader, *args)
+        future.add_done_callback(lambda f: self._on_done(name, f))
+        self._futures[name] = future
+        return future
+
+    def _on_done(self, name: str, future):
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            print(f"Advertencia: No se pudo cargar '{name}': {error}")
+
+    def is_ready(self, names=None) -> bool:
+        """Indica si terminaron (con o sin error) las cargas de ``names``."""
+        return all(future.done() for future in self._select(names))
+
+    def progress(self, names=None) -> float:
+        """Fracción de cargas terminadas entre ``names`` (todas si es None)."""
+        futures = self._select(names)
+        if not futures:
+            return 1.0
+        return sum(future.done() for future in futures) / len(futures)
+
+    def wait(self, names=None, timeout: float = None) -> bool:
+        """Bloquea hasta que terminen las cargas de ``names``."""
+        wait(self._select(names), timeout=timeout)
+        return self.is_ready(names)
+
+    def result(self, name: str):
+        """Resultado de la carga ``name``; relanza su excepción si falló."""
+        return self._futures[name].result()
+
+    def shutdown(self):
+        """Cancela las cargas pendientes sin esperar a las que están en curso."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _select(self, names) -> list:
+        if names is None:
+            return list(self._futures.values())
+        return [self._futures[name] for name in names]
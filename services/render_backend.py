@@ -0,0 +1,196 @@
+"""Backends de dibujo de la escena de juego.
+
+``InGameView`` describe el área de juego (fondo, bloques del mapa, sprites,
+hitboxes y efectos) con las mismas llamadas en ambos backends:
+
+- ``SurfaceBackend`` las ejecuta al instante sobre una ``Surface`` con blits
+  por software.
+- ``TextureBackend`` sube cada superficie una única vez como textura de
+  ``pygame._sdl2.video`` y graba las llamadas como copias de textura. En
+  ``present`` dibuja la superficie lógica (panel, menús, capas) y encima los
+  comandos grabados con un ``Renderer`` de SDL, acelerado si hay GPU o por
+  software si no.
+
+Las llamadas son las de ``Surface`` que usan ``DrawList`` y ``ChunkCache``
+(``blits``, ``fill``, ``set_clip``), más ``rect`` y ``circle`` para las
+primitivas de ``pygame.draw`` y ``cover``, con la que la vista indica qué zona
+queda tapada por completo (la superficie lógica no se copia debajo).
+"""
+import weakref
+import pygame
+from pygame._sdl2 import video
+
+# Tipos de comando grabados por TextureBackend
+_COPY = 0
+_FILL = 1
+
+# Valores de render.renderer -> parámetro ``accelerated`` de Renderer
+RENDERERS = {"auto": -1, "software": 0, "gpu": 1}
+
+
+class SurfaceBackend:
+    """Dibuja directamente sobre ``target``."""
+    deferred = False  # Los comandos se ejecutan al momento
+
+    def __init__(self, target: pygame.Surface):
+        self.target = target
+
+    def set_clip(self, rect):
+        self.target.set_clip(rect)
+
+    def fill(self, color, rect):
+        self.target.fill(color, rect)
+
+    def blits(self, sequence, doreturn: bool = False):
+        self.target.blits(sequence, doreturn=False)
+
+    def rect(self, color, rect, width: int = 0):
+        pygame.draw.rect(self.target, color, rect, width)
+
+    def circle(self, color, center, radius: int, width: int = 0):
+        pygame.draw.circle(self.target, color, center, radius, width)
+
+    def cover(self, rect):
+        pass  # Se dibuja sobre la propia superficie: no hay nada debajo que omitir
+
+
+class TextureBackend:
+    """Dibuja con un ``Renderer`` de SDL en su propia ventana.
+
+    Las texturas se guardan indexadas por la superficie de origen y se
+    liberan con ella, así que las superficies deben ser inmutables una vez
+    dibujadas (como las de FrameCache, TextCache y ChunkCache).
+    """
+    deferred = True  # Los comandos se emiten en present
+
+    def __init__(self, title: str, logical_size: tuple, window_size: tuple, fullscreen: bool, renderer: str):
+        self.window = video.Window(title, window_size, resizable=True, fullscreen_desktop=fullscreen)
+        self.renderer = video.Renderer(self.window, accelerated=RENDERERS[renderer])
+        # SDL escala al tamaño de la ventana y traduce los eventos del ratón
+        self.renderer.logical_size = logical_size
+        self.logical_size = logical_size
+        # Copia de la superficie lógica, actualizada por regiones
+        self.screen_texture = video.Texture(self.renderer, logical_size, streaming=True)
+        self._textures = weakref.WeakKeyDictionary()  # Surface -> Texture
+        self._circles = {}  # (color, radio, grosor) -> Surface
+        self._commands = []
+        self._clip = None
+        self._covered = None  # Zona tapada por los comandos del frame
+        self.uploads = 0  # Texturas creadas desde el inicio
+
+    def texture(self, surface: pygame.Surface) -> video.Texture:
+        """Retorna la textura de ``surface``, subiéndola la primera vez."""
+        texture = self._textures.get(surface)
+        if texture is None:
+            texture = video.Texture.from_surface(self.renderer, surface)
+            self._textures[surface] = texture
+            self.uploads += 1
+        return texture
+
+    def set_clip(self, rect):
+        self._clip = pygame.Rect(rect) if rect else None
+
+    def fill(self, color, rect):
+        rect = pygame.Rect(rect)
+        if self._clip is not None:
+            rect = rect.clip(self._clip)
+        if rect:
+            self._commands.append((_FILL, pygame.Color(color), rect))
+
+    def blits(self, sequence, doreturn: bool = False):
+        clip = self._clip
+        commands = self._commands
+        for surface, position in sequence:
+            texture = self.texture(surface)
+            dest = pygame.Rect(position[0], position[1], texture.width, texture.height)
+            if clip is None or clip.contains(dest):
+                commands.append((_COPY, texture, None, dest))
+                continue
+            # Recortar al rectángulo de recorte tomando sólo la parte visible de la textura
+            visible = dest.clip(clip)
+            if visible:
+                commands.append((_COPY, texture, visible.move(-dest.x, -dest.y), visible))
+
+    def rect(self, color, rect, width: int = 0):
+        if width <= 0:
+            self.fill(color, rect)
+            return
+        # Contorno como cuatro rellenos para que el recorte sea igual al de pygame.draw.rect
+        x, y, w, h = pygame.Rect(rect)
+        self.fill(color, (x, y, w, width))
+        self.fill(color, (x, y + h - width, w, width))
+        side = max(0, h - 2 * width)
+        self.fill(color, (x, y + width, width, side))
+        self.fill(color, (x + w - width, y + width, width, side))
+
+    def circle(self, color, center, radius: int, width: int = 0):
+        # Como en una superficie sin alfa, el círculo se dibuja opaco
+        key = (tuple(color[:3]), radius, width)
+        surface = self._circles.get(key)
+        if surface is None:
+            surface = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+            pygame.draw.circle(surface, key[0], (radius, radius), radius, width)
+            self._circles[key] = surface
+        self.blits([(surface, (center[0] - radius, center[1] - radius))])
+
+    def cover(self, rect):
+        """Indica que los comandos del frame tapan ``rect`` por completo con píxeles opacos."""
+        self._covered = pygame.Rect(rect)
+
+    def to_logical(self, pos: tuple) -> tuple:
+        """Traduce una posición de la ventana a coordenadas lógicas (con las bandas de ``logical_size``)."""
+        window_width, window_height = self.window.size
+        width, height = self.logical_size
+        scale = min(window_width / width, window_height / height)
+        left = (window_width - width * scale) / 2
+        top = (window_height - height * scale) / 2
+        return (int((pos[0] - left) / scale), int((pos[1] - top) / scale))
+
+    def present(self, surface: pygame.Surface, rects: list = None):
+        """Presenta ``surface`` (entera o sólo ``rects``) y encima los comandos grabados en el frame."""
+        if rects is None:
+            self.screen_texture.update(surface)
+        else:
+            bounds = surface.get_rect()
+            for rect in rects:
+                rect = bounds.clip(rect)
+                if rect:
+                    self.screen_texture.update(surface.subsurface(rect), rect)
+
+        renderer = self.renderer
+        if tuple(self.window.size) != tuple(self.logical_size):
+            # Sólo hay que limpiar las bandas del escalado; sin ellas la textura de pantalla lo cubre todo
+            renderer.draw_color = (0, 0, 0, 255)
+            renderer.clear()
+        self._draw_screen_texture()
+        for command in self._commands:
+            if command[0] == _COPY:
+                command[1].draw(command[2], command[3])
+            else:
+                renderer.draw_color = command[1]
+                renderer.fill_rect(command[2])
+        self._commands = []
+        self._covered = None
+        renderer.present()
+
+    def _draw_screen_texture(self):
+        """Copia la superficie lógica salvo la zona indicada con ``cover``, que no se vería."""
+        covered = self._covered
+        if covered is None:
+            self.screen_texture.draw()
+            return
+        width, height = self.logical_size
+        # Franjas superior e inferior a todo lo ancho, laterales a la altura del relleno
+        strips = (
+            (0, 0, width, covered.top),
+            (0, covered.bottom, width, height - covered.bottom),
+            (0, covered.top, covered.left, covered.h),
+            (covered.right, covered.top, width - covered.right, covered.h),
+        )
+        for strip in strips:
+            if strip[2] > 0 and strip[3] > 0:
+                self.screen_texture.draw(strip, strip)
+
+    def stats(self) -> dict:
+        """Texturas vivas y subidas totales."""
+        return {"textures": len(self._textures), "uploads": self.uploads}
@@ -0,0 +1,55 @@
+"""Informe de arranque.
+
+Registra el tiempo transcurrido desde que se importó este módulo hasta cada
+hito del arranque (ventana creada, primer frame interactivo, precarga
+completa) junto con la memoria residente del proceso en ese momento, y lo
+imprime si ``debug.startup_report`` está activo.
+"""
+import os
+import time
+from services.config import CONFIG
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+START_TIME = time.perf_counter()
+
+
+def resident_memory_mb() -> float:
+    """Memoria residente del proceso en MB, o None si no se puede medir.
+
+    En Linux se lee el valor actual de /proc; en otros Unix se usa el pico
+    reportado por getrusage.
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except (OSError, ValueError, AttributeError):
+        pass
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss está en bytes en macOS y en KB en el resto
+        return peak / 2**20 if os.uname().sysname == "Darwin" else peak / 1024
+    return None
+
+
+class StartupReport:
+    _marks = []
+
+    @classmethod
+    def mark(cls, label: str) -> float:
+        """Registra el hito ``label`` y retorna los milisegundos desde el inicio."""
+        elapsed_ms = (time.perf_counter() - START_TIME) * 1000
+        memory_mb = resident_memory_mb()
+        cls._marks.append((label, elapsed_ms, memory_mb))
+        if CONFIG['debug']['startup_report']:
+            memory = f"{memory_mb:7.1f} MB" if memory_mb is not None else "      ? MB"
+            print(f"[arranque] {elapsed_ms:8.1f} ms  {memory}  {label}")
+        return elapsed_ms
+
+    @classmethod
+    def marks(cls) -> list:
+        """Hitos registrados como ``(etiqueta, ms, MB residentes)``."""
+        return list(cls._marks)
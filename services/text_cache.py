@@ -0,0 +1,85 @@
+"""Registro de fuentes y caché de textos renderizados.
+
+Todas las vistas piden sus fuentes a ``TextCache.font`` para compartir un único
+objeto por nombre y tamaño, y dibujan sus textos con ``TextCache.render``. Las
+superficies renderizadas se guardan en una caché LRU acotada, indexada por
+fuente, tamaño, texto, color y antialias, de modo que una etiqueta que no
+cambia sólo cuesta un blit. Como en AssetManager, las superficies devueltas se
+comparten y no deben modificarse.
+"""
+from collections import OrderedDict
+import pygame
+from services.config import CONFIG
+
+
+class TextCache:
+    _fonts = {}  # (nombre, tamaño) -> Font
+    _font_keys = {}  # Font -> (nombre, tamaño)
+    _cache = OrderedDict()
+    _max_entries = CONFIG['assets']['text_cache_entries']
+    _bytes = 0
+    _hits = 0
+    _misses = 0
+    _evictions = 0
+
+    @classmethod
+    def font(cls, size: int, name: str = None) -> pygame.font.Font:
+        """Retorna la fuente ``name`` (None para la de pygame) de ``size`` puntos."""
+        key = (name, size)
+        font = cls._fonts.get(key)
+        if font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            font = pygame.font.Font(name, size)
+            cls._fonts[key] = font
+            cls._font_keys[font] = key
+        return font
+
+    @classmethod
+    def render(cls, font: pygame.font.Font, text: str, color, antialias: bool = True) -> pygame.Surface:
+        """Retorna ``text`` renderizado con ``font``, reutilizando la superficie si ya existe.
+
+        ``font`` debe venir de ``TextCache.font``.
+        """
+        key = (*cls._font_keys[font], text, tuple(color), antialias)
+        surface = cls._cache.get(key)
+        if surface is not None:
+            cls._hits += 1
+            cls._cache.move_to_end(key)
+            return surface
+
+        cls._misses += 1
+        surface = font.render(text, antialias, key[3])
+        cls._cache[key] = surface
+        cls._bytes += cls._surface_bytes(surface)
+        while len(cls._cache) > cls._max_entries:
+            _, evicted = cls._cache.popitem(last=False)
+            cls._bytes -= cls._surface_bytes(evicted)
+            cls._evictions += 1
+        return surface
+
+    @staticmethod
+    def _surface_bytes(surface: pygame.Surface) -> int:
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+    @classmethod
+    def stats(cls) -> dict:
+        """Retorna aciertos, fallos, tasa de aciertos, desalojos, entradas y bytes."""
+        total = cls._hits + cls._misses
+        return {
+            "hits": cls._hits,
+            "misses": cls._misses,
+            "hit_rate": cls._hits / total if total else 0.0,
+            "evictions": cls._evictions,
+            "entries": len(cls._cache),
+            "bytes": cls._bytes,
+        }
+
+    @classmethod
+    def clear(cls):
+        """Vacía la caché de textos y reinicia los contadores (las fuentes se conservan)."""
+        cls._cache.clear()
+        cls._bytes = 0
+        cls._hits = 0
+        cls._misses = 0
+        cls._evictions = 0
@@ -0,0 +1,41 @@
+"""Cámara de la escena de juego.
+
+Traduce coordenadas del mundo (píxeles del mapa, con el origen en la esquina
+del mapa) a coordenadas de pantalla dentro del viewport del área de juego:
+``pantalla = mundo + offset``.
+"""
+import pygame
+
+
+class Camera:
+    """Sigue a un objetivo manteniéndolo centrado sin mostrar nada fuera del mapa.
+
+    En los ejes en que el mapa cabe entero en el viewport, lo centra y no se mueve.
+    """
+    def __init__(self, viewport: pygame.Rect, world_width: int, world_height: int):
+        self.viewport = pygame.Rect(viewport)
+        self.world_width = world_width
+        self.world_height = world_height
+        self.offset_x = 0
+        self.offset_y = 0
+        self.follow(world_width / 2, world_height / 2)
+
+    @staticmethod
+    def _axis_offset(target: float, view_start: int, view_size: int, world_size: int) -> int:
+        if world_size <= view_size:
+            return view_start + (view_size - world_size) // 2
+        first_visible = max(0, min(world_size - view_size, int(target) - view_size // 2))
+        return view_start - first_visible
+
+    def follow(self, x: float, y: float) -> bool:
+        """Centra la cámara en ``(x, y)`` del mundo. Retorna True si se movió."""
+        offset_x = self._axis_offset(x, self.viewport.x, self.viewport.width, self.world_width)
+        offset_y = self._axis_offset(y, self.viewport.y, self.viewport.height, self.world_height)
+        moved = (offset_x, offset_y) != (self.offset_x, self.offset_y)
+        self.offset_x, self.offset_y = offset_x, offset_y
+        return moved
+
+    @property
+    def world_rect(self) -> pygame.Rect:
+        """Parte del mundo que cubre el viewport, en coordenadas del mundo."""
+        return self.viewport.move(-self.offset_x, -self.offset_y)
@@ -0,0 +1,43 @@
+"""Lista de dibujo de sprites ordenada por capa y profundidad.
+
+Cada frame las entidades envían ``(clave, superficie, posición, capa, y)`` y la
+lista se emite con una sola llamada a ``Surface.blits``: primero las capas
+menores y, dentro de una capa, de menor a mayor ``y`` para que lo que está más
+abajo en pantalla tape a lo que está detrás.
+
+El orden del frame anterior se conserva y se parte de él: como las entidades
+casi no cambian de posición relativa entre frames, la lista llega casi
+ordenada y el Timsort de ``list.sort`` la reordena en tiempo prácticamente
+lineal. Al ser un orden estable, dos entidades con la misma capa e ``y``
+mantienen su orden relativo y no parpadean.
+"""
+import pygame
+
+
+class DrawList:
+    def __init__(self):
+        self._pending = {}  # clave -> (superficie, posición, capa, y) del frame en curso
+        self._order = []  # claves en el orden emitido el frame anterior
+
+    def submit(self, key, surface: pygame.Surface, position: tuple, layer: int, y: float):
+        """Encola un sprite. ``key`` identifica a la entidad entre frames (p. ej. ``id(entidad)``)."""
+        self._pending[key] = (surface, position, layer, y)
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def flush(self, target: pygame.Surface):
+        """Ordena los sprites encolados, los dibuja sobre ``target`` y vacía la lista.
+
+        ``target`` puede ser una Surface o un backend de ``services.render_backend``.
+        """
+        pending = self._pending
+        keys = [key for key in self._order if key in pending]
+        if len(keys) != len(pending):
+            # Entidades nuevas: al final, el sort las ubica
+            known = set(keys)
+            keys.extend(key for key in pending if key not in known)
+        keys.sort(key=lambda key: (pending[key][2], pending[key][3]))
+        target.blits([pending[key][:2] for key in keys], doreturn=False)
+        self._order = keys
+        self._pending = {}
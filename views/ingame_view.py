@@ -2,6 +2,15 @@
 """
 import pygame
 from services.config import CONFIG
+from services.text_cache import TextCache
+from services.glyph_atlas import GlyphAtlas
+from services.display import Display
+from services.render_backend import SurfaceBackend
+from views.camera import Camera
+from views.draw_list import DrawList
+from views.map_chunks import ChunkCache
+from views.sprites import PlayerSprites, EnemySprites
+from views.widgets import Container, Box, Label, Button
 
 # Constantes de configuración
 TILE_SIZE = CONFIG['map']['tile_size']
@@ -21,6 +30,15 @@ PANEL_PADDING = INFO_PANEL['padding']
 PANEL_BG = INFO_PANEL['background']
 TEXT_COLOR = INFO_PANEL['text_color']
 TITLE_COLOR = INFO_PANEL['title_color']
+LINE_HEIGHT = 30
+HUD_LINES = 5  # Líneas de valores (puntos, ronda, enemigos, HP, MP) bajo el título
+
+# Modo de renderizado
+DIRTY_RECTS = CONFIG['render']['dirty_rects']
+HUD_DECIMALS = CONFIG['render']['hud_decimals']
+DEBUG_COLORKEY = (255, 0, 255)  # Color transparente de los bloques de hitboxes
+CHUNK_TILES = CONFIG['render']['chunk_tiles']
+MAX_CHUNKS = CONFIG['render']['max_chunks']
 
 class InGameView:
     def __init__(self, screen: pygame.Surface, map_obj, player, enemies):
@@ -33,49 +51,119 @@ class InGameView:
         self.map_width_px = self.map.width * TILE_SIZE
         self.map_height_px = self.map.height * TILE_SIZE
         
-        # Calcular el offset para centrar el mapa en el área de juego
-        self.offset_x = MARGIN_LEFT + (GAME_WIDTH - self.map_width_px) // 2
-        self.offset_y = MARGIN_TOP + (GAME_HEIGHT - self.map_height_px) // 2
+        # Cámara que sigue al jugador; si el mapa cabe en el área de juego queda centrado
+        self.camera = Camera(pygame.Rect(MARGIN_LEFT, MARGIN_TOP, GAME_WIDTH, GAME_HEIGHT),
+                             self.map_width_px, self.map_height_px)
+        
+        # Mapa y hitboxes de muros (modo debug) por bloques, renderizados al entrar en pantalla
+        self.map_chunks = ChunkCache(self.map, TILE_SIZE, self._paint_map_chunk, CHUNK_TILES, MAX_CHUNKS)
+        self.debug_chunks = ChunkCache(self.map, TILE_SIZE, self._paint_debug_chunk, CHUNK_TILES, MAX_CHUNKS,
+                                       colorkey=DEBUG_COLORKEY)
+
+        # Backend con el que se dibuja el área de juego; las capas superpuestas siempre van a la superficie
+        self.surface_backend = SurfaceBackend(self.screen)
+        self.backend = Display.backend or self.surface_backend
+
+        # Fracción del paso de simulación en curso; las entidades se dibujan interpoladas
+        self.interpolation = 1.0
+
+        # Sprites de las entidades, ordenados por capa y profundidad
+        self.draw_list = DrawList()
+        self.solid_tiles = {}  # color -> tile para entidades sin animación
+
+        # Estado del modo de rectángulos sucios
+        self.background = None
+        self.background_backend = None
+        self.background_version = None
+        self.background_camera = None  # Offset de la cámara con el que se compuso el fondo
+        self.game_area_changed = False  # El fondo del área de juego cambió desde el último frame
+        self.needs_full_redraw = True
+        self.entity_rects = []  # Zonas ocupadas por las entidades en el último frame
+        self.hud_lines = {}  # clave -> (texto, rect) de cada valor del panel
         
         # Configuración de fuentes
-        pygame.font.init()
-        self.font = pygame.font.Font(None, 24)
-        self.title_font = pygame.font.Font(None, 36)
-        self.debug_font = pygame.font.Font(None, 20)
-        self.countdown_font = pygame.font.Font(None, 72)
-        self.death_font = pygame.font.Font(None, 48)
-        self.victory_font = pygame.font.Font(None, 48)
-
-    def _draw_attack_effects(self):
-        """Dibuja los efectos visuales de los ataques."""
+        self.font = TextCache.font(24)
+        self.title_font = TextCache.font(36)
+        self.debug_font = TextCache.font(20)
+        self.countdown_font = TextCache.font(72)
+        self.death_font = TextCache.font(48)
+        self.victory_font = TextCache.font(48)
 
+        # Pantallas finales, construidas una vez; el controlador consulta su hit_test
+        self.death_screen = self._build_end_screen("¡HAS MUERTO!", (255, 0, 0), self.death_font)
+        self.victory_screen = self._build_end_screen("¡VICTORIA!", (0, 255, 0), self.victory_font)
+
+    @property
+    def offset_x(self) -> int:
+        """Posición en pantalla del borde izquierdo del mapa."""
+        return self.camera.offset_x
+
+    @property
+    def offset_y(self) -> int:
+        """Posición en pantalla del borde superior del mapa."""
+        return self.camera.offset_y
+
+    def _attack_effect_circle(self):
+        """Centro y radio del área del ataque pesado, o None si no se está ejecutando."""
+        if not self.player._heavy_attack.is_executing:
+            return None
         # Calcular el centro del jugador
-        center_x = self.offset_x + int(self.player.x * TILE_SIZE) + TILE_SIZE//2
-        center_y = self.offset_y + int(self.player.y * TILE_SIZE) + TILE_SIZE//2
+        player_x, player_y = self.player.interpolated_position(self.interpolation)
+        center_x = self.offset_x + int(player_x * TILE_SIZE) + TILE_SIZE//2
+        center_y = self.offset_y + int(player_y * TILE_SIZE) + TILE_SIZE//2
+        return (center_x, center_y), int(self.player._heavy_attack.range * TILE_SIZE)
 
+    def _draw_attack_effects(self, backend):
+        """Dibuja los efectos visuales de los ataques."""
         # Solo mostrar el círculo rojo para el ataque pesado
-        if self.player._heavy_attack.is_executing:            
+        circle = self._attack_effect_circle()
+        if circle:
             # Dibujar área de efecto circular
-            radius = int(self.player._heavy_attack.range * TILE_SIZE)
-            pygame.draw.circle(self.screen, (255, 0, 0, 128), (center_x, center_y), radius, 2)
+            center, radius = circle
+            backend.circle((255, 0, 0, 128), center, radius, 2)
 
-    def draw(self, is_paused: bool, game_time: float, current_round: int, enemies_remaining: int, countdown_active: bool, countdown_time: float, is_dead: bool, has_won: bool):
-        """Dibuja el mapa, el jugador, los enemigos y la UI."""
-        # Limpiar pantalla con color de fondo
-        self.screen.fill((0, 0, 0))  # Fondo negro
-        
-        # Dibujar panel de información
-        self._draw_info_panel(game_time, current_round, enemies_remaining)
-        
-        # Dibujar área de juego
-        game_rect = pygame.Rect(MARGIN_LEFT, MARGIN_TOP, GAME_WIDTH, GAME_HEIGHT)
-        self.screen.fill((30, 30, 30), game_rect)  # TODO: Direccionar el color del fondo a config.yaml
-        
-        # Dibujar mapa y entidades
-        self._draw_game_entities()
-        
-        # Dibujar efectos de ataques
-        self._draw_attack_effects()
+    def draw(self, is_paused: bool, game_time: float, current_round: int, enemies_remaining: int, countdown_active: bool, countdown_time: float, is_dead: bool, has_won: bool,
+             to_surface: bool = False):
+        """Dibuja el mapa, el jugador, los enemigos y la UI.
+
+        Con ``render.dirty_rects`` activo retorna la lista de rectángulos
+        modificados, o None cuando se redibujó la pantalla completa (primer
+        frame, contador, pausa, muerte o victoria) y hay que presentarla entera.
+        Con un backend diferido el área de juego se envía al backend salvo en
+        esos frames o si ``to_surface`` pide la escena completa en la superficie.
+        """
+        # Centrar la cámara en el jugador
+        player_x, player_y = self.player.interpolated_position(self.interpolation)
+        self.camera.follow(player_x * TILE_SIZE + TILE_SIZE//2, player_y * TILE_SIZE + TILE_SIZE//2)
+
+        overlay = countdown_active or is_dead or has_won or is_paused
+        if self.backend.deferred and not overlay and not to_surface:
+            return self._draw_deferred(game_time, current_round, enemies_remaining)
+        if DIRTY_RECTS and not overlay and not self.needs_full_redraw:
+            return self._draw_dirty(game_time, current_round, enemies_remaining)
+        if DIRTY_RECTS:
+            # Partir del fondo cacheado y registrar las zonas dinámicas
+            self.screen.blit(self._get_background(), (0, 0))
+            self.game_area_changed = False
+            self.hud_lines = {}
+            self._draw_hud_values(game_time, current_round, enemies_remaining)
+            items = self._entity_draw_items()
+            self._draw_in_viewport(items, self.surface_backend)
+            self.entity_rects = self._entity_bounds(items)
+            # Tras una capa superpuesta el siguiente frame debe ser completo para borrarla
+            self.needs_full_redraw = overlay
+        else:
+            # Limpiar pantalla con color de fondo
+            self.screen.fill((0, 0, 0))  # Fondo negro
+
+            # Dibujar panel de información
+            self._draw_info_panel(game_time, current_round, enemies_remaining)
+
+            # Dibujar área de juego y mapa
+            self._draw_map(self.surface_backend)
+
+            # Dibujar entidades y efectos de ataques
+            self._draw_in_viewport(self._entity_draw_items(), self.surface_backend)
         
         # Dibujar contador inicial si está activo
         if countdown_active:
@@ -92,148 +180,288 @@ class InGameView:
         # Dibujar mensaje de pausa si está pausado
         if is_paused:
             self._draw_pause_message()
+        return None
 
-    def _draw_game_entities(self):
-        """Dibuja el mapa, jugador y enemigos."""
-        # Dibujar mapa
-        for y in range(self.map.height):
-            for x in range(self.map.width):
-                rect = pygame.Rect(
-                    self.offset_x + x * TILE_SIZE,
-                    self.offset_y + y * TILE_SIZE,
-                    TILE_SIZE,
-                    TILE_SIZE
-                )
-                color = tuple(CONFIG['map']['colors']['floor']) if self.map.is_walkable(x, y) else tuple(CONFIG['map']['colors']['wall'])
-                self.screen.fill(color, rect)
-        
-        # Dibujar enemigos
+    def _draw_dirty(self, game_time: float, current_round: int, enemies_remaining: int) -> list:
+        """Redibuja sólo lo que cambió y retorna los rectángulos afectados.
+
+        Las zonas ocupadas por las entidades en el frame anterior y en el
+        actual se restauran desde el fondo antes de volver a dibujarlas, así
+        los sprites con transparencia no se acumulan sobre sí mismos.
+        """
+        background = self._get_background()
+        if self.needs_full_redraw:
+            # El fondo acaba de crearse
+            return self.draw(False, game_time, current_round, enemies_remaining, False, 0, False, False)
+
+        items = self._entity_draw_items()
+        rects = self._entity_bounds(items)
+        if self.game_area_changed:
+            # La cámara se movió o cambió el mapa: restaurar toda el área de juego
+            viewport = self.camera.viewport
+            self.screen.blit(background, viewport, viewport)
+            dirty = [viewport.copy()]
+            self.game_area_changed = False
+        else:
+            dirty = self.entity_rects + rects
+            for rect in dirty:
+                self.screen.blit(background, rect, rect)
+        self._draw_in_viewport(items, self.surface_backend)
+        self.entity_rects = rects
+
+        dirty.extend(self._draw_hud_values(game_time, current_round, enemies_remaining))
+        return dirty
+
+    def _draw_deferred(self, game_time: float, current_round: int, enemies_remaining: int) -> list:
+        """Envía el área de juego al backend diferido y actualiza sólo el panel en la superficie.
+
+        Retorna los rectángulos del panel que cambiaron, o None si la superficie
+        se redibujó entera.
+        """
+        rects = None
+        if self.needs_full_redraw:
+            # El área de juego la cubre el backend: del fondo sólo hace falta el panel
+            self.screen.blit(self._get_background(game_area=False), (0, 0))
+            self.hud_lines = {}
+            self._draw_hud_values(game_time, current_round, enemies_remaining)
+            self.needs_full_redraw = False
+        else:
+            rects = self._draw_hud_values(game_time, current_round, enemies_remaining)
+        self._draw_map(self.backend)
+        self._draw_in_viewport(self._entity_draw_items(), self.backend)
+        return rects
+
+    def _get_background(self, game_area: bool = True) -> pygame.Surface:
+        """Fondo cacheado de la escena: panel sin valores, área de juego y mapa.
+
+        El área de juego se recompone cuando la cámara se mueve o cambia el mapa,
+        salvo con ``game_area=False``, que sólo garantiza el panel: así la usan el
+        backend diferido, que dibuja el área de juego por su cuenta, y el HUD.
+        """
+        if self.background is None:
+            self.background = pygame.Surface(self.screen.get_size()).convert(self.screen)
+            self.background.fill((0, 0, 0))
+            self.background_backend = SurfaceBackend(self.background)
+            self._draw_info_panel_background(self.background)
+            self.needs_full_redraw = True
+        if not game_area:
+            return self.background
+        camera = (self.offset_x, self.offset_y)
+        if self.background_version != self.map.version or self.background_camera != camera:
+            self._draw_map(self.background_backend)
+            self.background_version = self.map.version
+            self.background_camera = camera
+            self.game_area_changed = True
+        return self.background
+
+    def _draw_map(self, backend):
+        """Dibuja con ``backend`` el fondo del área de juego y los bloques visibles del mapa."""
+        viewport = self.camera.viewport
+        map_rect = pygame.Rect(self.offset_x, self.offset_y, self.map_width_px, self.map_height_px)
+        if not map_rect.contains(viewport):
+            # Los bloques no llenan el área de juego (mapa pequeño): el resto lleva el color de fondo
+            backend.fill((30, 30, 30), viewport)  # TODO: Direccionar el color del fondo a config.yaml
+        backend.set_clip(viewport)
+        self.map_chunks.draw(backend, self.camera)
+        # Hitbox de muros si está activado el modo debug
+        if HITBOX_DEBUG:
+            self.debug_chunks.draw(backend, self.camera)
+        backend.set_clip(None)
+        # Fondo y bloques opacos tapan todo el área de juego
+        backend.cover(viewport)
+
+    def _paint_map_chunk(self, surface: pygame.Surface, x0: int, y0: int, x1: int, y1: int):
+        """Pinta suelo y muros de los tiles ``[x0, x1) × [y0, y1)`` en un bloque."""
+        surface.fill(tuple(CONFIG['map']['colors']['floor']))
+        wall_color = tuple(CONFIG['map']['colors']['wall'])
+        for y in range(y0, y1):
+            row = self.map.grid[y]
+            for x in range(x0, x1):
+                if row[x]:
+                    surface.fill(wall_color, ((x - x0) * TILE_SIZE, (y - y0) * TILE_SIZE, TILE_SIZE, TILE_SIZE))
+
+    def _paint_debug_chunk(self, surface: pygame.Surface, x0: int, y0: int, x1: int, y1: int):
+        """Pinta los contornos de las hitboxes de muro de un bloque.
+
+        Son los mismos rectángulos que MapGrid.get_wall_hitbox, sin crear una
+        Hitbox por muro. Los contornos son opacos, así que el bloque usa un color
+        clave con RLE en lugar de alfa por píxel.
+        """
+        wall_color = tuple(CONFIG['map']['colors']['debug']['wall'])
+        for y in range(y0, y1):
+            row = self.map.grid[y]
+            for x in range(x0, x1):
+                if row[x]:
+                    pygame.draw.rect(surface, wall_color, ((x - x0) * TILE_SIZE, (y - y0) * TILE_SIZE, TILE_SIZE, TILE_SIZE), 1)
+
+    def _entity_draw_items(self) -> list:
+        """Enemigos vivos visibles y jugador como elementos de la lista de dibujo.
+
+        Cada elemento es ``(clave, imagen, rect, capa, y, rect de hitbox, color de hitbox)``.
+        Sin animación, la imagen es un tile de color sólido. Las posiciones se
+        interpolan entre los dos últimos pasos de simulación.
+        """
+        items = []
+        half_tile = TILE_SIZE // 2
+        viewport = self.camera.viewport
+        alpha = self.interpolation
         for enemy in self.enemies:
             if enemy.is_alive:
-                px = self.offset_x + int(enemy.x * TILE_SIZE)
-                py = self.offset_y + int(enemy.y * TILE_SIZE)
-                
-                # Dibujar la animación del enemigo
-                if hasattr(enemy, 'image') and enemy.image:
-                    # Centrar la imagen del enemigo en el tile
-                    image_rect = enemy.image.get_rect()
-                    image_rect.center = (px + TILE_SIZE//2, py + TILE_SIZE//2)
-                    self.screen.blit(enemy.image, image_rect)
-                else:
-                    # Fallback al color si no hay animación
+                image = EnemySprites.image(enemy) if hasattr(enemy, 'frame_key') else None
+                if image is None or HITBOX_DEBUG:
                     color = tuple(CONFIG['enemies'][f'level_{enemy.level}']['color'])
-                    self.screen.fill(color, pygame.Rect(px, py, TILE_SIZE, TILE_SIZE))
-                
-                if HITBOX_DEBUG:
-                    pygame.draw.rect(
-                        self.screen,
-                        tuple(CONFIG['enemies'][f'level_{enemy.level}']['color']),
-                        enemy.hitbox.get_scaled_rect(TILE_SIZE).move(self.offset_x, self.offset_y),
-                        1
-                    )
-        
-        # Dibujar jugador
-        px = self.offset_x + int(self.player.x * TILE_SIZE)
-        py = self.offset_y + int(self.player.y * TILE_SIZE)
-        
-        # Dibujar la animación del jugador
-        if hasattr(self.player, 'image'):
-            # Centrar la imagen del jugador en el tile
-            image_rect = self.player.image.get_rect()
-            image_rect.center = (px + TILE_SIZE//2, py + TILE_SIZE//2)
-            self.screen.blit(self.player.image, image_rect)
+                if image is None:
+                    # Fallback al color si no hay animación
+                    image = self._solid_tile(color)
+                # Centrar la imagen del enemigo en el tile
+                width, height = image.get_size()
+                enemy_x, enemy_y = enemy.interpolated_position(alpha)
+                left = self.offset_x + int(enemy_x * TILE_SIZE) + half_tile - width // 2
+                top = self.offset_y + int(enemy_y * TILE_SIZE) + half_tile - height // 2
+                # Descartar los enemigos fuera del viewport
+                if (left >= viewport.right or top >= viewport.bottom
+                        or left + width <= viewport.left or top + height <= viewport.top):
+                    continue
+                rect = pygame.Rect(left, top, width, height)
+                hitbox_rect = self._hitbox_rect(enemy, enemy_x, enemy_y) if HITBOX_DEBUG else None
+                items.append((id(enemy), image, rect, enemy.render_order, enemy_y, hitbox_rect, color if HITBOX_DEBUG else None))
+        
+        # Jugador
+        if hasattr(self.player, 'frame_key'):
+            image = PlayerSprites.image(self.player)
         else:
             # Fallback al rectángulo verde si no hay animación
-            self.screen.fill(tuple(CONFIG['player']['colors']['body']),
-                           pygame.Rect(px, py, TILE_SIZE, TILE_SIZE))
+            image = self._solid_tile(tuple(CONFIG['player']['colors']['body']))
+        # Centrar la imagen del jugador en el tile
+        width, height = image.get_size()
+        player_x, player_y = self.player.interpolated_position(alpha)
+        rect = pygame.Rect(self.offset_x + int(player_x * TILE_SIZE) + half_tile - width // 2,
+                           self.offset_y + int(player_y * TILE_SIZE) + half_tile - height // 2,
+                           width, height)
+        hitbox_rect = self._hitbox_rect(self.player, player_x, player_y) if HITBOX_DEBUG else None
+        items.append((id(self.player), image, rect, self.player.render_order, player_y,
+                      hitbox_rect, tuple(CONFIG['player']['colors']['hitbox'])))
+        return items
+
+    def _hitbox_rect(self, entity, x: float, y: float) -> pygame.Rect:
+        """Rectángulo en pantalla de la hitbox de ``entity`` dibujada en ``(x, y)``, como Hitbox.get_scaled_rect."""
+        return pygame.Rect(self.offset_x + int(x * TILE_SIZE), self.offset_y + int(y * TILE_SIZE),
+                           int(entity.width * TILE_SIZE), int(entity.height * TILE_SIZE))
+
+    def _solid_tile(self, color: tuple) -> pygame.Surface:
+        """Tile de color sólido para las entidades sin animación."""
+        tile = self.solid_tiles.get(color)
+        if tile is None:
+            tile = pygame.Surface((TILE_SIZE, TILE_SIZE))
+            tile.fill(color)
+            self.solid_tiles[color] = tile
+        return tile
+
+    def _blit_entity_items(self, items: list, backend):
+        """Dibuja los elementos de ``_entity_draw_items`` por capa e y y, en una segunda pasada, sus hitboxes de debug."""
+        for key, image, rect, layer, y, _, _ in items:
+            self.draw_list.submit(key, image, rect, layer, y)
+        self.draw_list.flush(backend)
 
-        # Dibuja el hitbox del jugador si está activado el modo debug
         if HITBOX_DEBUG:
-            pygame.draw.rect(
-                self.screen,
-                tuple(CONFIG['player']['colors']['hitbox']),
-                self.player.hitbox.get_scaled_rect(TILE_SIZE).move(self.offset_x, self.offset_y),
-                1
-            )
-            # Hitbox de muros
-            for y in range(self.map.height):
-                for x in range(self.map.width):
-                    wall_hitbox = self.map.get_wall_hitbox(x, y)
-                    if wall_hitbox:
-                        pygame.draw.rect(
-                            self.screen,
-                            tuple(CONFIG['map']['colors']['debug']['wall']),
-                            wall_hitbox.get_scaled_rect(TILE_SIZE).move(self.offset_x, self.offset_y),
-                            1
-                        )
+            for _, _, _, _, _, hitbox_rect, hitbox_color in items:
+                backend.rect(hitbox_color, hitbox_rect, 1)
 
-    def _draw_info_panel(self, game_time: float, current_round: int, enemies_remaining: int):
-        """Dibuja el panel de información en el lado izquierdo."""
+    def _draw_in_viewport(self, items: list, backend):
+        """Dibuja con ``backend`` entidades y efectos de ataque recortados al área de juego."""
+        backend.set_clip(self.camera.viewport)
+        self._blit_entity_items(items, backend)
+        self._draw_attack_effects(backend)
+        backend.set_clip(None)
+
+    def _entity_bounds(self, items: list) -> list:
+        """Rectángulos de pantalla que ocupan las entidades y el efecto de ataque, dentro del viewport."""
+        viewport = self.camera.viewport
+        bounds = [(rect.union(hitbox_rect) if hitbox_rect else rect).clip(viewport)
+                  for _, _, rect, _, _, hitbox_rect, _ in items]
+        circle = self._attack_effect_circle()
+        if circle:
+            (center_x, center_y), radius = circle
+            bounds.append(pygame.Rect(center_x - radius, center_y - radius, radius * 2 + 1, radius * 2 + 1).clip(viewport))
+        return bounds
+
+    def _hud_values(self, game_time: float, current_round: int, enemies_remaining: int) -> list:
+        """Líneas del panel que cambian durante la partida: ``(clave, etiqueta, valor, posición)``."""
+        points = int(game_time)  # Convertir tiempo a puntos (1 punto por segundo)
+        values = [
+            ("points", "Puntos: ", GlyphAtlas.format(points)),
+            ("round", "Ronda: ", f"{current_round}/10"),
+            ("enemies", "Enemigos: ", GlyphAtlas.format(enemies_remaining)),
+            ("hp", "HP: ", GlyphAtlas.format(self.player.hp, HUD_DECIMALS)),
+            ("mp", "MP: ", GlyphAtlas.format(self.player.mp, HUD_DECIMALS)),
+        ]
+        return [(key, label, value, (PANEL_PADDING, PANEL_PADDING * 3 + i * LINE_HEIGHT))
+                for i, (key, label, value) in enumerate(values)]
+
+    def _draw_hud_line(self, label: str, value: str, position: tuple) -> pygame.Rect:
+        """Dibuja la etiqueta (caché de textos) y el valor (atlas de glifos). Retorna el área ocupada."""
+        label_surface = TextCache.render(self.font, label, TEXT_COLOR)
+        label_rect = self.screen.blit(label_surface, position)
+        value_rect = GlyphAtlas.get(self.font, TEXT_COLOR).draw(self.screen, value, label_rect.topright)
+        return label_rect.union(value_rect)
+
+    def _draw_hud_values(self, game_time: float, current_round: int, enemies_remaining: int) -> list:
+        """Redibuja sobre el fondo las líneas del panel cuyo valor cambió.
+
+        Retorna los rectángulos modificados (unión de la línea anterior y la nueva).
+        """
+        background = self._get_background(game_area=False)
+        atlas = GlyphAtlas.get(self.font, TEXT_COLOR)
+        dirty = []
+        for key, label, value, position in self._hud_values(game_time, current_round, enemies_remaining):
+            previous = self.hud_lines.get(key)
+            if previous is not None and previous[0] == value:
+                continue
+            label_surface = TextCache.render(self.font, label, TEXT_COLOR)
+            rect = pygame.Rect(position, (label_surface.get_width() + atlas.width(value),
+                                          max(label_surface.get_height(), atlas.height)))
+            area = rect.union(previous[1]) if previous is not None else rect
+            self.screen.blit(background, area, area)
+            self._draw_hud_line(label, value, position)
+            self.hud_lines[key] = (value, rect)
+            dirty.append(area)
+        return dirty
+
+    def _draw_info_panel_background(self, target: pygame.Surface):
+        """Dibuja sobre ``target`` la parte fija del panel de información."""
         # Dibujar fondo del panel
-        panel_rect = pygame.Rect(0, 0, PANEL_WIDTH, self.screen.get_height())
-        self.screen.fill(PANEL_BG, panel_rect)
+        panel_rect = pygame.Rect(0, 0, PANEL_WIDTH, target.get_height())
+        target.fill(PANEL_BG, panel_rect)
         
         # Título del panel
-        title = self.title_font.render("Información del Juego", True, TITLE_COLOR)
-        self.screen.blit(title, (PANEL_PADDING, PANEL_PADDING))
-        
-        # Información del juego
-        y_offset = PANEL_PADDING * 3
-        line_height = 30
-        
-        # Puntos
-        points = int(game_time)  # Convertir tiempo a puntos (1 punto por segundo)
-        points_text = f"Puntos: {points}"
-        points_surface = self.font.render(points_text, True, TEXT_COLOR)
-        self.screen.blit(points_surface, (PANEL_PADDING, y_offset))
-        y_offset += line_height
-        
-        # Ronda actual
-        round_text = f"Ronda: {current_round}/10"
-        round_surface = self.font.render(round_text, True, TEXT_COLOR)
-        self.screen.blit(round_surface, (PANEL_PADDING, y_offset))
-        y_offset += line_height
+        title = TextCache.render(self.title_font, "Información del Juego", TITLE_COLOR)
+        target.blit(title, (PANEL_PADDING, PANEL_PADDING))
         
-        # Enemigos restantes
-        enemies_text = f"Enemigos: {enemies_remaining}"
-        enemies_surface = self.font.render(enemies_text, True, TEXT_COLOR)
-        self.screen.blit(enemies_surface, (PANEL_PADDING, y_offset))
-        y_offset += line_height
-        
-        # Vida del jugador
-        hp_text = f"HP: {self.player.hp}"
-        hp_surface = self.font.render(hp_text, True, TEXT_COLOR)
-        self.screen.blit(hp_surface, (PANEL_PADDING, y_offset))
-        y_offset += line_height
-        
-        # MP del jugador
-        mp_text = f"MP: {self.player.mp}"
-        mp_surface = self.font.render(mp_text, True, TEXT_COLOR)
-        self.screen.blit(mp_surface, (PANEL_PADDING, y_offset))
-        y_offset += line_height
+        # Saltar las líneas de valores de _hud_values
+        y_offset = PANEL_PADDING * 3 + HUD_LINES * LINE_HEIGHT
         
         # Información de ataques
-        y_offset += line_height
-        attacks_title = self.font.render("Ataques:", True, TITLE_COLOR)
-        self.screen.blit(attacks_title, (PANEL_PADDING, y_offset))
-        y_offset += line_height
+        y_offset += LINE_HEIGHT
+        attacks_title = TextCache.render(self.font, "Ataques:", TITLE_COLOR)
+        target.blit(attacks_title, (PANEL_PADDING, y_offset))
+        y_offset += LINE_HEIGHT
     
         # Golpe liviano
         basic_attack_text = f"{CONFIG['attacks']['melee']['basic']['name']} (K - X)"
-        basic_attack_surface = self.font.render(basic_attack_text, True, TEXT_COLOR)
-        self.screen.blit(basic_attack_surface, (PANEL_PADDING, y_offset))
-        y_offset += line_height
+        basic_attack_surface = TextCache.render(self.font, basic_attack_text, TEXT_COLOR)
+        target.blit(basic_attack_surface, (PANEL_PADDING, y_offset))
+        y_offset += LINE_HEIGHT
         
         # Golpe pesado
         heavy_attack_text = f"{CONFIG['attacks']['melee']['heavy']['name']} (L - C)"
-        heavy_attack_surface = self.font.render(heavy_attack_text, True, TEXT_COLOR)
-        self.screen.blit(heavy_attack_surface, (PANEL_PADDING, y_offset))
-        y_offset += line_height * 2  # Espacio adicional antes de los controles
+        heavy_attack_surface = TextCache.render(self.font, heavy_attack_text, TEXT_COLOR)
+        target.blit(heavy_attack_surface, (PANEL_PADDING, y_offset))
+        y_offset += LINE_HEIGHT * 2  # Espacio adicional antes de los controles
 
         # Información de movimiento
-        movement_title = self.font.render("Movimiento:", True, TITLE_COLOR)
-        self.screen.blit(movement_title, (PANEL_PADDING, y_offset))
-        y_offset += line_height
+        movement_title = TextCache.render(self.font, "Movimiento:", TITLE_COLOR)
+        target.blit(movement_title, (PANEL_PADDING, y_offset))
+        y_offset += LINE_HEIGHT
 
         # Controles de movimiento con símbolos ASCII
         controls = [
@@ -244,9 +472,15 @@ class InGameView:
         ]
 
         for control in controls:
-            control_surface = self.font.render(control, True, TEXT_COLOR)
-            self.screen.blit(control_surface, (PANEL_PADDING, y_offset))
-            y_offset += line_height
+            control_surface = TextCache.render(self.font, control, TEXT_COLOR)
+            target.blit(control_surface, (PANEL_PADDING, y_offset))
+            y_offset += LINE_HEIGHT
+
+    def _draw_info_panel(self, game_time: float, current_round: int, enemies_remaining: int):
+        """Dibuja el panel de información en el lado izquierdo."""
+        self._draw_info_panel_background(self.screen)
+        for _, label, value, position in self._hud_values(game_time, current_round, enemies_remaining):
+            self._draw_hud_line(label, value, position)
 
     def _draw_countdown(self, countdown_time: float):
         """Dibuja el contador inicial en el centro de la pantalla."""
@@ -258,109 +492,53 @@ class InGameView:
         
         # Dibujar el número del contador
         count = str(int(countdown_time) + 1)  # +1 para mostrar el número actual
-        count_surface = self.countdown_font.render(count, True, (255, 255, 255))
+        count_surface = TextCache.render(self.countdown_font, count, (255, 255, 255))
         count_rect = count_surface.get_rect(center=(MARGIN_LEFT + GAME_WIDTH//2, MARGIN_TOP + GAME_HEIGHT//2))
         self.screen.blit(count_surface, count_rect)
 
-    def _draw_death_screen(self, game_time: float):
-        """Dibuja la pantalla de muerte."""
-        # Crear una superficie semi-transparente
-        overlay = pygame.Surface((GAME_WIDTH, GAME_HEIGHT))
-        overlay.fill((0, 0, 0))
-        overlay.set_alpha(192)
-        self.screen.blit(overlay, (MARGIN_LEFT, MARGIN_TOP))
-        
+    def _build_end_screen(self, title: str, title_color: tuple, font: pygame.font.Font) -> Container:
+        """Construye la pantalla de muerte o victoria: capa, título, puntos y botones."""
+        center_x = MARGIN_LEFT + GAME_WIDTH//2
+        center_y = MARGIN_TOP + GAME_HEIGHT//2
+
+        # Capa semi-transparente
+        ui = Container([Box((MARGIN_LEFT, MARGIN_TOP, GAME_WIDTH, GAME_HEIGHT), (0, 0, 0), 192)])
+
         # Título
-        title = self.death_font.render("¡HAS MUERTO!", True, (255, 0, 0))
-        title_rect = title.get_rect(center=(MARGIN_LEFT + GAME_WIDTH//2, MARGIN_TOP + GAME_HEIGHT//2 - 60))
-        self.screen.blit(title, title_rect)
-        
+        ui.add(Label(title, font, title_color, (center_x, center_y - 60)))
+
         # Estadísticas
-        points = int(game_time)
-        points_text = f"Puntos finales: {points}"
-        points_surface = self.title_font.render(points_text, True, (255, 255, 255))
-        points_rect = points_surface.get_rect(center=(MARGIN_LEFT + GAME_WIDTH//2, MARGIN_TOP + GAME_HEIGHT//2))
-        self.screen.blit(points_surface, points_rect)
-        
+        ui.points_label = ui.add(Label("", self.title_font, (255, 255, 255), (center_x, center_y)))
+
         # Botones
         button_width = 200
         button_height = 50
         button_spacing = 20
-        start_y = MARGIN_TOP + GAME_HEIGHT//2 + 60
-        
+        start_y = center_y + 60
+        colors = {"button_bg": (100, 100, 100), "button_hover_bg": (100, 100, 100), "text": (255, 255, 255)}
+
         # Botón Reiniciar
-        self.restart_button_rect = pygame.Rect(
-            MARGIN_LEFT + GAME_WIDTH//2 - button_width - button_spacing//2,
-            start_y,
-            button_width,
-            button_height
-        )
-        pygame.draw.rect(self.screen, (100, 100, 100), self.restart_button_rect, border_radius=10)
-        restart_text = self.font.render("Reiniciar", True, (255, 255, 255))
-        restart_text_rect = restart_text.get_rect(center=self.restart_button_rect.center)
-        self.screen.blit(restart_text, restart_text_rect)
-        
+        ui.add(Button((center_x - button_width - button_spacing//2, start_y, button_width, button_height),
+                      "Reiniciar", self.font, colors, action="restart"))
+
         # Botón Menú Principal
-        self.menu_button_rect = pygame.Rect(
-            MARGIN_LEFT + GAME_WIDTH//2 + button_spacing//2,
-            start_y,
-            button_width,
-            button_height
-        )
-        pygame.draw.rect(self.screen, (100, 100, 100), self.menu_button_rect, border_radius=10)
-        menu_text = self.font.render("Menú Principal", True, (255, 255, 255))
-        menu_text_rect = menu_text.get_rect(center=self.menu_button_rect.center)
-        self.screen.blit(menu_text, menu_text_rect)
+        ui.add(Button((center_x + button_spacing//2, start_y, button_width, button_height),
+                      "Menú Principal", self.font, colors, action="menu"))
+        return ui
+
+    def _draw_end_screen(self, ui: Container, game_time: float):
+        """Dibuja una pantalla final actualizando sólo el texto de los puntos."""
+        points = int(game_time)
+        ui.points_label.set_text(f"Puntos finales: {points}")
+        ui.draw(self.screen)
+
+    def _draw_death_screen(self, game_time: float):
+        """Dibuja la pantalla de muerte."""
+        self._draw_end_screen(self.death_screen, game_time)
 
     def _draw_victory_screen(self, game_time: float):
         """Dibuja la pantalla de victoria."""
-        # Crear una superficie semi-transparente
-        overlay = pygame.Surface((GAME_WIDTH, GAME_HEIGHT))
-        overlay.fill((0, 0, 0))
-        overlay.set_alpha(192)
-        self.screen.blit(overlay, (MARGIN_LEFT, MARGIN_TOP))
-        
-        # Título
-        title = self.victory_font.render("¡VICTORIA!", True, (0, 255, 0))
-        title_rect = title.get_rect(center=(MARGIN_LEFT + GAME_WIDTH//2, MARGIN_TOP + GAME_HEIGHT//2 - 60))
-        self.screen.blit(title, title_rect)
-        
-        # Estadísticas
-        points = int(game_time)
-        points_text = f"Puntos finales: {points}"
-        points_surface = self.title_font.render(points_text, True, (255, 255, 255))
-        points_rect = points_surface.get_rect(center=(MARGIN_LEFT + GAME_WIDTH//2, MARGIN_TOP + GAME_HEIGHT//2))
-        self.screen.blit(points_surface, points_rect)
-        
-        # Botones (mismo código que en death screen)
-        button_width = 200
-        button_height = 50
-        button_spacing = 20
-        start_y = MARGIN_TOP + GAME_HEIGHT//2 + 60
-        
-        # Botón Reiniciar
-        self.restart_button_rect = pygame.Rect(
-            MARGIN_LEFT + GAME_WIDTH//2 - button_width - button_spacing//2,
-            start_y,
-            button_width,
-            button_height
-        )
-        pygame.draw.rect(self.screen, (100, 100, 100), self.restart_button_rect, border_radius=10)
-        restart_text = self.font.render("Reiniciar", True, (255, 255, 255))
-        restart_text_rect = restart_text.get_rect(center=self.restart_button_rect.center)
-        self.screen.blit(restart_text, restart_text_rect)
-        
-        # Botón Menú Principal
-        self.menu_button_rect = pygame.Rect(
-            MARGIN_LEFT + GAME_WIDTH//2 + button_spacing//2,
-            start_y,
-            button_width,
-            button_height
-        )
-        pygame.draw.rect(self.screen, (100, 100, 100), self.menu_button_rect, border_radius=10)
-        menu_text = self.font.render("Menú Principal", True, (255, 255, 255))
-        menu_text_rect = menu_text.get_rect(center=self.menu_button_rect.center)
-        self.screen.blit(menu_text, menu_text_rect)
+        self._draw_end_screen(self.victory_screen, game_time)
 
     def _draw_pause_message(self):
         """Dibuja el mensaje de pausa."""
@@ -372,7 +550,7 @@ class InGameView:
         
         # Mensaje de pausa
         pause_text = "PAUSA"
-        pause_surface = self.title_font.render(pause_text, True, (255, 255, 255))
+        pause_surface = TextCache.render(self.title_font, pause_text, (255, 255, 255))
         pause_rect = pause_surface.get_rect(center=(MARGIN_LEFT + GAME_WIDTH//2, MARGIN_TOP + GAME_HEIGHT//2))
         self.screen.blit(pause_surface, pause_rect)
 
@@ -380,17 +558,17 @@ class InGameView:
         """Dibuja información de debug."""
         # Información del mapa
         map_info = f"Mapa: {map_grid.width}x{map_grid.height}"
-        text = self.debug_font.render(map_info, True, (200, 200, 200))
+        text = TextCache.render(self.debug_font, map_info, (200, 200, 200))
         self.screen.blit(text, (10, 10))
         
         # Información del jugador
         if player:
             player_info = f"Jugador: ({player.x:.1f}, {player.y:.1f})"
-            text = self.debug_font.render(player_info, True, (200, 200, 200))
+            text = TextCache.render(self.debug_font, player_info, (200, 200, 200))
             self.screen.blit(text, (10, 30))
         
         # Información de enemigos
         if enemies:
             enemy_info = f"Enemigos vivos: {sum(1 for e in enemies if e.is_alive)}"
-            text = self.debug_font.render(enemy_info, True, (200, 200, 200))
+            text = TextCache.render(self.debug_font, enemy_info, (200, 200, 200))
             self.screen.blit(text, (10, 50))
@@ -0,0 +1,36 @@
+import pygame
+from services.text_cache import TextCache
+
+class LoadingView:
+    def __init__(self, screen):
+        self.screen = screen
+        self.font_title = TextCache.font(50)
+
+        self.colors = {
+            "background": (30, 30, 50),
+            "text": (230, 230, 230),
+            "bar_bg": (60, 60, 80),
+            "bar_fill": (150, 150, 150)
+        }
+
+        bar_width = 400
+        bar_height = 20
+        self.bar_rect = pygame.Rect(
+            (self.screen.get_width() - bar_width) // 2,
+            self.screen.get_height() // 2 + 20,
+            bar_width,
+            bar_height
+        )
+        self.title_surface = TextCache.render(self.font_title, "Cargando...", self.colors["text"])
+        self.title_rect = self.title_surface.get_rect(center=(self.screen.get_width() // 2, self.screen.get_height() // 2 - 30))
+
+    def draw(self, progress: float):
+        """Dibuja el texto de carga y una barra con ``progress`` entre 0 y 1."""
+        self.screen.fill(self.colors["background"])
+        self.screen.blit(self.title_surface, self.title_rect)
+
+        pygame.draw.rect(self.screen, self.colors["bar_bg"], self.bar_rect, border_radius=5)
+        fill_rect = self.bar_rect.copy()
+        fill_rect.width = int(self.bar_rect.width * max(0.0, min(1.0, progress)))
+        if fill_rect.width > 0:
+            pygame.draw.rect(self.screen, self.colors["bar_fill"], fill_rect, border_radius=5)
@@ -0,0 +1,72 @@
+"""Caché del mapa por bloques.
+
+El mapa se divide en bloques de ``chunk_tiles`` × ``chunk_tiles`` tiles que se
+renderizan la primera vez que entran en pantalla. Sólo se conservan los
+``max_chunks`` usados más recientemente, así que la memoria y el costo por
+frame dependen del tamaño del viewport y no del tamaño del mapa. Si cambia
+``MapGrid.version`` se descartan todos los bloques.
+"""
+from collections import OrderedDict
+import pygame
+
+
+class ChunkCache:
+    """Bloques del mapa renderizados bajo demanda con un límite LRU.
+
+    ``paint(surface, x0, y0, x1, y1)`` dibuja sobre ``surface`` los tiles del
+    rango ``[x0, x1) × [y0, y1)``, con el tile ``(x0, y0)`` en el origen.
+    Con ``colorkey`` los bloques se crean rellenos de ese color y lo usan como
+    transparente.
+    """
+    def __init__(self, map_obj, tile_size: int, paint, chunk_tiles: int, max_chunks: int, colorkey: tuple = None):
+        self.map = map_obj
+        self.tile_size = tile_size
+        self.paint = paint
+        self.chunk_tiles = chunk_tiles
+        self.max_chunks = max_chunks
+        self.colorkey = colorkey
+        self._chunks = OrderedDict()  # (cx, cy) -> Surface
+        self._version = None
+        self.rendered = 0  # Bloques renderizados desde el inicio (incluye re-renderizados tras desalojo)
+
+    def get(self, cx: int, cy: int) -> pygame.Surface:
+        """Retorna el bloque ``(cx, cy)``, renderizándolo si no está en caché."""
+        if self._version != self.map.version:
+            self._chunks.clear()
+            self._version = self.map.version
+        chunk = self._chunks.get((cx, cy))
+        if chunk is not None:
+            self._chunks.move_to_end((cx, cy))
+            return chunk
+
+        x0, y0 = cx * self.chunk_tiles, cy * self.chunk_tiles
+        x1, y1 = min(x0 + self.chunk_tiles, self.map.width), min(y0 + self.chunk_tiles, self.map.height)
+        chunk = pygame.Surface(((x1 - x0) * self.tile_size, (y1 - y0) * self.tile_size))
+        if pygame.display.get_surface() is not None:
+            chunk = chunk.convert()
+        if self.colorkey is not None:
+            chunk.fill(self.colorkey)
+        self.paint(chunk, x0, y0, x1, y1)
+        if self.colorkey is not None:
+            chunk.set_colorkey(self.colorkey, pygame.RLEACCEL)
+        self.rendered += 1
+
+        self._chunks[(cx, cy)] = chunk
+        while len(self._chunks) > self.max_chunks:
+            self._chunks.popitem(last=False)
+        return chunk
+
+    def draw(self, target: pygame.Surface, camera):
+        """Dibuja sobre ``target`` (Surface o backend de dibujo) los bloques visibles por ``camera``."""
+        chunk_px = self.chunk_tiles * self.tile_size
+        visible = camera.world_rect.clip(pygame.Rect(0, 0, self.map.width * self.tile_size, self.map.height * self.tile_size))
+        if visible.width <= 0 or visible.height <= 0:
+            return
+        blits = []
+        for cy in range(visible.top // chunk_px, (visible.bottom - 1) // chunk_px + 1):
+            for cx in range(visible.left // chunk_px, (visible.right - 1) // chunk_px + 1):
+                blits.append((self.get(cx, cy), (cx * chunk_px + camera.offset_x, cy * chunk_px + camera.offset_y)))
+        target.blits(blits, doreturn=False)
+
+    def __len__(self) -> int:
+        return len(self._chunks)
@@ -1,12 +1,14 @@
-import pygame
+from services.text_cache import TextCache
+from services.display import Display
+from views.widgets import Container, Box, Label, Button
 
 class PauseMenuView:
     def __init__(self, screen, model):
         self.screen = screen
         self.model = model
-        self.font_title = pygame.font.Font(None, 74)
-        self.font_button = pygame.font.Font(None, 50)
-        
+        self.font_title = TextCache.font(74)
+        self.font_button = TextCache.font(50)
+
         self.colors = {
             "overlay": (0, 0, 0, 128),  # Negro semi-transparente
             "white": (255, 255, 255),
@@ -14,47 +16,31 @@ class PauseMenuView:
             "button_hover_bg": (150, 150, 150),
             "text": (230, 230, 230)
         }
-        self.button_rects = []
+        self.ui = self._build_ui()
+
+    def _build_ui(self) -> Container:
+        """Construye una sola vez la capa semitransparente, el título y los botones."""
+        # Capa semi-transparente
+        overlay_color, overlay_alpha = self.colors["overlay"][:3], self.colors["overlay"][3]
+        ui = Container([Box(self.screen.get_rect(), overlay_color, overlay_alpha)])
 
-    def draw(self):
-        # Crear superficie semi-transparente
-        overlay = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
-        overlay.fill(self.colors["overlay"])
-        self.screen.blit(overlay, (0, 0))
-        
         # Título
         center_x = self.screen.get_width() // 2
         center_y = self.screen.get_height() // 2 - 100
-        
-        title_surface = self.font_title.render(self.model.get_title(), True, self.colors["white"])
-        title_rect = title_surface.get_rect(center=(center_x, center_y))
-        self.screen.blit(title_surface, title_rect)
+        ui.add(Label(self.model.get_title(), self.font_title, self.colors["white"], (center_x, center_y)))
 
         # Botones
-        self.button_rects = []
-        button_labels = self.model.get_button_labels()
         button_width = 250
         button_height = 60
         button_spacing = 20
         start_y = center_y + 50
-        
-        mouse_pos = pygame.mouse.get_pos()
 
-        for i, label in enumerate(button_labels):
+        for i, label in enumerate(self.model.get_button_labels()):
             button_x = center_x - (button_width // 2)
             button_y = start_y + i * (button_height + button_spacing)
-            
-            rect = pygame.Rect(button_x, button_y, button_width, button_height)
-            self.button_rects.append(rect)
+            ui.add(Button((button_x, button_y, button_width, button_height), label, self.font_button, self.colors))
+        return ui
 
-            bg_color = self.colors["button_hover_bg"] if rect.collidepoint(mouse_pos) else self.colors["button_bg"]
-            pygame.draw.rect(self.screen, bg_color, rect, border_radius=10)
-            
-            text_surface = self.font_button.render(label, True, self.colors["text"])
-            text_rect = text_surface.get_rect(center=rect.center)
-            self.screen.blit(text_surface, text_rect)
-            
-        pygame.display.flip()
-
-    def get_button_rects(self):
-        return self.button_rects
\ No newline at end of file
+    def draw(self):
+        self.ui.update_hover(Display.mouse_pos())
+        self.ui.draw(self.screen)
@@ -1,14 +1,16 @@
 import pygame
 from models.scores import ScoresModel
+from services.text_cache import TextCache
+from services.display import Display
+from views.widgets import Container, Label, Button
 
 class ScoresView:
     def __init__(self, screen, model: ScoresModel): # Tipado para claridad
         self.screen = screen
         self.model = model
-        pygame.font.init() # Asegurarse que pygame.font está inicializado
-        self.font_title = pygame.font.Font(None, 74)
-        self.font_scores = pygame.font.Font(None, 36)
-        self.font_back = pygame.font.Font(None, 50)
+        self.font_title = TextCache.font(74)
+        self.font_scores = TextCache.font(36)
+        self.font_back = TextCache.font(50)
 
         self.colors = {
             "background": (30, 30, 50),
@@ -19,27 +21,29 @@ class ScoresView:
             "button_hover_bg": (150, 150, 150)
         }
 
-        self.back_button_rect = None
-
-    def draw(self):
-        self.screen.fill(self.colors["background"])
+        # Botón Volver
+        button_width = 200
+        button_height = 50
+        button_x = (self.screen.get_width() - button_width) // 2
+        button_y = self.screen.get_height() - 100
+        self.back_button = Button((button_x, button_y, button_width, button_height), "Volver", self.font_back, self.colors)
 
-        # Título
-        title_surface = self.font_title.render(self.model.title, True, self.colors["title"])
-        title_rect = title_surface.get_rect(center=(self.screen.get_width() // 2, 100))
-        self.screen.blit(title_surface, title_rect)
+        self.title_label = Label(self.model.title, self.font_title, self.colors["title"], (self.screen.get_width() // 2, 100))
+        self.scores_panel = Container()
+        self.ui = Container([self.title_label, self.scores_panel, self.back_button])
+        self.refresh()
 
-        # Puntajes - Forzar actualización cada vez que se dibuja
+    def refresh(self):
+        """Relee los puntajes y reconstruye sus etiquetas. Se llama al entrar en la escena."""
         scores = self.model.get_top_scores(force_refresh=True)
         start_y = 200
         spacing = 40
+        center_x = self.screen.get_width() // 2
 
+        self.scores_panel.children.clear()
         if not scores:
             # Mostrar mensaje si no hay puntajes
-            no_scores_text = "No hay puntajes registrados"
-            no_scores_surface = self.font_scores.render(no_scores_text, True, self.colors["text"])
-            no_scores_rect = no_scores_surface.get_rect(center=(self.screen.get_width() // 2, start_y))
-            self.screen.blit(no_scores_surface, no_scores_rect)
+            self.scores_panel.add(Label("No hay puntajes registrados", self.font_scores, self.colors["text"], (center_x, start_y)))
         else:
             # Mostrar puntajes
             for i, (date, score) in enumerate(scores):
@@ -54,29 +58,13 @@ class ScoresView:
                 # Color según posición
                 color = self.colors["highlight"] if i == 0 else self.colors["text"]
 
-                score_surface = self.font_scores.render(text, True, color)
-                score_rect = score_surface.get_rect(center=(self.screen.get_width() // 2, start_y + i * spacing))
-                self.screen.blit(score_surface, score_rect)
-
-        # Botón Volver
-        button_width = 200
-        button_height = 50
-        button_x = (self.screen.get_width() - button_width) // 2
-        button_y = self.screen.get_height() - 100
-
-        self.back_button_rect = pygame.Rect(button_x, button_y, button_width, button_height)
+                self.scores_panel.add(Label(text, self.font_scores, color, (center_x, start_y + i * spacing)))
 
+    def draw(self):
+        self.screen.fill(self.colors["background"])
         # Efecto hover
-        mouse_pos = pygame.mouse.get_pos()
-        bg_color = self.colors["button_hover_bg"] if self.back_button_rect.collidepoint(mouse_pos) else self.colors["button_bg"]
-
-        pygame.draw.rect(self.screen, bg_color, self.back_button_rect, border_radius=10)
-
-        back_text = self.font_back.render("Volver", True, self.colors["text"])
-        back_rect = back_text.get_rect(center=self.back_button_rect.center)
-        self.screen.blit(back_text, back_rect)
-
-        pygame.display.flip()
+        self.ui.update_hover(Display.mouse_pos())
+        self.ui.draw(self.screen)
 
     def handle_event(self, event):
         """
@@ -85,7 +73,7 @@ class ScoresView:
         """
         if event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1: # Botón izquierdo del ratón
-                if self.back_button_rect and self.back_button_rect.collidepoint(event.pos):
+                if self.ui.hit_test(event.pos) is self.back_button:
                     print("Botón Volver presionado")
                     return True # Indicar que se debe volver
         return False
\ No newline at end of file
@@ -0,0 +1,131 @@
+"""Imágenes de los personajes.
+
+Los modelos sólo guardan qué frame mostrar (``frame_key``); aquí se construyen
+los bancos de superficies a partir de la caché de frames y se traduce cada
+clave a su imagen.
+"""
+import pygame
+from services.atlas import Atlas
+from services.frame_cache import FrameCache
+
+# Direcciones que se obtienen volteando horizontalmente los frames de otra,
+# p.ej. {("run", "left"): "right"}. Sólo aplica a hojas que sean espejo exacto;
+# las hojas actuales no lo son (el arma cambia de mano), por eso está vacío.
+MIRRORED_DIRECTIONS = {}
+
+# Tinte de cada nivel de enemigo
+LEVEL_COLORS = {
+    1: (255, 0, 0, 200),    # Rojo semi-oscuro
+    2: (0, 255, 0, 200),    # Verde semi-oscuro
+    3: (0, 0, 255, 200),    # Azul semi-oscuro
+    4: (255, 255, 0, 200),  # Amarillo semi-oscuro
+    5: (255, 0, 255, 200)   # Magenta semi-oscuro
+}
+
+
+class PlayerSprites:
+    SPRITE_SIZE = (52, 62)
+    _frame_cache = None  # Frames precalculados compartidos por todas las partidas
+
+    @classmethod
+    def frame_specs(cls) -> list:
+        """Describe cada frame final de la caché: ``(clave, frame del atlas, tamaño, tinte)``."""
+        specs = []
+        for state, directions in Atlas.animations("player").items():
+            for direction, names in directions.items():
+                if (state, direction) in MIRRORED_DIRECTIONS:
+                    continue
+                for i, name in enumerate(names):
+                    specs.append((f"{state}/{direction}/{i}", name, cls.SPRITE_SIZE, None))
+        return specs
+
+    @classmethod
+    def frames(cls) -> dict:
+        """
+        Retorna la caché de frames compartida, construyéndola la primera vez.
+
+        Returns:
+            dict: ``cache[estado][dirección]`` es la tupla de frames escalados a SPRITE_SIZE.
+        """
+        if cls._frame_cache is None:
+            cache = {}
+            for key, surface in FrameCache.load("player", cls.frame_specs()).items():
+                state, direction, _ = key.split("/")
+                cache.setdefault(state, {}).setdefault(direction, []).append(surface)
+            for directions in cache.values():
+                for direction, surfaces in directions.items():
+                    directions[direction] = tuple(surfaces)
+
+            # Direcciones derivadas por volteo horizontal
+            for (state, direction), source in MIRRORED_DIRECTIONS.items():
+                cache[state][direction] = tuple(
+                    pygame.transform.flip(frame, True, False) for frame in cache[state][source]
+                )
+            cls._frame_cache = cache
+        return cls._frame_cache
+
+    @classmethod
+    def image(cls, player) -> pygame.Surface:
+        """Imagen correspondiente al ``frame_key`` actual del jugador."""
+        state, direction, index = player.frame_key
+        return cls.frames()[state][direction][index]
+
+
+class EnemySprites:
+    SPRITE_SIZE = (32, 32)
+    SCALE_FACTOR = 0.9  # Reducción de tamaño a los enemigos
+    _frame_bank = None  # Frames precalculados compartidos por todos los enemigos
+
+    @classmethod
+    def frame_specs(cls) -> list:
+        """Describe cada frame final del banco: ``(clave, frame del atlas, tamaño, tinte)``."""
+        frame_size = (int(78 * cls.SCALE_FACTOR), int(93 * cls.SCALE_FACTOR))
+        initial_size = (int(cls.SPRITE_SIZE[0] * cls.SCALE_FACTOR), int(cls.SPRITE_SIZE[1] * cls.SCALE_FACTOR))
+        animations = Atlas.animations("enemy")
+        specs = []
+        for level, tint in LEVEL_COLORS.items():
+            for state, directions in animations.items():
+                for direction, names in directions.items():
+                    for i, name in enumerate(names):
+                        if state == "initial":
+                            size = initial_size
+                        elif state != "death":
+                            size = frame_size
+                        elif i >= len(names) - 2:
+                            size = (45, 45)
+                        else:
+                            size = (78, 93)
+                        specs.append((f"{level}/{state}/{direction}/{i}", name, size, tint))
+        return specs
+
+    @classmethod
+    def frames(cls) -> dict:
+        """Retorna el banco de frames compartido, construyéndolo la primera vez.
+
+        El banco contiene, para cada nivel, estado y dirección, la tupla de frames
+        ya recortados, escalados y teñidos: ``bank[nivel][estado][dirección][i]``.
+        """
+        if cls._frame_bank is None:
+            try:
+                frames = FrameCache.load("enemy", cls.frame_specs())
+            except pygame.error as e:
+                print(f"Error al cargar los sprites: {e}")
+                raise
+            bank = {}
+            for key, surface in frames.items():
+                level, state, direction, _ = key.split("/")
+                bank.setdefault(int(level), {}).setdefault(state, {}).setdefault(direction, []).append(surface)
+            for level_frames in bank.values():
+                for directions in level_frames.values():
+                    for direction, surfaces in directions.items():
+                        directions[direction] = tuple(surfaces)
+            cls._frame_bank = bank
+        return cls._frame_bank
+
+    @classmethod
+    def image(cls, enemy):
+        """Imagen del ``frame_key`` actual del enemigo, o None si ya no se dibuja."""
+        if enemy.frame_key is None:
+            return None
+        state, direction, index = enemy.frame_key
+        return cls.frames()[enemy.level][state][direction][index]
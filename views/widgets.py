@@ -0,0 +1,179 @@
+"""Capa de widgets retenidos para menús y pantallas.
+
+Cada vista construye una vez su árbol de widgets. Cada widget guarda su
+superficie ya renderizada y sólo la regenera cuando cambia su estado (texto,
+hover o scroll), así que dibujar un frame se reduce a bliteos. Los
+controladores consultan ``hit_test`` para saber qué widget interactivo hay
+bajo el ratón, sin depender de los rectángulos de la vista.
+"""
+import pygame
+from services.text_cache import TextCache
+
+
+class Widget:
+    """Elemento con un rectángulo en pantalla y una superficie cacheada."""
+    def __init__(self, rect):
+        self.rect = pygame.Rect(rect)
+        self.visible = True
+        self._surface = None
+
+    def invalidate(self):
+        """Marca la superficie para regenerarla en el próximo dibujado."""
+        self._surface = None
+
+    def render(self) -> pygame.Surface:
+        """Genera la superficie del widget. La implementan las subclases."""
+        raise NotImplementedError
+
+    def draw(self, target: pygame.Surface):
+        if self._surface is None:
+            self._surface = self.render()
+        target.blit(self._surface, self.rect)
+
+    def hit_test(self, pos):
+        """Retorna el widget interactivo bajo ``pos`` o None."""
+        return None
+
+    def update_hover(self, pos):
+        pass
+
+
+class Box(Widget):
+    """Rectángulo de color sólido, opcionalmente semitransparente."""
+    def __init__(self, rect, color, alpha: int = None):
+        super().__init__(rect)
+        self.color = color
+        self.alpha = alpha
+
+    def render(self) -> pygame.Surface:
+        surface = pygame.Surface(self.rect.size)
+        surface.fill(self.color)
+        if self.alpha is not None:
+            surface.set_alpha(self.alpha)
+        return surface
+
+
+class Label(Widget):
+    """Texto centrado en ``center``; sólo se re-renderiza si cambia el texto."""
+    def __init__(self, text: str, font: pygame.font.Font, color, center: tuple):
+        self.text = text
+        self.font = font
+        self.color = color
+        self.center = center
+        super().__init__(self.render().get_rect(center=center))
+
+    def set_text(self, text: str):
+        if text != self.text:
+            self.text = text
+            self.invalidate()
+            self.rect = self.render().get_rect(center=self.center)
+
+    def render(self) -> pygame.Surface:
+        return TextCache.render(self.font, self.text, self.color)
+
+
+class Button(Widget):
+    """Botón redondeado con texto. Cachea una superficie por estado (normal y hover).
+
+    ``colors`` debe tener las claves ``button_bg``, ``button_hover_bg`` y ``text``.
+    """
+    def __init__(self, rect, text: str, font: pygame.font.Font, colors: dict, action=None):
+        super().__init__(rect)
+        self.text = text
+        self.font = font
+        self.colors = colors
+        self.action = text if action is None else action
+        self.hovered = False
+        self._states = {}  # hovered -> Surface
+
+    def invalidate(self):
+        self._states.clear()
+
+    def render(self) -> pygame.Surface:
+        surface = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        bg_color = self.colors["button_hover_bg"] if self.hovered else self.colors["button_bg"]
+        pygame.draw.rect(surface, bg_color, surface.get_rect(), border_radius=10)
+        text_surface = TextCache.render(self.font, self.text, self.colors["text"])
+        surface.blit(text_surface, text_surface.get_rect(center=surface.get_rect().center))
+        return surface
+
+    def draw(self, target: pygame.Surface):
+        surface = self._states.get(self.hovered)
+        if surface is None:
+            surface = self._states[self.hovered] = self.render()
+        target.blit(surface, self.rect)
+
+    def hit_test(self, pos):
+        return self if self.rect.collidepoint(pos) else None
+
+    def update_hover(self, pos):
+        self.hovered = self.rect.collidepoint(pos)
+
+
+class ScrollPane(Widget):
+    """Lista de líneas centradas que se desplaza verticalmente dentro de ``rect``.
+
+    El contenido completo se renderiza una sola vez; desplazarse sólo cambia
+    la porción que se blitea.
+    """
+    def __init__(self, rect, lines: list, font: pygame.font.Font, color, background, line_spacing: int):
+        super().__init__(rect)
+        self.lines = lines
+        self.font = font
+        self.color = color
+        self.background = background
+        self.line_spacing = line_spacing
+        self.scroll_position = 0
+
+    @property
+    def max_scroll(self) -> int:
+        return max(0, len(self.lines) * self.line_spacing - self.rect.height)
+
+    def scroll(self, delta: int):
+        """Desplaza el contenido ``delta`` píxeles, sin salirse de sus límites."""
+        self.scroll_position = max(0, min(self.max_scroll, self.scroll_position + delta))
+
+    def render(self) -> pygame.Surface:
+        content_height = len(self.lines) * self.line_spacing
+        surface = pygame.Surface((self.rect.width, max(content_height, self.rect.height)))
+        surface.fill(self.background)
+        for i, line in enumerate(self.lines):
+            text_surface = TextCache.render(self.font, line, self.color)
+            surface.blit(text_surface, text_surface.get_rect(centerx=surface.get_width() // 2, top=i * self.line_spacing))
+        return surface
+
+    def draw(self, target: pygame.Surface):
+        if self._surface is None:
+            self._surface = self.render()
+        area = pygame.Rect(0, self.scroll_position, self.rect.width, self.rect.height)
+        target.blit(self._surface, self.rect, area)
+
+
+class Container(Widget):
+    """Nodo del árbol: dibuja a sus hijos en orden y consulta el hit-test del último al primero."""
+    def __init__(self, children: list = None):
+        super().__init__((0, 0, 0, 0))
+        self.children = []
+        for child in children or []:
+            self.add(child)
+
+    def add(self, widget: Widget) -> Widget:
+        self.children.append(widget)
+        return widget
+
+    def draw(self, target: pygame.Surface):
+        for child in self.children:
+            if child.visible:
+                child.draw(target)
+
+    def hit_test(self, pos):
+        for child in reversed(self.children):
+            if child.visible:
+                hit = child.hit_test(pos)
+                if hit is not None:
+                    return hit
+        return None
+
+    def update_hover(self, pos):
+        for child in self.children:
+            child.update_hover(pos)